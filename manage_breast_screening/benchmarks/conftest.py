@@ -0,0 +1,44 @@
+import os
+from dataclasses import asdict
+
+import pytest
+from django.db import connection
+
+from manage_breast_screening.clinics.seeding import Volumes, VolumeSeeder
+
+SEED_RESULT = pytest.StashKey()
+
+# A year of clinics for a few providers: about 190,000 slots and 160,000
+# appointments
+VOLUMES = Volumes(clinics=8000)
+
+
+@pytest.fixture(scope="session")
+def django_db_setup(django_db_setup, django_db_blocker, request):
+    """
+    Seed the test database once, before the first benchmark.
+
+    BENCHMARK_SCALE scales the volumes up or down, e.g. 0.01 for a quick run.
+    """
+    volumes = VOLUMES.scaled(float(os.environ.get("BENCHMARK_SCALE", "1")))
+
+    with django_db_blocker.unblock():
+        request.config.stash[SEED_RESULT] = VolumeSeeder(volumes).run()
+
+        # Autovacuum wouldn't get to the new rows before the benchmarks
+        # start, so gather the planner statistics a real database would
+        # have. Otherwise queries are planned as if the tables were empty.
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+
+
+def pytest_benchmark_update_json(config, benchmarks, output_json):
+    # Record what the benchmarks ran against, so that reports from runs with
+    # different volumes aren't compared by mistake
+    result = config.stash.get(SEED_RESULT, None)
+    if result is not None:
+        output_json["seed"] = {
+            "volumes": asdict(result.volumes),
+            "counts": result.counts,
+            "seconds": round(result.seconds, 1),
+        }
@@ -0,0 +1,112 @@
+"""
+Benchmarks for the main pages, against a seeded database.
+
+These are skipped by default. Run them with `make benchmark`.
+"""
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from manage_breast_screening.clinics.models import ClinicFilter
+from manage_breast_screening.participants.models import Appointment
+
+pytestmark = pytest.mark.django_db
+
+
+def run(benchmark, request_page):
+    """
+    Benchmark a request, and record how many queries it runs in the report
+    """
+    with CaptureQueriesContext(connection) as queries:
+        response = request_page()
+    benchmark.extra_info["queries"] = len(queries)
+
+    benchmark(request_page)
+
+    return response
+
+
+@pytest.fixture
+def appointment():
+    """
+    The next confirmed appointment for a participant who has been screened
+    before
+    """
+    return (
+        Appointment.objects.filter(status=Appointment.Status.CONFIRMED)
+        .with_previous_screening_date()
+        .filter(previous_screening_at__isnull=False)
+        .order_by("clinic_slot__starts_at")
+        .first()
+    )
+
+
+@pytest.mark.benchmark(group="clinic_list")
+@pytest.mark.parametrize("filter", list(ClinicFilter))
+def test_clinic_list(benchmark, client, filter):
+    url = reverse("clinics:index_with_filter", kwargs={"filter": filter})
+
+    response = run(benchmark, lambda: client.get(url))
+
+    assert response.status_code == 200
+
+
+@pytest.mark.benchmark(group="appointment")
+def test_start_screening(benchmark, client, appointment):
+    url = reverse("mammograms:start_screening", kwargs={"id": appointment.pk})
+
+    response = run(benchmark, lambda: client.get(url))
+
+    assert response.status_code == 200
+
+
+@pytest.mark.benchmark(group="appointment")
+def test_appointment_cannot_go_ahead(benchmark, client, appointment):
+    url = reverse(
+        "mammograms:appointment_cannot_go_ahead", kwargs={"id": appointment.pk}
+    )
+    data = {"stopped_reasons": ["failed_identity_check"], "decision": "True"}
+
+    response = run(benchmark, lambda: client.post(url, data))
+
+    assert response.status_code == 302
+
+
+@pytest.mark.benchmark(group="appointment")
+def test_check_in(benchmark, client, appointment):
+    url = reverse("mammograms:check_in", kwargs={"id": appointment.pk})
+
+    response = run(benchmark, lambda: client.post(url))
+
+    assert response.status_code == 302
+
+
+@pytest.mark.benchmark(group="participants")
+def test_lookup(benchmark, client, appointment):
+    participant = appointment.screening_episode.participant
+    url = reverse("participants:lookup")
+
+    response = run(
+        benchmark, lambda: client.get(url, {"nhs_number": participant.nhs_number})
+    )
+
+    assert response.status_code == 200
+
+
+@pytest.mark.benchmark(group="participants")
+@pytest.mark.parametrize("by", ["name", "postcode", "date_of_birth"])
+def test_search(benchmark, client, appointment, by):
+    participant = appointment.screening_episode.participant
+    params = {
+        "name": {"q": participant.full_name},
+        "postcode": {"q": participant.address.postcode},
+        "date_of_birth": {"date_of_birth": participant.date_of_birth.isoformat()},
+    }[by]
+    url = reverse("participants:search")
+
+    response = run(benchmark, lambda: client.get(url, params))
+
+    assert response.status_code == 200
+    assert response.json()["results"]
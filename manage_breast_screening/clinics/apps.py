@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class ClinicsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "manage_breast_screening.clinics"
+
+    def ready(self):
+        from . import signals
+
+        signals.connect()
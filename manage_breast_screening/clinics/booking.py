@@ -0,0 +1,203 @@
+"""
+Book participants into clinics in bulk.
+
+Booking a clinic fills its free slots in start time order, creating a
+screening episode and an appointment for each participant in a single
+transaction. The slots being filled are locked with
+SELECT ... FOR UPDATE SKIP LOCKED, so several bookers can fill the same
+clinic, or different clinics, at the same time: each one claims slots the
+others haven't, rather than waiting for them or booking the same slot twice.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Iterable
+
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.db.models import Exists, OuterRef
+
+from ..participants.models import Appointment, Participant, ScreeningEpisode
+from .caching import bump_generation
+from .models import Clinic, ClinicSlot
+
+DEFAULT_SLOT_MINUTES = 10
+
+
+def slot_times(
+    starts_at: datetime, ends_at: datetime, duration_in_minutes: int
+) -> list[datetime]:
+    """
+    The start times of every slot of `duration_in_minutes` that fits between
+    `starts_at` and `ends_at`
+
+    >>> [t.strftime("%H:%M") for t in slot_times(
+    ...     datetime(2025, 1, 1, 9), datetime(2025, 1, 1, 9, 50), 15
+    ... )]
+    ['09:00', '09:15', '09:30']
+    """
+    if duration_in_minutes <= 0:
+        raise ValueError(duration_in_minutes)
+
+    duration = timedelta(minutes=duration_in_minutes)
+    times = []
+    starts = starts_at
+    while starts + duration <= ends_at:
+        times.append(starts)
+        starts += duration
+    return times
+
+
+def generate_slots(
+    clinic: Clinic,
+    duration_in_minutes: int = DEFAULT_SLOT_MINUTES,
+    using=DEFAULT_DB_ALIAS,
+) -> list[ClinicSlot]:
+    """
+    Create slots from the clinic's start and end times, leaving out any that
+    would overlap a slot it has already, and return the ones created.
+    """
+    times = slot_times(clinic.starts_at, clinic.ends_at, duration_in_minutes)
+    duration = timedelta(minutes=duration_in_minutes)
+
+    def missing_times():
+        existing = [
+            (starts_at, starts_at + timedelta(minutes=minutes))
+            for starts_at, minutes in ClinicSlot.objects.using(using)
+            .filter(clinic=clinic)
+            .values_list("starts_at", "duration_in_minutes")
+        ]
+        return [
+            starts_at
+            for starts_at in times
+            if not any(
+                starts_at < other_ends_at and other_starts_at < starts_at + duration
+                for other_starts_at, other_ends_at in existing
+            )
+        ]
+
+    if not missing_times():
+        return []
+
+    with transaction.atomic(using=using):
+        # Only one booker generates a clinic's slots. The others wait here,
+        # then find there's nothing left to create.
+        Clinic.objects.using(using).select_for_update().filter(pk=clinic.pk).first()
+
+        slots = ClinicSlot.objects.using(using).bulk_create(
+            ClinicSlot(
+                clinic=clinic,
+                starts_at=starts_at,
+                duration_in_minutes=duration_in_minutes,
+            )
+            for starts_at in missing_times()
+        )
+
+        if slots:
+            transaction.on_commit(bump_generation, using=using)
+
+    return slots
+
+
+def active_appointments():
+    return Appointment.objects.exclude(status=Appointment.Status.CANCELLED)
+
+
+def claim_free_slots(clinic: Clinic, count: int, using=DEFAULT_DB_ALIAS):
+    """
+    Lock up to `count` of the clinic's free slots, earliest first, skipping
+    any that another booker has locked. Must be called in a transaction;
+    the slots stay claimed until it ends.
+    """
+    free_slots = (
+        ClinicSlot.objects.using(using)
+        .filter(clinic=clinic)
+        .exclude(Exists(active_appointments().filter(clinic_slot=OuterRef("pk"))))
+        .order_by("starts_at", "id")
+        .select_for_update(skip_locked=True)
+    )
+
+    claimed = []
+    seen = set()
+    while len(claimed) < count:
+        slots = list(free_slots.exclude(pk__in=seen)[: count - len(claimed)])
+        if not slots:
+            break
+        seen.update(slot.pk for slot in slots)
+
+        # Another booker can fill a slot and commit between our query taking
+        # its snapshot and locking the slot. Now we hold the locks, anything
+        # booked into them is visible to a new query, so check again.
+        taken = set(
+            active_appointments()
+            .using(using)
+            .filter(clinic_slot__in=slots)
+            .values_list("clinic_slot_id", flat=True)
+        )
+        claimed += [slot for slot in slots if slot.pk not in taken]
+
+    return claimed
+
+
+@dataclass
+class BookingResult:
+    appointments: list[Appointment] = field(default_factory=list)
+    already_booked: list[Participant] = field(default_factory=list)
+    unbooked: list[Participant] = field(default_factory=list)
+    slots_created: int = 0
+
+
+def book_participants(
+    clinic: Clinic,
+    participants: Iterable[Participant],
+    duration_in_minutes: int = DEFAULT_SLOT_MINUTES,
+    using=DEFAULT_DB_ALIAS,
+) -> BookingResult:
+    """
+    Book participants into the clinic's free slots, in the order given,
+    generating the clinic's slots first if needed.
+
+    Participants with an appointment in the clinic already are skipped, and
+    any that don't fit are returned unbooked.
+    """
+    participants = list(
+        {participant.pk: participant for participant in participants}.values()
+    )
+    result = BookingResult()
+
+    with transaction.atomic(using=using):
+        result.slots_created = len(generate_slots(clinic, duration_in_minutes, using))
+
+        booked_ids = set(
+            active_appointments()
+            .using(using)
+            .filter(
+                clinic_slot__clinic=clinic,
+                screening_episode__participant__in=participants,
+            )
+            .values_list("screening_episode__participant_id", flat=True)
+        )
+        to_book = []
+        for participant in participants:
+            if participant.pk in booked_ids:
+                result.already_booked.append(participant)
+            else:
+                to_book.append(participant)
+
+        slots = claim_free_slots(clinic, len(to_book), using)
+        to_book, result.unbooked = to_book[: len(slots)], to_book[len(slots) :]
+        if not to_book:
+            return result
+
+        episodes = ScreeningEpisode.objects.using(using).bulk_create(
+            ScreeningEpisode(participant=participant) for participant in to_book
+        )
+        result.appointments = Appointment.objects.using(using).bulk_create(
+            Appointment(screening_episode=episode, clinic_slot=slot)
+            for episode, slot in zip(episodes, slots)
+        )
+
+        # bulk_create doesn't send post_save, so invalidate the cached clinic
+        # lists ourselves.
+        transaction.on_commit(bump_generation, using=using)
+
+    return result
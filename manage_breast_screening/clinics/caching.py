@@ -0,0 +1,65 @@
+"""
+Caching for rendered clinic lists.
+
+Cache keys include a generation number, which is bumped whenever a setting,
+clinic, slot or appointment changes. Bumping the generation invalidates every
+cached list without having to find the individual keys.
+"""
+
+import time
+
+from django.core.cache import cache
+
+CLINIC_LIST_TIMEOUT = 5 * 60
+
+GENERATION_KEY = "clinics:generation"
+
+
+def _initial_generation():
+    # If the generation is evicted from the cache, start again from a number
+    # higher than before, so that old cache keys aren't reused.
+    return time.time_ns()
+
+
+def get_generation() -> int:
+    generation = cache.get(GENERATION_KEY)
+    if generation is None:
+        generation = _initial_generation()
+        if not cache.add(GENERATION_KEY, generation, timeout=None):
+            generation = cache.get(GENERATION_KEY, generation)
+
+    return generation
+
+
+def bump_generation():
+    """
+    Invalidate the cached clinic lists
+    """
+    try:
+        cache.incr(GENERATION_KEY)
+    except ValueError:
+        cache.add(GENERATION_KEY, _initial_generation(), timeout=None)
+
+
+async def aget_generation() -> int:
+    generation = await cache.aget(GENERATION_KEY)
+    if generation is None:
+        generation = _initial_generation()
+        if not await cache.aadd(GENERATION_KEY, generation, timeout=None):
+            generation = await cache.aget(GENERATION_KEY, generation)
+
+    return generation
+
+
+def clinic_list_key(filter, day, cursor=None, direction=None):
+    return _clinic_list_key(get_generation(), filter, day, cursor, direction)
+
+
+async def aclinic_list_key(filter, day, cursor=None, direction=None):
+    return _clinic_list_key(await aget_generation(), filter, day, cursor, direction)
+
+
+def _clinic_list_key(generation, filter, day, cursor, direction):
+    page = f"{direction}:{cursor.encode()}" if cursor else "first"
+
+    return ":".join(["clinics:list", str(generation), day.isoformat(), filter, page])
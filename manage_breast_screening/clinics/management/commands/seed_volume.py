@@ -0,0 +1,86 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from manage_breast_screening.clinics.seeding import Volumes, VolumeSeeder
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate providers, settings, clinics, slots, participants, screening "
+        "episodes and appointments for load testing. The same --seed and "
+        "--today always generate the same rows, so use a different seed to add "
+        "more."
+    )
+
+    def add_arguments(self, parser):
+        defaults = Volumes()
+        parser.add_argument("--clinics", type=int, default=defaults.clinics)
+        parser.add_argument("--providers", type=int, default=defaults.providers)
+        parser.add_argument(
+            "--settings-per-provider", type=int, default=defaults.settings_per_provider
+        )
+        parser.add_argument(
+            "--slots-per-clinic", type=int, default=defaults.slots_per_clinic
+        )
+        parser.add_argument(
+            "--booked-fraction",
+            type=float,
+            default=defaults.booked_fraction,
+            help="Fraction of slots with an appointment",
+        )
+        parser.add_argument(
+            "--days-before-today", type=int, default=defaults.days_before_today
+        )
+        parser.add_argument(
+            "--days-after-today", type=int, default=defaults.days_after_today
+        )
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument(
+            "--today",
+            type=date.fromisoformat,
+            help="Date to spread the clinics around, as YYYY-MM-DD (default: today)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=10_000,
+            help="Number of slots to write at a time",
+        )
+
+    def handle(self, *args, seed, batch_size, today, **options):
+        volumes = Volumes(
+            providers=options["providers"],
+            settings_per_provider=options["settings_per_provider"],
+            clinics=options["clinics"],
+            slots_per_clinic=options["slots_per_clinic"],
+            booked_fraction=options["booked_fraction"],
+            days_before_today=options["days_before_today"],
+            days_after_today=options["days_after_today"],
+        )
+        try:
+            seeder = VolumeSeeder(
+                volumes, seed=seed, batch_size=batch_size, today=today
+            )
+        except ValueError as e:
+            raise CommandError(e) from e
+
+        def progress(result):
+            clinics = result.counts.get("clinics.Clinic", 0)
+            self.stdout.write(
+                f"{clinics}/{volumes.clinics} clinics, {result.rows} rows"
+            )
+
+        try:
+            result = seeder.run(progress=progress if options["verbosity"] > 1 else None)
+        except ValueError as e:
+            raise CommandError(e) from e
+
+        for label, count in result.counts.items():
+            self.stdout.write(f"{count:>12,}  {label}")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Wrote {result.rows:,} rows in {result.seconds:.1f}s "
+                f"({result.rows / result.seconds:,.0f} rows/s)"
+            )
+        )
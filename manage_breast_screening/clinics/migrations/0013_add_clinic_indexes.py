@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-18 15:58
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Build the indexes without locking the tables against writes
+    atomic = False
+
+    dependencies = [
+        ('clinics', '0012_remove_screeningepisode_participant_and_more'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='clinic',
+            index=models.Index(fields=['starts_at', 'id'], name='clinic_starts_at_id_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='clinicslot',
+            index=models.Index(fields=['clinic', 'starts_at'], name='clinicslot_clinic_starts_idx'),
+        ),
+    ]
@@ -1,9 +1,18 @@
-from datetime import date
+from datetime import date, datetime, time, timedelta
 from enum import StrEnum
 
 from django.db import models
+from django.db.models import Count, Prefetch, Q
+from django.utils.timezone import get_current_timezone, localtime
 
 from ..core.models import BaseModel
+from ..core.utils import clock
+from ..participants.models import Appointment
+from .pagination import DEFAULT_PAGE_SIZE, ClinicPage, Cursor, Direction
+
+
+def start_of_day(day: date) -> datetime:
+    return datetime.combine(day, time(), tzinfo=get_current_timezone())
 
 
 class Provider(BaseModel):
@@ -29,37 +38,299 @@ class ClinicFilter(StrEnum):
 
 
 class ClinicQuerySet(models.QuerySet):
-    def by_filter(self, filter: str):
-        match filter:
-            case ClinicFilter.TODAY:
-                return self.today()
-            case ClinicFilter.UPCOMING:
-                return self.upcoming()
-            case ClinicFilter.COMPLETED:
-                return self.completed()
-            case ClinicFilter.ALL:
-                return self
-            case _:
-                raise ValueError(filter)
+    # Appointment statuses counted by each of the with_slot_stats annotations
+    APPOINTMENT_STATS = {
+        "booked_count": [
+            status
+            for status in Appointment.STATUS_CHOICES
+            if status != Appointment.Status.CANCELLED
+        ],
+        "checked_in_count": [Appointment.Status.CHECKED_IN],
+        "screened_count": [
+            Appointment.Status.SCREENED,
+            Appointment.Status.PARTIALLY_SCREENED,
+        ],
+    }
+
+    @staticmethod
+    def filter_conditions(today: date | None = None) -> dict[ClinicFilter, Q]:
+        """
+        The condition defining each ClinicFilter bucket, relative to `today`.
+
+        Pass in `today` to compute the bucket boundaries once and share them
+        between queries made while handling the same request.
+        """
+        if today is None:
+            today = clock.today()
+
+        # Compare against the start and end of the day rather than casting
+        # starts_at to a date, so the conditions can use the starts_at index.
+        start_of_today = start_of_day(today)
+        start_of_tomorrow = start_of_day(today + timedelta(days=1))
+
+        return {
+            ClinicFilter.TODAY: Q(
+                starts_at__gte=start_of_today, starts_at__lt=start_of_tomorrow
+            ),
+            ClinicFilter.UPCOMING: Q(starts_at__gte=start_of_tomorrow),
+            ClinicFilter.COMPLETED: Q(starts_at__lt=start_of_today),
+            ClinicFilter.ALL: Q(),
+        }
+
+    def by_filter(self, filter: str, today: date | None = None):
+        conditions = self.filter_conditions(today)
+        if filter not in conditions:
+            raise ValueError(filter)
+
+        return self.filter(conditions[filter])
 
     def today(self):
         """
         Clinics that start today
         """
-        return self.filter(starts_at__date=date.today())
+        return self.by_filter(ClinicFilter.TODAY)
 
     def upcoming(self):
         """
         Clinics that start tomorrow or later
         """
-        return self.filter(starts_at__date__gt=date.today())
+        return self.by_filter(ClinicFilter.UPCOMING)
 
     def completed(self):
         """
         Clinics that started in the past
         (note: we may want to also consider the clinic state when splitting things out by date)
         """
-        return self.filter(starts_at__date__lt=date.today())
+        return self.by_filter(ClinicFilter.COMPLETED)
+
+    def with_slot_stats(self):
+        """
+        Annotate each clinic with the number of slots it has, and the number of
+        booked, checked in and screened appointments in those slots.
+
+        This joins and groups by every slot and appointment of the clinics
+        being fetched, so when paging, fetch the page first then use
+        `add_slot_stats` to count for just the clinics on it.
+        """
+        return self.annotate(
+            slot_count=Count("clinic_slots", distinct=True),
+            **{
+                name: Count(
+                    "clinic_slots__appointment",
+                    filter=Q(clinic_slots__appointment__status__in=statuses),
+                )
+                for name, statuses in self.APPOINTMENT_STATS.items()
+            },
+        )
+
+    def add_slot_stats(self, clinics: list["Clinic"]) -> None:
+        """
+        Set the `with_slot_stats` counts on clinics that have already been
+        fetched, using one query over just those clinics.
+        """
+        self._set_slot_stats(clinics, self._slot_stats_queryset(clinics))
+
+    async def aadd_slot_stats(self, clinics: list["Clinic"]) -> None:
+        """
+        Async version of `add_slot_stats`
+        """
+        stats = [row async for row in self._slot_stats_queryset(clinics)]
+        self._set_slot_stats(clinics, stats)
+
+    def _slot_stats_queryset(self, clinics):
+        return (
+            self.filter(pk__in=[clinic.pk for clinic in clinics])
+            .order_by()
+            .with_slot_stats()
+            .values("pk", "slot_count", *self.APPOINTMENT_STATS)
+        )
+
+    @staticmethod
+    def _set_slot_stats(clinics, stats):
+        stats_by_id = {row.pop("pk"): row for row in stats}
+        for clinic in clinics:
+            for name, count in stats_by_id.get(clinic.pk, {}).items():
+                setattr(clinic, name, count)
+
+    def filter_page(
+        self,
+        filter: str,
+        today: date | None = None,
+        cursor: Cursor | None = None,
+        direction: Direction = Direction.AFTER,
+        page_size: int | None = None,
+    ) -> ClinicPage:
+        """
+        Fetch a page of the clinics in a ClinicFilter bucket
+        """
+        if today is None:
+            today = clock.today()
+
+        return self.by_filter(filter, today).page(
+            cursor, direction, page_size, **self._filter_page_options(filter, today)
+        )
+
+    async def afilter_page(
+        self,
+        filter: str,
+        today: date | None = None,
+        cursor: Cursor | None = None,
+        direction: Direction = Direction.AFTER,
+        page_size: int | None = None,
+    ) -> ClinicPage:
+        """
+        Async version of `filter_page`
+        """
+        if today is None:
+            today = clock.today()
+
+        return await self.by_filter(filter, today).apage(
+            cursor, direction, page_size, **self._filter_page_options(filter, today)
+        )
+
+    @staticmethod
+    def _filter_page_options(filter, today):
+        # Completed clinics are listed most recent first, and the list of all
+        # clinics starts at today's, with earlier ones on the previous pages.
+        if filter == ClinicFilter.COMPLETED:
+            return {"descending": True}
+        if filter == ClinicFilter.ALL:
+            return {"start": start_of_day(today)}
+        return {}
+
+    def page(
+        self,
+        cursor: Cursor | None = None,
+        direction: Direction = Direction.AFTER,
+        page_size: int | None = None,
+        descending: bool = False,
+        start: datetime | None = None,
+    ) -> ClinicPage:
+        """
+        Fetch a page of clinics ordered by start time, starting after (or
+        ending before) the clinic at `cursor`. Clinics are listed earliest
+        first, or latest first if `descending`.
+
+        Without a cursor, the first page is the start of the list, or the
+        clinics from `start` onwards if given.
+        """
+        if page_size is None:
+            page_size = DEFAULT_PAGE_SIZE
+
+        cursor, anchored = self._anchor(cursor, descending, start)
+        queryset = self._page_queryset(cursor, direction, page_size, descending)
+        clinics = list(queryset)
+        if anchored and not self._has_clinics_before(start).exists():
+            cursor = None
+
+        return self._build_page(clinics, cursor, direction, page_size, descending)
+
+    async def apage(
+        self,
+        cursor: Cursor | None = None,
+        direction: Direction = Direction.AFTER,
+        page_size: int | None = None,
+        descending: bool = False,
+        start: datetime | None = None,
+    ) -> ClinicPage:
+        """
+        Async version of `page`
+        """
+        if page_size is None:
+            page_size = DEFAULT_PAGE_SIZE
+
+        cursor, anchored = self._anchor(cursor, descending, start)
+        queryset = self._page_queryset(cursor, direction, page_size, descending)
+        clinics = [clinic async for clinic in queryset]
+        if anchored and not await self._has_clinics_before(start).aexists():
+            cursor = None
+
+        return self._build_page(clinics, cursor, direction, page_size, descending)
+
+    @staticmethod
+    def _anchor(cursor, descending, start):
+        # Start the first page from a cursor just before the first clinic at
+        # `start`, so that it links back to any earlier clinics.
+        if cursor is None and start is not None and not descending:
+            return Cursor.before(start), True
+        return cursor, False
+
+    def _has_clinics_before(self, start):
+        return self.filter(starts_at__lt=start)
+
+    def _page_queryset(self, cursor, direction, page_size, descending=False):
+        # Walk the list forwards when fetching the page after the cursor, and
+        # backwards when fetching the page before it
+        if (direction == Direction.BEFORE) == descending:
+            queryset = self.order_by("starts_at", "id")
+            if cursor:
+                queryset = queryset.filter(
+                    Q(starts_at__gt=cursor.starts_at)
+                    | Q(starts_at=cursor.starts_at, id__gt=cursor.id)
+                )
+        else:
+            queryset = self.order_by("-starts_at", "-id")
+            if cursor:
+                queryset = queryset.filter(
+                    Q(starts_at__lt=cursor.starts_at)
+                    | Q(starts_at=cursor.starts_at, id__lt=cursor.id)
+                )
+
+        # Fetch one extra row to find out if there is another page
+        return queryset[: page_size + 1]
+
+    @staticmethod
+    def _build_page(
+        clinics, cursor, direction, page_size, descending=False
+    ) -> ClinicPage:
+        has_more = len(clinics) > page_size
+        clinics = clinics[:page_size]
+
+        if direction == Direction.BEFORE:
+            clinics.reverse()
+            has_previous, has_next = has_more, cursor is not None
+        else:
+            has_previous, has_next = cursor is not None, has_more
+
+        if not clinics:
+            # Link back to the clinics before the cursor, e.g. when there are
+            # none from the start of an anchored list onwards
+            if has_previous and direction == Direction.AFTER:
+                return ClinicPage(
+                    clinics=[], previous_cursor=cursor, descending=descending
+                )
+            return ClinicPage(clinics=[], descending=descending)
+
+        return ClinicPage(
+            clinics=clinics,
+            previous_cursor=Cursor.for_clinic(clinics[0]) if has_previous else None,
+            next_cursor=Cursor.for_clinic(clinics[-1]) if has_next else None,
+            descending=descending,
+        )
+
+    def filter_counts(self, today: date | None = None) -> dict[ClinicFilter, int]:
+        """
+        Count the clinics in every ClinicFilter bucket using a single query.
+        """
+        counts = self.aggregate(**self._filter_count_aggregates(today))
+
+        return {ClinicFilter(filter): count for filter, count in counts.items()}
+
+    async def afilter_counts(
+        self, today: date | None = None
+    ) -> dict[ClinicFilter, int]:
+        """
+        Async version of `filter_counts`
+        """
+        counts = await self.aaggregate(**self._filter_count_aggregates(today))
+
+        return {ClinicFilter(filter): count for filter, count in counts.items()}
+
+    def _filter_count_aggregates(self, today):
+        return {
+            str(filter): Count("pk", filter=condition) if condition else Count("pk")
+            for filter, condition in self.filter_conditions(today).items()
+        }
 
 
 class Clinic(BaseModel):
@@ -107,8 +378,14 @@ class Clinic(BaseModel):
 
     objects = ClinicQuerySet.as_manager()
 
+    class Meta:
+        indexes = [
+            # Range filters on start time and keyset pagination
+            models.Index(fields=["starts_at", "id"], name="clinic_starts_at_id_idx"),
+        ]
+
     def session_type(self):
-        start_hour = self.starts_at.hour
+        start_hour = localtime(self.starts_at).hour
         duration = (self.ends_at - self.starts_at).seconds
         if duration > 6 * 60 * 60:
             return self.TimeOfDay.ALL_DAY
@@ -122,13 +399,26 @@ class Clinic(BaseModel):
         return {"start_time": self.starts_at, "end_time": self.ends_at}
 
     @classmethod
-    def filter_counts(cls):
-        return {
-            ClinicFilter.ALL: cls.objects.count(),
-            ClinicFilter.TODAY: cls.objects.today().count(),
-            ClinicFilter.UPCOMING: cls.objects.upcoming().count(),
-            ClinicFilter.COMPLETED: cls.objects.completed().count(),
-        }
+    def filter_counts(cls, today: date | None = None):
+        return cls.objects.filter_counts(today)
+
+    @classmethod
+    async def afilter_counts(cls, today: date | None = None):
+        return await cls.objects.afilter_counts(today)
+
+
+class ClinicSlotQuerySet(models.QuerySet):
+    def with_appointments(self):
+        """
+        Prefetch each slot's appointments, most recent first, along with the
+        participant and the date of their previous screening.
+        """
+        appointments = (
+            Appointment.objects.select_related("screening_episode__participant")
+            .with_previous_screening_date()
+            .order_by("-created_at")
+        )
+        return self.prefetch_related(Prefetch("appointment_set", queryset=appointments))
 
 
 class ClinicSlot(BaseModel):
@@ -137,3 +427,12 @@ class ClinicSlot(BaseModel):
     )
     starts_at = models.DateTimeField()
     duration_in_minutes = models.IntegerField()
+
+    objects = ClinicSlotQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["clinic", "starts_at"], name="clinicslot_clinic_starts_idx"
+            ),
+        ]
@@ -0,0 +1,96 @@
+"""
+Keyset pagination for clinics.
+
+Clinics are ordered by (starts_at, id), either way round, and each page is
+fetched relative to the first or last clinic of the page before it, so the
+cost of a page stays the same no matter how far through the list it is.
+"""
+
+import base64
+from dataclasses import dataclass
+from datetime import datetime
+from enum import StrEnum
+from uuid import UUID
+
+# Lower than any clinic id
+MIN_ID = UUID(int=0)
+
+DEFAULT_PAGE_SIZE = 50
+
+
+class Direction(StrEnum):
+    AFTER = "after"
+    BEFORE = "before"
+
+
+@dataclass(frozen=True)
+class Cursor:
+    """
+    The position of a clinic in the (starts_at, id) ordering
+    """
+
+    starts_at: datetime
+    id: UUID
+
+    @classmethod
+    def for_clinic(cls, clinic) -> "Cursor":
+        return cls(starts_at=clinic.starts_at, id=clinic.id)
+
+    @classmethod
+    def before(cls, starts_at: datetime) -> "Cursor":
+        """
+        A cursor just before the first clinic starting at `starts_at`
+        """
+        return cls(starts_at=starts_at, id=MIN_ID)
+
+    def encode(self) -> str:
+        """
+        Encode the cursor as an opaque, URL safe string
+
+        >>> from datetime import timezone
+        >>> cursor = Cursor(
+        ...     datetime(2025, 1, 1, 9, tzinfo=timezone.utc),
+        ...     UUID("ce662c8b-92dc-4c82-9d5d-1ddcb201e2b6"),
+        ... )
+        >>> Cursor.decode(cursor.encode()) == cursor
+        True
+        """
+        raw = f"{self.starts_at.isoformat()}|{self.id}"
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, value: str) -> "Cursor":
+        """
+        Decode a string produced by `encode`. Raises ValueError if the string
+        isn't a valid cursor.
+        """
+        padded = value + "=" * (-len(value) % 4)
+        try:
+            starts_at, id = base64.urlsafe_b64decode(padded).decode().split("|")
+            return cls(starts_at=datetime.fromisoformat(starts_at), id=UUID(id))
+        except ValueError as e:
+            raise ValueError(f"Invalid cursor: {value}") from e
+
+
+class CursorConverter:
+    """
+    URL path converter for cursors. Invalid cursors don't match the path.
+    """
+
+    regex = r"[A-Za-z0-9_-]+"
+
+    def to_python(self, value):
+        return Cursor.decode(value)
+
+    def to_url(self, value):
+        return value.encode()
+
+
+@dataclass
+class ClinicPage:
+    clinics: list
+    previous_cursor: Cursor | None = None
+    next_cursor: Cursor | None = None
+    # Whether the clinics are listed latest first, so that the previous page
+    # holds later clinics and the next page earlier ones
+    descending: bool = False
@@ -1,11 +1,16 @@
-from ..core.utils.date_formatting import format_date, format_time_range
+from django.db.models import Count, Q
+from django.urls import reverse
+
+from ..core.utils.date_formatting import format_date, format_time, format_time_range
 from ..core.utils.string_formatting import sentence_case
-from .models import Clinic
+from ..mammograms.presenters import AppointmentPresenter
+from .models import Clinic, ClinicQuerySet
 
 
 class ClinicsPresenter:
-    def __init__(self, filtered_clinics, filter, counts_by_filter):
-        self.clinics = [ClinicPresenter(clinic) for clinic in filtered_clinics]
+    def __init__(self, page, filter, counts_by_filter):
+        self._page = page
+        self.clinics = [ClinicPresenter(clinic) for clinic in page.clinics]
         self.counts_by_filter = counts_by_filter
         self.filter = filter
 
@@ -20,6 +25,31 @@ class ClinicsPresenter:
         else:
             return "All clinics this week"
 
+    @property
+    def pagination(self):
+        """
+        Params for the pagination component, or {} if everything fits on one page
+        """
+        params = {}
+        previous_label, next_label = "Earlier clinics", "Later clinics"
+        if self._page.descending:
+            previous_label, next_label = next_label, previous_label
+
+        if self._page.previous_cursor:
+            params["previousUrl"] = reverse(
+                "clinics:index_before",
+                kwargs={"filter": self.filter, "cursor": self._page.previous_cursor},
+            )
+            params["previousPage"] = previous_label
+        if self._page.next_cursor:
+            params["nextUrl"] = reverse(
+                "clinics:index_after",
+                kwargs={"filter": self.filter, "cursor": self._page.next_cursor},
+            )
+            params["nextPage"] = next_label
+
+        return params
+
 
 class ClinicPresenter:
     STATUS_COLORS = {
@@ -30,17 +60,88 @@ class ClinicPresenter:
 
     def __init__(self, clinic):
         self._clinic = clinic
+        self.id = clinic.id
+        self.url = reverse("clinics:show", kwargs={"id": clinic.id})
         self.starts_at = format_date(clinic.starts_at)
         self.session_type = clinic.session_type().capitalize()
-        self.number_of_slots = clinic.clinic_slots.count()
+        self.number_of_slots = self._slot_stat("slot_count")
         self.location_name = sentence_case(clinic.setting.name)
         self.time_range = format_time_range(clinic.time_range())
         self.type = clinic.get_type_display()
         self.risk_type = clinic.get_risk_type_display()
 
+    @property
+    def number_booked(self):
+        return self._slot_stat("booked_count")
+
+    @property
+    def number_checked_in(self):
+        return self._slot_stat("checked_in_count")
+
+    @property
+    def number_screened(self):
+        return self._slot_stat("screened_count")
+
+    def _slot_stat(self, name):
+        """
+        Read a count set by ClinicQuerySet.with_slot_stats or add_slot_stats,
+        falling back to querying for it if the clinic was loaded without them.
+        """
+        value = getattr(self._clinic, name, None)
+        if value is not None:
+            return value
+
+        slots = self._clinic.clinic_slots
+        if name == "slot_count":
+            return slots.count()
+
+        statuses = ClinicQuerySet.APPOINTMENT_STATS[name]
+        return slots.aggregate(
+            count=Count("appointment", filter=Q(appointment__status__in=statuses))
+        )["count"]
+
     @property
     def state(self):
         return {
             "text": self._clinic.get_state_display(),
             "classes": "nhsuk-tag--" + self.STATUS_COLORS[self._clinic.state],
         }
+
+
+class ClinicDaySheetPresenter:
+    """
+    Every slot in a clinic, with the appointment booked into it.
+
+    Expects the clinic to be annotated by ClinicQuerySet.with_slot_stats and
+    the slots to be loaded with ClinicSlotQuerySet.with_appointments, so that
+    nothing here needs to query the database.
+    """
+
+    def __init__(self, clinic, slots):
+        self.clinic = ClinicPresenter(clinic)
+        self.slots = [DaySheetSlotPresenter(slot) for slot in slots]
+
+    @property
+    def heading(self):
+        return f"{self.clinic.location_name} ({self.clinic.session_type.lower()})"
+
+
+class DaySheetSlotPresenter:
+    def __init__(self, slot):
+        self.id = slot.id
+        self.time = format_time(slot.starts_at)
+        self.duration = f"{slot.duration_in_minutes} minutes"
+
+        # A slot can have several appointments if some were cancelled and
+        # rebooked. Show the most recent one.
+        appointments = slot.appointment_set.all()
+        self.appointment = (
+            AppointmentPresenter(appointments[0]) if appointments else None
+        )
+
+    @property
+    def appointment_url(self):
+        if not self.appointment:
+            return None
+
+        return reverse("mammograms:start_screening", kwargs={"id": self.appointment.id})
@@ -0,0 +1,471 @@
+"""
+Generate large volumes of realistic providers, clinics, participants and
+appointments, for load testing.
+
+Rows are written with COPY rather than INSERT, which is many times faster,
+and lets us backdate `created_at` so that participants have a realistic
+screening history. Everything is generated from one random seed and dated
+relative to `today`, so the same seed and day always produce the same data,
+including primary keys.
+"""
+
+import random
+import uuid
+from dataclasses import dataclass, field, replace
+from datetime import date, datetime, time, timedelta
+from itertools import islice
+from string import ascii_uppercase
+from time import perf_counter
+
+from django.contrib.postgres.fields import ArrayField
+from django.db import DEFAULT_DB_ALIAS, connections, models, transaction
+from django.utils.timezone import get_current_timezone
+
+from ..core.utils import clock
+from ..participants.models import (
+    Appointment,
+    Participant,
+    ParticipantAddress,
+    ScreeningEpisode,
+)
+from ..participants.validators import nhs_number_check_digit
+from .caching import bump_generation
+from .models import Clinic, ClinicSlot, Provider, Setting
+
+FIRST_NAMES = [
+    "Janet", "Susan", "Margaret", "Patricia", "Linda", "Elizabeth", "Barbara",
+    "Dianna", "Jeannie", "Aisha", "Fatima", "Priya", "Mei", "Grace", "Olga",
+]  # fmt: skip
+LAST_NAMES = [
+    "Williams", "Smith", "Jones", "Taylor", "Brown", "Davies", "Evans",
+    "McIntosh", "Wilson", "Khan", "Patel", "Begum", "Chen", "Okafor", "Nowak",
+]  # fmt: skip
+STREETS = ["High Street", "Church Road", "Station Road", "Victoria Road", "Mill Lane"]
+TOWNS = ["Worthing", "Brighton", "Lancing", "Shoreham-by-Sea", "Hove"]
+POSTCODE_AREAS = ["BN", "RH", "PO", "GU", "TN"]
+
+# Roughly in line with the population screened in England
+ETHNIC_GROUP_WEIGHTS = {
+    "English, Welsh, Scottish, Northern Irish or British": 75,
+    "Any other White background": 5,
+    "Indian": 3,
+    "Pakistani": 2,
+    "African": 2,
+    "Caribbean": 1,
+    "Chinese": 1,
+    "Any other mixed or multiple ethnic background": 1,
+    Participant.PREFER_NOT_TO_SAY: 2,
+    None: 8,
+}
+
+PAST_APPOINTMENT_STATUS_WEIGHTS = {
+    Appointment.Status.SCREENED: 85,
+    Appointment.Status.DID_NOT_ATTEND: 7,
+    Appointment.Status.CANCELLED: 4,
+    Appointment.Status.PARTIALLY_SCREENED: 2,
+    Appointment.Status.ATTENDED_NOT_SCREENED: 2,
+}
+
+# Fields whose values psycopg can write without Django preparing them
+COPY_AS_IS_FIELDS = (
+    models.BooleanField,
+    models.CharField,
+    models.DateField,
+    models.ForeignKey,
+    models.IntegerField,
+    models.TextField,
+    models.UUIDField,
+    ArrayField,
+)
+
+# Generated NHS numbers start with 900 to 989, leaving the 999 range to the
+# test factories. Seeds take turns over blocks of ten million first nine
+# digits in that range. About one in eleven has no valid check digit, so a
+# block holds a little over nine million NHS numbers.
+FIRST_NHS_NUMBER = 900_000_000
+NHS_NUMBER_BLOCK_SIZE = 10_000_000
+NHS_NUMBER_BLOCKS = 9
+NHS_NUMBERS_PER_BLOCK = 9_000_000
+
+SCREENING_INTERVAL = timedelta(days=3 * 365)
+FIRST_SCREENING_AGE = 50
+
+
+@dataclass(frozen=True)
+class Volumes:
+    """
+    How much data to generate. Everything except providers and settings is
+    in proportion to the number of clinics.
+    """
+
+    providers: int = 5
+    settings_per_provider: int = 4
+    clinics: int = 1000
+    slots_per_clinic: int = 24
+    slot_minutes: int = 10
+    booked_fraction: float = 0.85
+    days_before_today: int = 365
+    days_after_today: int = 90
+
+    def scaled(self, scale: float) -> "Volumes":
+        """
+        Scale the number of clinics, and so everything in them
+
+        >>> Volumes(clinics=8000).scaled(0.01).clinics
+        80
+        """
+        return replace(self, clinics=max(1, round(self.clinics * scale)))
+
+
+@dataclass
+class SeedResult:
+    volumes: Volumes
+    counts: dict[str, int] = field(default_factory=dict)
+    seconds: float = 0.0
+
+    @property
+    def rows(self) -> int:
+        return sum(self.counts.values())
+
+
+def copy_objects(model, objects, using=DEFAULT_DB_ALIAS) -> int:
+    """
+    Write unsaved model instances to the database with COPY.
+
+    Unlike bulk_create, this doesn't call `pre_save`, so every field,
+    including the primary key and timestamps, must already be set.
+    """
+    connection = connections[using]
+    fields = model._meta.concrete_fields
+    table = connection.ops.quote_name(model._meta.db_table)
+    columns = ", ".join(connection.ops.quote_name(field.column) for field in fields)
+
+    # Preparing every value through the field is slow, and psycopg can adapt most
+    # of them as they are
+    attnames = [field.attname for field in fields]
+    prepared = [
+        (i, field)
+        for i, field in enumerate(fields)
+        if not isinstance(field, COPY_AS_IS_FIELDS)
+    ]
+
+    count = 0
+    with connection.cursor() as cursor:
+        with cursor.copy(f"COPY {table} ({columns}) FROM STDIN") as copy:
+            for obj in objects:
+                row = [getattr(obj, attname) for attname in attnames]
+                for i, field in prepared:
+                    row[i] = field.get_db_prep_save(row[i], connection)
+                copy.write_row(row)
+                count += 1
+
+    return count
+
+
+class VolumeSeeder:
+    """
+    Generate `volumes` worth of data, writing it in batches of around
+    `batch_size` slots, along with their appointments and participants.
+
+    Clinics are spread around `today`, which defaults to the current date.
+    """
+
+    def __init__(
+        self,
+        volumes: Volumes,
+        seed: int = 0,
+        batch_size: int = 10_000,
+        using=DEFAULT_DB_ALIAS,
+        today: date | None = None,
+    ):
+        self.volumes = volumes
+        self.seed = seed
+        self.batch_size = batch_size
+        self.using = using
+        self.rng = random.Random(seed)
+        self.today = today or clock.today()
+        self.timezone = get_current_timezone()
+
+        # NHS numbers are allocated in sequence, so that they're unique. Each
+        # seed starts its own block, so seeding again with a different seed
+        # doesn't reuse them.
+        max_participants = volumes.clinics * volumes.slots_per_clinic
+        if max_participants > NHS_NUMBERS_PER_BLOCK:
+            raise ValueError(
+                f"Up to {max_participants:,} participants don't fit in one seed's "
+                f"{NHS_NUMBERS_PER_BLOCK:,} NHS numbers. Seed fewer clinics at a "
+                "time, with a different seed each time."
+            )
+
+        self.next_nhs_number = (
+            FIRST_NHS_NUMBER + (seed % NHS_NUMBER_BLOCKS) * NHS_NUMBER_BLOCK_SIZE
+        )
+        self.nhs_number_limit = self.next_nhs_number + NHS_NUMBER_BLOCK_SIZE
+
+    def run(self, progress=None) -> SeedResult:
+        started = perf_counter()
+        result = SeedResult(self.volumes)
+
+        def save(model, objects):
+            count = copy_objects(model, objects, using=self.using)
+            label = model._meta.label
+            result.counts[label] = result.counts.get(label, 0) + count
+
+        with transaction.atomic(using=self.using):
+            self.check_nhs_numbers_are_free()
+
+            providers = self.providers()
+            save(Provider, providers)
+            settings = self.settings(providers)
+            save(Setting, settings)
+
+            clinics_per_batch = max(1, self.batch_size // self.volumes.slots_per_clinic)
+            clinics = self.clinics(settings)
+            while batch := list(islice(clinics, clinics_per_batch)):
+                save(Clinic, batch)
+                for model, objects in self.bookings(batch):
+                    save(model, objects)
+
+                if progress:
+                    progress(result)
+
+        # COPY doesn't send the signals that invalidate cached clinic lists
+        bump_generation()
+
+        result.seconds = perf_counter() - started
+        return result
+
+    def uuid(self):
+        return uuid.UUID(int=self.rng.getrandbits(128), version=4)
+
+    def timestamps(self, at):
+        return {"id": self.uuid(), "created_at": at, "updated_at": at}
+
+    def providers(self):
+        created_at = self.days_from_today(-self.volumes.days_before_today)
+
+        return [
+            Provider(name=f"Provider {n + 1}", **self.timestamps(created_at))
+            for n in range(self.volumes.providers)
+        ]
+
+    def settings(self, providers):
+        return [
+            Setting(
+                name=f"{self.rng.choice(TOWNS)} breast screening unit {n + 1}",
+                provider_id=provider.id,
+                **self.timestamps(provider.created_at),
+            )
+            for provider in providers
+            for n in range(self.volumes.settings_per_provider)
+        ]
+
+    def clinics(self, settings):
+        """
+        Spread the clinics over the weekdays in the date range, in morning
+        and afternoon sessions
+        """
+        first_day = self.today - timedelta(days=self.volumes.days_before_today)
+        days = [
+            first_day + timedelta(days=n)
+            for n in range(
+                self.volumes.days_before_today + self.volumes.days_after_today
+            )
+            if (first_day + timedelta(days=n)).weekday() < 5
+        ]
+        duration = timedelta(
+            minutes=self.volumes.slots_per_clinic * self.volumes.slot_minutes
+        )
+
+        for n in range(self.volumes.clinics):
+            day = days[n * len(days) // self.volumes.clinics]
+            session = self.rng.choice([time(8, 30), time(13, 0)])
+            starts_at = datetime.combine(day, session, tzinfo=self.timezone)
+
+            if day < self.today:
+                state = Clinic.State.CLOSED
+            elif day == self.today:
+                state = Clinic.State.IN_PROGRESS
+            else:
+                state = Clinic.State.SCHEDULED
+
+            yield Clinic(
+                setting_id=self.rng.choice(settings).id,
+                starts_at=starts_at,
+                ends_at=starts_at + duration,
+                type=self.choice(
+                    {Clinic.Type.SCREENING: 90, Clinic.Type.ASSESSMENT: 10}
+                ),
+                risk_type=self.choice(
+                    {
+                        Clinic.RiskType.ROUTINE_RISK: 80,
+                        Clinic.RiskType.MIXED_RISK: 15,
+                        Clinic.RiskType.MOBILE: 5,
+                    }
+                ),
+                state=state,
+                **self.timestamps(starts_at - timedelta(days=60)),
+            )
+
+    def bookings(self, clinics):
+        """
+        Generate the slots for `clinics`, and book participants into most of
+        them. Yields (model, objects) in the order they must be saved.
+        """
+        slots = []
+        participants = []
+        addresses = []
+        episodes = []
+        appointments = []
+
+        for clinic in clinics:
+            for n in range(self.volumes.slots_per_clinic):
+                slot = ClinicSlot(
+                    clinic_id=clinic.id,
+                    starts_at=clinic.starts_at
+                    + timedelta(minutes=n * self.volumes.slot_minutes),
+                    duration_in_minutes=self.volumes.slot_minutes,
+                    **self.timestamps(clinic.created_at),
+                )
+                slots.append(slot)
+
+                if self.rng.random() >= self.volumes.booked_fraction:
+                    continue
+
+                invited_at = clinic.starts_at - timedelta(days=self.rng.randint(21, 42))
+                participant = self.participant(clinic.starts_at.date(), invited_at)
+                participants.append(participant)
+                addresses.append(self.address(participant))
+                episodes.extend(self.previous_episodes(participant, invited_at))
+
+                episode = ScreeningEpisode(
+                    participant_id=participant.id, **self.timestamps(invited_at)
+                )
+                episodes.append(episode)
+                appointments.append(self.appointment(clinic, slot, episode))
+
+        yield ClinicSlot, slots
+        yield Participant, participants
+        yield ParticipantAddress, addresses
+        yield ScreeningEpisode, episodes
+        yield Appointment, appointments
+
+    def participant(self, screening_day, invited_at):
+        first_name = self.rng.choice(FIRST_NAMES)
+        last_name = self.rng.choice(LAST_NAMES)
+        age = self.rng.randint(FIRST_SCREENING_AGE, 70)
+
+        return Participant(
+            first_name=first_name,
+            last_name=last_name,
+            gender="Female",
+            nhs_number=self.nhs_number(),
+            phone=f"07700 900{self.rng.randint(0, 999):03d}",
+            email=f"{first_name}.{last_name}{self.rng.randint(1, 999)}@example.com".lower(),
+            date_of_birth=screening_day
+            - timedelta(days=age * 365 + self.rng.randint(0, 364)),
+            ethnic_group=self.choice(ETHNIC_GROUP_WEIGHTS),
+            risk_level=self.choice({"Routine": 95, "Moderate": 4, "High": 1}),
+            extra_needs=["Wheelchair user"] if self.rng.random() < 0.02 else [],
+            **self.timestamps(invited_at),
+        )
+
+    def address(self, participant):
+        area = self.rng.choice(POSTCODE_AREAS)
+        letters = "".join(self.rng.choices(ascii_uppercase, k=2))
+
+        return ParticipantAddress(
+            id=self.uuid(),
+            participant_id=participant.id,
+            lines=[
+                f"{self.rng.randint(1, 200)} {self.rng.choice(STREETS)}",
+                self.rng.choice(TOWNS),
+            ],
+            postcode=f"{area}{self.rng.randint(1, 99)} {self.rng.randint(0, 9)}{letters}",
+        )
+
+    def previous_episodes(self, participant, invited_at):
+        """
+        Screening every three years since turning 50, with the odd one missed
+        """
+        age = (invited_at.date() - participant.date_of_birth).days // 365
+        for n in range(1, (age - FIRST_SCREENING_AGE) // 3 + 1):
+            if self.rng.random() < 0.1:
+                continue
+
+            yield ScreeningEpisode(
+                participant_id=participant.id,
+                **self.timestamps(
+                    invited_at
+                    - n * SCREENING_INTERVAL
+                    + timedelta(days=self.rng.randint(-30, 30))
+                ),
+            )
+
+    def appointment(self, clinic, slot, episode):
+        match clinic.state:
+            case Clinic.State.SCHEDULED:
+                status = Appointment.Status.CONFIRMED
+            case Clinic.State.IN_PROGRESS:
+                status = self.rng.choice(
+                    [
+                        Appointment.Status.CONFIRMED,
+                        Appointment.Status.CHECKED_IN,
+                        Appointment.Status.SCREENED,
+                    ]
+                )
+            case _:
+                status = self.choice(PAST_APPOINTMENT_STATUS_WEIGHTS)
+
+        stopped = status == Appointment.Status.ATTENDED_NOT_SCREENED
+
+        return Appointment(
+            screening_episode_id=episode.id,
+            clinic_slot_id=slot.id,
+            status=status,
+            reinvite=stopped,
+            stopped_reasons={"stopped_reasons": ["technical_issues"]}
+            if stopped
+            else None,
+            **self.timestamps(episode.created_at),
+        )
+
+    def check_nhs_numbers_are_free(self):
+        """
+        Seeds sharing a block of NHS numbers would generate the same ones, as
+        would seeding with the same seed twice
+        """
+        in_use = Participant.objects.using(self.using).filter(
+            nhs_number__gte=f"{self.next_nhs_number:09d}0",
+            nhs_number__lt=f"{self.nhs_number_limit:09d}0",
+        )
+        if in_use.exists():
+            raise ValueError(
+                f"The NHS numbers for seed {self.seed} are already in use, by "
+                "seeding with it before or with another seed that has the same "
+                f"remainder modulo {NHS_NUMBER_BLOCKS}. Use a different seed."
+            )
+
+    def nhs_number(self):
+        """
+        The next valid NHS number in the sequence. Numbers without a check
+        digit are skipped.
+        """
+        while True:
+            if self.next_nhs_number >= self.nhs_number_limit:
+                raise ValueError("Ran out of NHS numbers for this seed")
+
+            digits = f"{self.next_nhs_number:09d}"
+            self.next_nhs_number += 1
+
+            check_digit = nhs_number_check_digit(digits)
+            if check_digit is not None:
+                return f"{digits}{check_digit}"
+
+    def choice(self, weights: dict):
+        return self.rng.choices(list(weights), weights=list(weights.values()))[0]
+
+    def days_from_today(self, days):
+        return datetime.combine(
+            self.today + timedelta(days=days), time(), tzinfo=self.timezone
+        )
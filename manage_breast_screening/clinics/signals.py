@@ -0,0 +1,22 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+
+from ..participants.models import Appointment
+from .caching import bump_generation
+from .models import Clinic, ClinicSlot, Setting
+
+
+def invalidate_clinic_lists(sender, instance, **kwargs):
+    # Wait until the change is visible to other requests before invalidating,
+    # otherwise they could cache the old data again under the new generation.
+    transaction.on_commit(bump_generation)
+
+
+def connect():
+    for model in [Setting, Clinic, ClinicSlot, Appointment]:
+        for signal in [post_save, post_delete]:
+            signal.connect(
+                invalidate_clinic_lists,
+                sender=model,
+                dispatch_uid=f"invalidate_clinic_lists_{model.__name__}",
+            )
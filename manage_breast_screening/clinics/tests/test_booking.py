@@ -0,0 +1,163 @@
+from datetime import timedelta
+
+import pytest
+from django.db import connections
+
+from manage_breast_screening.participants.models import Appointment
+from manage_breast_screening.participants.tests.factories import (
+    AppointmentFactory,
+    ParticipantFactory,
+)
+
+from ..booking import book_participants, generate_slots
+from ..models import ClinicSlot
+from .factories import ClinicFactory, ClinicSlotFactory
+
+
+@pytest.fixture
+def clinic():
+    clinic = ClinicFactory.create()
+    clinic.ends_at = clinic.starts_at + timedelta(hours=1)
+    clinic.save()
+    return clinic
+
+
+def booked_times(clinic):
+    return list(
+        Appointment.objects.filter(clinic_slot__clinic=clinic)
+        .order_by("clinic_slot__starts_at")
+        .values_list("clinic_slot__starts_at", flat=True)
+    )
+
+
+@pytest.mark.django_db
+class TestGenerateSlots:
+    def test_fills_the_clinic(self, clinic):
+        slots = generate_slots(clinic, duration_in_minutes=15)
+
+        assert [slot.starts_at for slot in slots] == [
+            clinic.starts_at + timedelta(minutes=minutes) for minutes in [0, 15, 30, 45]
+        ]
+        assert ClinicSlot.objects.filter(clinic=clinic).count() == 4
+
+    def test_only_creates_missing_slots(self, clinic):
+        ClinicSlotFactory.create(
+            clinic=clinic,
+            starts_at=clinic.starts_at + timedelta(minutes=10),
+            duration_in_minutes=15,
+        )
+
+        slots = generate_slots(clinic, duration_in_minutes=30)
+
+        assert [slot.starts_at for slot in slots] == [
+            clinic.starts_at + timedelta(minutes=30)
+        ]
+        assert generate_slots(clinic, duration_in_minutes=30) == []
+
+
+@pytest.mark.django_db
+class TestBookParticipants:
+    def test_books_participants_in_order(self, clinic):
+        participants = ParticipantFactory.create_batch(3)
+
+        result = book_participants(clinic, participants, duration_in_minutes=20)
+
+        assert result.slots_created == 3
+        assert [
+            appointment.screening_episode.participant
+            for appointment in result.appointments
+        ] == participants
+        assert booked_times(clinic) == [
+            clinic.starts_at + timedelta(minutes=minutes) for minutes in [0, 20, 40]
+        ]
+        assert all(
+            appointment.status == Appointment.Status.CONFIRMED
+            for appointment in Appointment.objects.all()
+        )
+
+    @pytest.mark.parametrize("count", [1, 6])
+    def test_queries_dont_depend_on_the_number_of_participants(
+        self, clinic, count, django_assert_max_num_queries
+    ):
+        participants = ParticipantFactory.create_batch(count)
+
+        with django_assert_max_num_queries(15):
+            result = book_participants(clinic, participants)
+
+        assert len(result.appointments) == count
+
+    def test_skips_booked_slots_and_participants(self, clinic):
+        booked = AppointmentFactory.create(
+            clinic_slot=ClinicSlotFactory.create(
+                clinic=clinic, starts_at=clinic.starts_at, duration_in_minutes=30
+            )
+        )
+        AppointmentFactory.create(
+            clinic_slot=ClinicSlotFactory.create(
+                clinic=clinic,
+                starts_at=clinic.starts_at + timedelta(minutes=30),
+                duration_in_minutes=30,
+            ),
+            status=Appointment.Status.CANCELLED,
+        )
+        participant = booked.screening_episode.participant
+        new_participant = ParticipantFactory.create()
+
+        result = book_participants(
+            clinic, [participant, new_participant], duration_in_minutes=30
+        )
+
+        assert result.already_booked == [participant]
+        assert result.appointments[0].clinic_slot.starts_at == (
+            clinic.starts_at + timedelta(minutes=30)
+        )
+
+    def test_returns_participants_that_dont_fit(self, clinic):
+        participants = ParticipantFactory.create_batch(3)
+
+        result = book_participants(clinic, participants, duration_in_minutes=30)
+
+        assert len(result.appointments) == 2
+        assert result.unbooked == participants[2:]
+
+    def test_invalidates_cached_clinic_lists(
+        self, clinic, django_capture_on_commit_callbacks
+    ):
+        with django_capture_on_commit_callbacks() as callbacks:
+            book_participants(clinic, [ParticipantFactory.create()])
+
+        assert callbacks
+
+
+@pytest.mark.django_db(transaction=True)
+def test_skips_slots_locked_by_another_booker(clinic):
+    generate_slots(clinic, duration_in_minutes=15)
+    first_two = list(
+        ClinicSlot.objects.filter(clinic=clinic)
+        .order_by("starts_at")
+        .values_list("pk", flat=True)[:2]
+    )
+
+    other = connections.create_connection("default")
+    try:
+        with other.cursor() as cursor:
+            cursor.execute("BEGIN")
+            cursor.execute(
+                f"SELECT id FROM {ClinicSlot._meta.db_table} WHERE id = ANY(%s) "
+                "FOR UPDATE",
+                [first_two],
+            )
+
+            result = book_participants(
+                clinic, ParticipantFactory.create_batch(3), duration_in_minutes=15
+            )
+
+            cursor.execute("ROLLBACK")
+    finally:
+        other.close()
+
+    assert len(result.appointments) == 2
+    assert len(result.unbooked) == 1
+    assert booked_times(clinic) == [
+        clinic.starts_at + timedelta(minutes=minutes) for minutes in [30, 45]
+    ]
@@ -0,0 +1,87 @@
+from datetime import datetime, timezone
+
+import pytest
+from django.core.cache import cache
+from django.urls import reverse
+
+from manage_breast_screening.participants.tests.factories import AppointmentFactory
+
+from ..caching import bump_generation, get_generation
+from .factories import ClinicFactory, ClinicSlotFactory
+
+
+@pytest.fixture
+def locmem_cache(settings):
+    settings.CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    }
+    yield
+    cache.clear()
+
+
+@pytest.mark.usefixtures("locmem_cache")
+class TestGenerations:
+    def test_bumping_the_generation(self):
+        generation = get_generation()
+
+        bump_generation()
+
+        assert get_generation() == generation + 1
+
+    def test_bumping_an_evicted_generation(self):
+        generation = get_generation()
+        cache.clear()
+
+        bump_generation()
+
+        assert get_generation() > generation
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("locmem_cache")
+class TestClinicListCaching:
+    @pytest.fixture(autouse=True)
+    def before_clinics(self, time_machine):
+        time_machine.move_to(datetime(2025, 1, 1, 8, tzinfo=timezone.utc))
+
+    @pytest.fixture
+    def url(self):
+        return reverse("clinics:index_with_filter", kwargs={"filter": "all"})
+
+    def test_repeated_requests_are_served_from_the_cache(
+        self, client, url, django_assert_num_queries
+    ):
+        ClinicFactory.create()
+        client.get(url)
+
+        with django_assert_num_queries(0):
+            response = client.get(url)
+
+        assert response.status_code == 200
+
+    @pytest.mark.parametrize(
+        "change",
+        [
+            lambda clinic: ClinicSlotFactory.create(clinic=clinic),
+            lambda clinic: AppointmentFactory.create(
+                clinic_slot=ClinicSlotFactory.create(clinic=clinic)
+            ),
+            lambda clinic: clinic.delete(),
+        ],
+    )
+    def test_changes_invalidate_the_cache(
+        self, client, url, change, django_capture_on_commit_callbacks
+    ):
+        clinic = ClinicFactory.create()
+        before = client.get(url).content
+
+        with django_capture_on_commit_callbacks(execute=True):
+            change(clinic)
+
+        assert client.get(url).content != before
+
+    def test_invalidating_the_cache_doesnt_query(self, django_assert_num_queries):
+        slot = ClinicSlotFactory.create()
+
+        with django_assert_num_queries(1):
+            slot.save()
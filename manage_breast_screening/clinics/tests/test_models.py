@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 from datetime import timezone as tz
 
 import pytest
@@ -6,8 +6,11 @@ import time_machine
 from pytest_django.asserts import assertQuerySetEqual
 
 from manage_breast_screening.clinics import models
+from manage_breast_screening.participants.models import Appointment
+from manage_breast_screening.participants.tests.factories import AppointmentFactory
 
-from .factories import ClinicFactory
+from ..pagination import Direction
+from .factories import ClinicFactory, ClinicSlotFactory
 
 
 def test_clinic_is_scheduled():
@@ -28,3 +31,216 @@ def test_status_filtering():
     assertQuerySetEqual(models.Clinic.objects.today(), {current}, ordered=False)
     assertQuerySetEqual(models.Clinic.objects.upcoming(), {future}, ordered=False)
     assertQuerySetEqual(models.Clinic.objects.completed(), {past}, ordered=False)
+
+
+@pytest.mark.django_db
+@time_machine.travel(datetime(2025, 1, 1, 10, tzinfo=tz.utc))
+def test_filter_counts(django_assert_num_queries):
+    ClinicFactory.create(starts_at=datetime(2025, 1, 1, 9, tzinfo=tz.utc))
+    ClinicFactory.create(starts_at=datetime(2025, 1, 2, 9, tzinfo=tz.utc))
+    ClinicFactory.create(starts_at=datetime(2025, 1, 3, 9, tzinfo=tz.utc))
+    ClinicFactory.create(starts_at=datetime(2024, 1, 1, 9, tzinfo=tz.utc))
+
+    with django_assert_num_queries(1):
+        counts = models.Clinic.filter_counts()
+
+    assert counts == {
+        models.ClinicFilter.TODAY: 1,
+        models.ClinicFilter.UPCOMING: 2,
+        models.ClinicFilter.COMPLETED: 1,
+        models.ClinicFilter.ALL: 4,
+    }
+
+
+def test_by_filter_rejects_unknown_filters():
+    with pytest.raises(ValueError):
+        models.Clinic.objects.by_filter("yesterday")
+
+
+@pytest.mark.django_db
+def test_with_slot_stats():
+    clinic = ClinicFactory.create()
+    empty_clinic = ClinicFactory.create()
+    for status in [
+        Appointment.Status.CONFIRMED,
+        Appointment.Status.CHECKED_IN,
+        Appointment.Status.SCREENED,
+        Appointment.Status.CANCELLED,
+    ]:
+        AppointmentFactory.create(
+            clinic_slot=ClinicSlotFactory.create(clinic=clinic), status=status
+        )
+    ClinicSlotFactory.create(clinic=clinic)
+
+    clinics = models.Clinic.objects.with_slot_stats().in_bulk()
+
+    assert clinics[clinic.pk].slot_count == 5
+    assert clinics[clinic.pk].booked_count == 3
+    assert clinics[clinic.pk].checked_in_count == 1
+    assert clinics[clinic.pk].screened_count == 1
+    assert clinics[empty_clinic.pk].slot_count == 0
+    assert clinics[empty_clinic.pk].booked_count == 0
+
+
+@pytest.mark.django_db
+def test_add_slot_stats(django_assert_num_queries):
+    clinic, empty_clinic, other_clinic = ClinicFactory.create_batch(3)
+    AppointmentFactory.create(
+        clinic_slot=ClinicSlotFactory.create(clinic=clinic),
+        status=Appointment.Status.CHECKED_IN,
+    )
+    ClinicSlotFactory.create(clinic=other_clinic)
+    clinics = list(models.Clinic.objects.filter(pk__in=[clinic.pk, empty_clinic.pk]))
+
+    with django_assert_num_queries(1):
+        models.Clinic.objects.add_slot_stats(clinics)
+
+    stats = {
+        c.pk: (c.slot_count, c.booked_count, c.checked_in_count, c.screened_count)
+        for c in clinics
+    }
+    assert stats == {clinic.pk: (1, 1, 1, 0), empty_clinic.pk: (0, 0, 0, 0)}
+
+
+@pytest.mark.django_db
+class TestPage:
+    @pytest.fixture
+    def clinics(self):
+        return sorted(
+            ClinicFactory.create_batch(5), key=lambda clinic: clinic.starts_at
+        )
+
+    def test_first_page(self, clinics):
+        page = models.Clinic.objects.page(page_size=2)
+
+        assert page.clinics == clinics[:2]
+        assert page.previous_cursor is None
+        assert page.next_cursor.id == clinics[1].id
+
+    def test_following_pages(self, clinics):
+        second = models.Clinic.objects.page(
+            models.Clinic.objects.page(page_size=2).next_cursor, page_size=2
+        )
+        third = models.Clinic.objects.page(second.next_cursor, page_size=2)
+
+        assert second.clinics == clinics[2:4]
+        assert second.previous_cursor.id == clinics[2].id
+        assert third.clinics == clinics[4:]
+        assert third.next_cursor is None
+
+    def test_previous_page(self, clinics):
+        third = models.Clinic.objects.page(
+            models.Clinic.objects.page(page_size=3).next_cursor, page_size=3
+        )
+        previous = models.Clinic.objects.page(
+            third.previous_cursor, Direction.BEFORE, page_size=3
+        )
+
+        assert third.clinics == clinics[3:]
+        assert previous.clinics == clinics[:3]
+        assert previous.previous_cursor is None
+        assert previous.next_cursor.id == clinics[2].id
+
+    def test_descending(self, clinics):
+        first = models.Clinic.objects.page(page_size=2, descending=True)
+        second = models.Clinic.objects.page(
+            first.next_cursor, page_size=2, descending=True
+        )
+        previous = models.Clinic.objects.page(
+            second.previous_cursor, Direction.BEFORE, page_size=2, descending=True
+        )
+
+        assert first.clinics == [clinics[4], clinics[3]]
+        assert first.previous_cursor is None
+        assert second.clinics == [clinics[2], clinics[1]]
+        assert previous.clinics == first.clinics
+        assert previous.previous_cursor is None
+
+    def test_starting_part_way_through(self, clinics):
+        first = models.Clinic.objects.page(page_size=2, start=clinics[2].starts_at)
+        previous = models.Clinic.objects.page(
+            first.previous_cursor, Direction.BEFORE, page_size=2
+        )
+
+        assert first.clinics == clinics[2:4]
+        assert previous.clinics == clinics[:2]
+        assert previous.previous_cursor is None
+        assert previous.next_cursor.id == clinics[1].id
+
+    def test_starting_at_the_beginning(self, clinics):
+        page = models.Clinic.objects.page(page_size=2, start=clinics[0].starts_at)
+
+        assert page.clinics == clinics[:2]
+        assert page.previous_cursor is None
+
+    def test_starting_after_the_end(self, clinics):
+        page = models.Clinic.objects.page(
+            page_size=2, start=clinics[-1].starts_at + timedelta(days=1)
+        )
+        previous = models.Clinic.objects.page(
+            page.previous_cursor, Direction.BEFORE, page_size=2
+        )
+
+        assert page.clinics == []
+        assert previous.clinics == clinics[3:]
+
+    def test_clinics_starting_at_the_same_time(self):
+        starts_at = datetime(2025, 1, 1, 9, tzinfo=tz.utc)
+        clinics = sorted(
+            [
+                ClinicFactory.create(starts_at=starts_at, ends_at=starts_at + delta)
+                for delta in [timedelta(hours=1), timedelta(hours=2)]
+            ],
+            key=lambda clinic: clinic.id,
+        )
+
+        first = models.Clinic.objects.page(page_size=1)
+        second = models.Clinic.objects.page(first.next_cursor, page_size=1)
+
+        assert first.clinics == clinics[:1]
+        assert second.clinics == clinics[1:]
+
+
+@pytest.mark.django_db
+@time_machine.travel(datetime(2025, 1, 1, 10, tzinfo=tz.utc))
+def test_status_filtering_at_day_boundaries():
+    start_of_today = ClinicFactory.create(
+        starts_at=datetime(2025, 1, 1, 0, tzinfo=tz.utc)
+    )
+    end_of_today = ClinicFactory.create(
+        starts_at=datetime(2025, 1, 1, 23, 59, 59, tzinfo=tz.utc)
+    )
+    start_of_tomorrow = ClinicFactory.create(
+        starts_at=datetime(2025, 1, 2, 0, tzinfo=tz.utc)
+    )
+    end_of_yesterday = ClinicFactory.create(
+        starts_at=datetime(2024, 12, 31, 23, 59, 59, tzinfo=tz.utc)
+    )
+
+    assertQuerySetEqual(
+        models.Clinic.objects.today(), {start_of_today, end_of_today}, ordered=False
+    )
+    assertQuerySetEqual(
+        models.Clinic.objects.upcoming(), {start_of_tomorrow}, ordered=False
+    )
+    assertQuerySetEqual(
+        models.Clinic.objects.completed(), {end_of_yesterday}, ordered=False
+    )
+
+
+@pytest.mark.django_db
+@time_machine.travel(datetime(2025, 6, 1, 23, 30, tzinfo=tz.utc))
+def test_status_filtering_uses_uk_days():
+    # 00:15 on 2 June in British Summer Time
+    after_midnight = ClinicFactory.create(
+        starts_at=datetime(2025, 6, 1, 23, 15, tzinfo=tz.utc)
+    )
+    # 23:45 on 1 June in British Summer Time
+    before_midnight = ClinicFactory.create(
+        starts_at=datetime(2025, 6, 1, 22, 45, tzinfo=tz.utc)
+    )
+
+    assertQuerySetEqual(models.Clinic.objects.today(), {after_midnight}, ordered=False)
+    assertQuerySetEqual(
+        models.Clinic.objects.completed(), {before_midnight}, ordered=False
+    )
@@ -1,17 +1,24 @@
 from datetime import datetime
 from unittest.mock import MagicMock
+from uuid import uuid4
 
 import pytest
 
-from manage_breast_screening.clinics.presenters import ClinicPresenter
+from manage_breast_screening.clinics.presenters import (
+    ClinicDaySheetPresenter,
+    ClinicPresenter,
+)
+from manage_breast_screening.participants.tests.factories import AppointmentFactory
 
 from ..models import Clinic
+from .factories import ClinicFactory, ClinicSlotFactory
 
 
 @pytest.fixture
 def mock_clinic():
     mock = MagicMock(spec=Clinic)
 
+    mock.id = uuid4()
     mock.starts_at = datetime(2025, 1, 1, 9)
     mock.session_type.return_value = "All day"
     mock.clinic_slots.count.return_value = 10
@@ -36,3 +43,42 @@ def test_clinic_presenter(mock_clinic):
     assert presenter.time_range == "9am to 3pm"
     assert presenter.type == "Screening"
     assert presenter.risk_type == "Routine"
+
+
+def test_clinic_presenter_uses_slot_stats_annotations(mock_clinic):
+    mock_clinic.slot_count = 12
+    mock_clinic.booked_count = 8
+    mock_clinic.checked_in_count = 2
+    mock_clinic.screened_count = 3
+
+    presenter = ClinicPresenter(mock_clinic)
+
+    assert presenter.number_of_slots == 12
+    assert presenter.number_booked == 8
+    assert presenter.number_checked_in == 2
+    assert presenter.number_screened == 3
+    mock_clinic.clinic_slots.count.assert_not_called()
+
+
+@pytest.mark.django_db
+def test_day_sheet_presenter_does_not_query_the_database(django_assert_num_queries):
+    clinic = ClinicFactory.create()
+    slots = ClinicSlotFactory.create_batch(3, clinic=clinic)
+    for slot in slots[:2]:
+        AppointmentFactory.create(clinic_slot=slot)
+
+    clinic = (
+        Clinic.objects.select_related("setting").with_slot_stats().get(pk=clinic.pk)
+    )
+    slots = list(clinic.clinic_slots.with_appointments().order_by("starts_at"))
+
+    with django_assert_num_queries(0):
+        presenter = ClinicDaySheetPresenter(clinic, slots)
+        rows = [
+            (slot.time, slot.appointment and slot.appointment.last_known_screening)
+            for slot in presenter.slots
+        ]
+
+    assert presenter.clinic.number_booked == 2
+    assert len(rows) == 3
+    assert presenter.slots[2].appointment is None
@@ -0,0 +1,125 @@
+from datetime import date, datetime, timezone
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.utils.timezone import localdate
+
+from manage_breast_screening.participants.models import (
+    Appointment,
+    Participant,
+    ScreeningEpisode,
+)
+from manage_breast_screening.participants.validators import normalise_nhs_number
+
+from ..models import Clinic, ClinicFilter, ClinicSlot
+from ..seeding import NHS_NUMBER_BLOCKS, Volumes, VolumeSeeder
+
+VOLUMES = Volumes(providers=2, settings_per_provider=2, clinics=20, slots_per_clinic=6)
+
+
+@pytest.mark.django_db
+class TestVolumeSeeder:
+    def test_writes_the_requested_volumes(self):
+        result = VolumeSeeder(VOLUMES, batch_size=30).run()
+
+        assert Clinic.objects.count() == result.counts["clinics.Clinic"] == 20
+        assert ClinicSlot.objects.count() == 20 * 6
+        assert (
+            Appointment.objects.count()
+            == Participant.objects.count()
+            == result.counts["participants.Appointment"]
+        )
+        assert result.rows == sum(result.counts.values())
+
+    def test_clinics_cover_every_filter(self):
+        VolumeSeeder(VOLUMES).run()
+
+        counts = Clinic.filter_counts()
+
+        assert counts[ClinicFilter.UPCOMING] > 0
+        assert counts[ClinicFilter.COMPLETED] > 0
+
+    def test_participants_have_a_screening_history(self):
+        VolumeSeeder(VOLUMES).run()
+
+        assert ScreeningEpisode.objects.count() > Appointment.objects.count()
+        assert (
+            Appointment.objects.with_previous_screening_date()
+            .filter(previous_screening_at__isnull=False)
+            .exists()
+        )
+
+    def test_the_same_seed_and_day_generate_the_same_data(self, time_machine):
+        def clinics(seed, today=date(2025, 1, 1)):
+            seeder = VolumeSeeder(VOLUMES, seed=seed, today=today)
+            settings = seeder.settings(seeder.providers())
+            return [
+                (clinic.pk, clinic.starts_at) for clinic in seeder.clinics(settings)
+            ]
+
+        first = clinics(1)
+        time_machine.move_to(datetime(2030, 6, 1, tzinfo=timezone.utc))
+
+        assert clinics(1) == first
+        assert clinics(2) != first
+        assert clinics(1, today=None) != first
+
+    def test_nhs_numbers_are_valid_and_unique(self):
+        seeder = VolumeSeeder(VOLUMES)
+        numbers = [seeder.nhs_number() for _ in range(100)]
+
+        assert len(set(numbers)) == 100
+        assert [normalise_nhs_number(number) for number in numbers] == numbers
+
+    def test_volumes_must_fit_in_a_block_of_nhs_numbers(self):
+        with pytest.raises(ValueError):
+            VolumeSeeder(Volumes(clinics=400_000, slots_per_clinic=24))
+
+    def test_seeds_sharing_nhs_numbers_are_refused(self):
+        VolumeSeeder(VOLUMES, seed=1).run()
+
+        with pytest.raises(ValueError):
+            VolumeSeeder(VOLUMES, seed=1 + NHS_NUMBER_BLOCKS).run()
+
+        assert Clinic.objects.count() == VOLUMES.clinics
+
+
+@pytest.mark.django_db
+def test_seed_volume_command():
+    stdout = StringIO()
+
+    call_command("seed_volume", "--clinics", "5", "--providers", "1", stdout=stdout)
+
+    assert Clinic.objects.count() == 5
+    assert "rows/s" in stdout.getvalue()
+
+
+@pytest.mark.django_db
+def test_seed_volume_command_dates_clinics_around_the_given_day():
+    call_command(
+        "seed_volume",
+        "--clinics",
+        "5",
+        "--providers",
+        "1",
+        "--days-before-today",
+        "0",
+        "--days-after-today",
+        "1",
+        "--today",
+        "2030-06-03",
+        stdout=StringIO(),
+    )
+
+    assert {
+        localdate(starts_at)
+        for starts_at in Clinic.objects.values_list("starts_at", flat=True)
+    } == {date(2030, 6, 3)}
+
+
+@pytest.mark.django_db
+def test_seed_volume_command_reports_volumes_that_dont_fit():
+    with pytest.raises(CommandError, match="NHS numbers"):
+        call_command("seed_volume", "--clinics", "400000", stdout=StringIO())
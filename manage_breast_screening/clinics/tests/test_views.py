@@ -0,0 +1,148 @@
+from datetime import datetime, timezone
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.urls import reverse
+from pytest_django.asserts import assertContains
+
+from manage_breast_screening.participants.models import Appointment
+from manage_breast_screening.participants.tests.factories import (
+    AppointmentFactory,
+    ScreeningEpisodeFactory,
+)
+
+from .. import views
+from ..pagination import Cursor
+from .factories import ClinicFactory, ClinicSlotFactory
+
+
+@pytest.mark.django_db
+class TestClinicList:
+    @pytest.fixture(autouse=True)
+    def before_clinics(self, time_machine):
+        # The list of all clinics starts at today's
+        time_machine.move_to(datetime(2025, 1, 1, 8, tzinfo=timezone.utc))
+
+    def test_renders_all_clinics(self, client):
+        clinic = ClinicFactory.create()
+        ClinicSlotFactory.create_batch(3, clinic=clinic)
+
+        response = client.get(
+            reverse("clinics:index_with_filter", kwargs={"filter": "all"})
+        )
+
+        assertContains(response, clinic.setting.name.capitalize())
+
+    def test_query_count_is_independent_of_number_of_clinics(
+        self, client, django_assert_num_queries
+    ):
+        for clinic in ClinicFactory.create_batch(5):
+            ClinicSlotFactory.create_batch(2, clinic=clinic)
+
+        # one query for the clinics, one to check for earlier clinics, one for
+        # the slot stats of the clinics on the page and one for the filter counts
+        with django_assert_num_queries(4):
+            client.get(reverse("clinics:index_with_filter", kwargs={"filter": "all"}))
+
+    def test_reports_server_timing(self, client):
+        response = client.get(
+            reverse("clinics:index_with_filter", kwargs={"filter": "all"})
+        )
+
+        metrics = [
+            metric.split(";")[0]
+            for metric in response.headers["Server-Timing"].split(", ")
+        ]
+        assert {"db", "view", "query", "presenter", "template"} <= set(metrics)
+
+    def test_links_to_the_next_page(self, client, monkeypatch):
+        monkeypatch.setattr(
+            "manage_breast_screening.clinics.models.DEFAULT_PAGE_SIZE", 2
+        )
+        clinics = sorted(
+            ClinicFactory.create_batch(3), key=lambda clinic: clinic.starts_at
+        )
+
+        response = client.get(
+            reverse("clinics:index_with_filter", kwargs={"filter": "all"})
+        )
+
+        assertContains(
+            response,
+            reverse(
+                "clinics:index_after",
+                kwargs={"filter": "all", "cursor": Cursor.for_clinic(clinics[1])},
+            ),
+        )
+
+    def test_lists_completed_clinics_most_recent_first(self, client, time_machine):
+        clinics = sorted(
+            ClinicFactory.create_batch(3), key=lambda clinic: clinic.starts_at
+        )
+        time_machine.move_to(datetime(2025, 2, 1, tzinfo=timezone.utc))
+
+        response = client.get(
+            reverse("clinics:index_with_filter", kwargs={"filter": "completed"})
+        )
+
+        content = response.content.decode()
+        positions = [content.index(f"/clinics/{clinic.pk}/") for clinic in clinics]
+        assert positions == sorted(positions, reverse=True)
+
+    def test_invalid_cursor_is_not_found(self, client):
+        response = client.get("/clinics/all/after/not-a-cursor/")
+        assert response.status_code == 404
+
+    def test_async_version(self, async_rf, django_assert_num_queries):
+        clinic = ClinicFactory.create()
+        request = async_rf.get(
+            reverse("clinics:index_with_filter", kwargs={"filter": "all"})
+        )
+
+        with django_assert_num_queries(4):
+            response = async_to_sync(views.aclinic_list)(request, filter="all")
+
+        assertContains(response, clinic.setting.name.capitalize())
+
+
+@pytest.mark.django_db
+class TestClinicDaySheet:
+    def test_lists_appointments_in_each_slot(self, client):
+        clinic = ClinicFactory.create()
+        booked, empty = ClinicSlotFactory.create_batch(2, clinic=clinic)
+        appointment = AppointmentFactory.create(
+            clinic_slot=booked,
+            screening_episode__participant__first_name="Alice",
+            screening_episode__participant__last_name="Smith",
+            status=Appointment.Status.CHECKED_IN,
+        )
+
+        response = client.get(reverse("clinics:show", kwargs={"id": clinic.pk}))
+
+        assertContains(response, "Alice Smith")
+        assertContains(
+            response,
+            reverse("mammograms:start_screening", kwargs={"id": appointment.pk}),
+        )
+        assertContains(response, "Checked in")
+        assertContains(response, "No appointment")
+
+    def test_query_count_is_independent_of_number_of_slots(
+        self, client, django_assert_num_queries
+    ):
+        clinic = ClinicFactory.create()
+        for slot in ClinicSlotFactory.create_batch(10, clinic=clinic):
+            appointment = AppointmentFactory.create(clinic_slot=slot)
+            ScreeningEpisodeFactory.create(
+                participant=appointment.screening_episode.participant
+            )
+
+        # one query each for the clinic, its slots and their appointments
+        with django_assert_num_queries(3):
+            response = client.get(reverse("clinics:show", kwargs={"id": clinic.pk}))
+
+        assert response.status_code == 200
+
+    def test_unknown_clinic_is_not_found(self, client):
+        response = client.get("/clinics/ce662c8b-92dc-4c82-9d5d-1ddcb201e2b6/")
+        assert response.status_code == 404
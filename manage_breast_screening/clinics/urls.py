@@ -1,13 +1,32 @@
-from django.urls import path
+from django.conf import settings
+from django.urls import path, register_converter
 
 from . import views
+from .pagination import CursorConverter, Direction
+
+register_converter(CursorConverter, "clinic_cursor")
 
 app_name = "clinics"
 
+clinic_list = views.aclinic_list if settings.ASYNC_VIEWS else views.clinic_list
+
 urlpatterns = [
     # TODO: we will have something like
     # /clinics/{today,upcoming,completed,all}
     # /clinics/{id}
-    path("", views.clinic_list, name="index"),
-    path("<str:filter>/", views.clinic_list, name="index_with_filter"),
+    path("", clinic_list, name="index"),
+    path("<uuid:id>/", views.clinic, name="show"),
+    path("<str:filter>/", clinic_list, name="index_with_filter"),
+    path(
+        "<str:filter>/after/<clinic_cursor:cursor>/",
+        clinic_list,
+        {"direction": Direction.AFTER},
+        name="index_after",
+    ),
+    path(
+        "<str:filter>/before/<clinic_cursor:cursor>/",
+        clinic_list,
+        {"direction": Direction.BEFORE},
+        name="index_before",
+    ),
 ]
@@ -1,8 +1,17 @@
-from django.shortcuts import render
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.shortcuts import get_object_or_404, render
+from django.template.loader import render_to_string
 
-from manage_breast_screening.clinics.presenters import ClinicsPresenter
+from manage_breast_screening.clinics.presenters import (
+    ClinicDaySheetPresenter,
+    ClinicsPresenter,
+)
 
-from .models import Clinic
+from ..core.utils import clock, timing
+from .caching import CLINIC_LIST_TIMEOUT, aclinic_list_key, clinic_list_key
+from .models import Clinic, ClinicFilter
+from .pagination import Direction
 
 STATUS_COLORS = {
     Clinic.State.SCHEDULED: "blue",  # default blue
@@ -11,13 +20,72 @@ STATUS_COLORS = {
 }
 
 
-def clinic_list(request, filter="today"):
-    clinics = Clinic.objects.prefetch_related("setting").by_filter(filter)
-    counts_by_filter = Clinic.filter_counts()
-    presenter = ClinicsPresenter(clinics, filter, counts_by_filter)
+def clinic_list(request, filter="today", cursor=None, direction=Direction.AFTER):
+    filter = ClinicFilter(filter)
+    today = clock.today()
+    cache_key = clinic_list_key(filter, today, cursor, direction)
+    content = cache.get(cache_key)
+
+    if content is None:
+        with timing.phase("query"):
+            page = Clinic.objects.select_related("setting").filter_page(
+                filter, today, cursor, direction
+            )
+            Clinic.objects.add_slot_stats(page.clinics)
+            counts_by_filter = Clinic.filter_counts(today)
+
+        content = render_clinic_list(request, page, filter, counts_by_filter)
+        cache.set(cache_key, content, CLINIC_LIST_TIMEOUT)
+
+    return HttpResponse(content)
+
+
+async def aclinic_list(request, filter="today", cursor=None, direction=Direction.AFTER):
+    """
+    Async version of `clinic_list`, used when serving ASGI
+    """
+    filter = ClinicFilter(filter)
+    today = clock.today()
+    cache_key = await aclinic_list_key(filter, today, cursor, direction)
+    content = await cache.aget(cache_key)
+
+    if content is None:
+        with timing.phase("query"):
+            page = await Clinic.objects.select_related("setting").afilter_page(
+                filter, today, cursor, direction
+            )
+            await Clinic.objects.aadd_slot_stats(page.clinics)
+            counts_by_filter = await Clinic.afilter_counts(today)
+
+        content = render_clinic_list(request, page, filter, counts_by_filter)
+        await cache.aset(cache_key, content, CLINIC_LIST_TIMEOUT)
+
+    return HttpResponse(content)
+
+
+def render_clinic_list(request, page, filter, counts_by_filter):
+    with timing.phase("presenter"):
+        presenter = ClinicsPresenter(page, filter, counts_by_filter)
+
+    return render_to_string(
+        "index.jinja",
+        context={"presenter": presenter},
+        request=request,
+    )
+
+
+def clinic(request, id):
+    with timing.phase("query"):
+        clinic = get_object_or_404(
+            Clinic.objects.select_related("setting").with_slot_stats(), pk=id
+        )
+        slots = list(clinic.clinic_slots.with_appointments().order_by("starts_at"))
+
+    with timing.phase("presenter"):
+        presenter = ClinicDaySheetPresenter(clinic, slots)
 
     return render(
         request,
-        "index.jinja",
+        "clinic.jinja",
         context={"presenter": presenter},
     )
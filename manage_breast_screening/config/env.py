@@ -0,0 +1,11 @@
+"""
+Helpers for reading configuration from environment variables, shared by the
+Django settings and the Gunicorn configuration.
+"""
+
+from os import environ
+
+
+def boolean_env(key, default=None):
+    value = environ.get(key)
+    return default if value is None else value in ("True", "true", "1")
@@ -0,0 +1,92 @@
+"""
+Gunicorn configuration
+https://docs.gunicorn.org/en/stable/settings.html
+
+Each setting can be changed with an environment variable, so that
+concurrency can be tuned to the size of the container without rebuilding
+the image. GUNICORN_CMD_ARGS overrides anything set here.
+"""
+
+import os
+from os import environ
+
+from manage_breast_screening.config.env import boolean_env
+
+
+def available_cpus():
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+bind = environ.get("GUNICORN_BIND", "0.0.0.0:8000")
+
+# Threads let a worker serve other requests while one waits on the
+# database, so we need fewer processes than CPUs x 2
+workers = int(environ.get("GUNICORN_WORKERS", available_cpus() + 1))
+threads = int(environ.get("GUNICORN_THREADS", "4"))
+
+# GUNICORN_WORKER_CLASS=uvicorn serves the ASGI application instead, which
+# routes requests to the async versions of views, so that they run on an
+# event loop rather than a thread each
+if environ.get("GUNICORN_WORKER_CLASS") == "uvicorn":
+    worker_class = "uvicorn_worker.UvicornWorker"
+    wsgi_app = "manage_breast_screening.config.asgi:application"
+else:
+    worker_class = environ.get(
+        "GUNICORN_WORKER_CLASS", "gthread" if threads > 1 else "sync"
+    )
+    wsgi_app = "manage_breast_screening.config.wsgi:application"
+
+timeout = int(environ.get("GUNICORN_TIMEOUT", "30"))
+graceful_timeout = int(environ.get("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+keepalive = int(environ.get("GUNICORN_KEEPALIVE", "5"))
+
+# Restart workers every so often to put a cap on memory leaks. The jitter
+# stops them all restarting at the same time.
+max_requests = int(environ.get("GUNICORN_MAX_REQUESTS", "1000"))
+max_requests_jitter = int(environ.get("GUNICORN_MAX_REQUESTS_JITTER", "100"))
+
+# Load the application before forking, so that workers start faster and
+# share the memory used by the code and compiled templates
+preload_app = boolean_env("GUNICORN_PRELOAD_APP", default=True)
+
+
+def warm_up_templates():
+    from manage_breast_screening.config.jinja2_env import warm_up_templates
+
+    warm_up_templates()
+
+
+def when_ready(server):
+    if server.cfg.preload_app:
+        # Compile the templates once, for all workers
+        warm_up_templates()
+
+
+def pre_fork(server, worker):
+    # Workers must not share the master's database connections, so close
+    # any that were opened while loading the application
+    if server.cfg.preload_app:
+        from django.db import connections
+
+        for connection in connections.all(initialized_only=True):
+            connection.close()
+            if hasattr(connection, "close_pool"):
+                connection.close_pool()
+
+
+def post_fork(server, worker):
+    # pre_fork has closed the master's connections, so this only clears any
+    # pool the worker inherited, so that it opens connections of its own
+    if server.cfg.preload_app:
+        from django.db import connections
+
+        connections.close_all()
+
+
+def post_worker_init(worker):
+    # Without preload_app, each worker compiles the templates before it
+    # accepts requests. With it, they're already compiled, so this is quick.
+    warm_up_templates()
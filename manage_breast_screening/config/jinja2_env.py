@@ -1,9 +1,30 @@
+import logging
+import os
+
 from django.conf import settings
+from django.template import engines
+from django.template.backends.jinja2 import Jinja2
 from django.templatetags.static import static
 from django.urls import reverse
-from jinja2 import ChoiceLoader, Environment, PackageLoader
+from jinja2 import (
+    BaseLoader,
+    ChoiceLoader,
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    PackageLoader,
+    Template,
+    TemplateError,
+    TemplateNotFound,
+)
 from markupsafe import Markup, escape
 
+from ..core.utils import timing
+
+TEMPLATE_EXTENSIONS = (".jinja", ".html")
+
+logger = logging.getLogger(__name__)
+
 
 def no_wrap(value):
     """
@@ -27,19 +48,118 @@ def as_hint(value):
     return Markup(f'<span class="app-text-grey">{value}</span>' if value else "")
 
 
+class TimedTemplate(Template):
+    """
+    Record the time spent rendering in the request's "template" phase
+    """
+
+    def render(self, *args, **kwargs):
+        with timing.phase("template"):
+            return super().render(*args, **kwargs)
+
+
+class ResolvedLoader(BaseLoader):
+    """
+    Look up which of `loaders` provides each template once, up front,
+    rather than trying each loader in turn whenever a template is loaded.
+
+    Templates are assumed not to change while the process is running, so
+    they are never reloaded.
+    """
+
+    def __init__(self, loaders):
+        self.loaders = loaders
+        self.mapping = {}
+        self.overridden = set()
+
+        for loader in loaders:
+            for name in loader.list_templates():
+                if name in self.mapping:
+                    self.overridden.add(name)
+                else:
+                    self.mapping[name] = loader
+
+    def get_source(self, environment, template):
+        loader = self.mapping.get(template)
+        if loader is None:
+            # Not a name we know about, but a loader may still be able to
+            # normalise it to one of its templates
+            loader = self._find_loader(environment, template)
+            self.mapping[template] = loader
+
+        source, filename, _ = loader.get_source(environment, template)
+        return source, filename, lambda: True
+
+    def _find_loader(self, environment, template):
+        for loader in self.loaders:
+            try:
+                loader.get_source(environment, template)
+            except TemplateNotFound:
+                continue
+            return loader
+
+        raise TemplateNotFound(template)
+
+    def list_templates(self):
+        return sorted(self.mapping)
+
+    def inventory(self) -> list[tuple[str, int]]:
+        """
+        The number of templates that each loader provides
+        """
+        return [
+            (
+                describe_loader(loader),
+                sum(1 for found in self.mapping.values() if found is loader),
+            )
+            for loader in self.loaders
+        ]
+
+
+def describe_loader(loader) -> str:
+    if isinstance(loader, PackageLoader):
+        return f"{loader.package_name}/{loader.package_path}"
+    if isinstance(loader, FileSystemLoader):
+        return ", ".join(str(path) for path in loader.searchpath)
+    return type(loader).__name__
+
+
 def environment(**options):
+    production_mode = settings.JINJA2_PRODUCTION_MODE
+    if production_mode:
+        options["auto_reload"] = False
+        # Keep every compiled template, instead of the 400 most recently used
+        options["cache_size"] = -1
+
     env = Environment(**options, extensions=["jinja2.ext.do"])
+    env.template_class = TimedTemplate
+
+    # Store compiled templates on disk, so that new workers don't need to
+    # compile them again
+    if settings.JINJA2_BYTECODE_CACHE_DIR:
+        os.makedirs(settings.JINJA2_BYTECODE_CACHE_DIR, exist_ok=True)
+        env.bytecode_cache = FileSystemBytecodeCache(settings.JINJA2_BYTECODE_CACHE_DIR)
+
     if env.loader:
-        env.loader = ChoiceLoader(
-            [
-                env.loader,
-                PackageLoader(
-                    "nhsuk_frontend_jinja", package_path="templates/components"
+        loaders = [
+            env.loader,
+            PackageLoader("nhsuk_frontend_jinja", package_path="templates/components"),
+            PackageLoader("nhsuk_frontend_jinja", package_path="templates/macros"),
+            PackageLoader("nhsuk_frontend_jinja"),
+        ]
+
+        if production_mode:
+            env.loader = ResolvedLoader(loaders)
+            logger.info(
+                "Found %d templates (%d overridden): %s",
+                len(env.loader.mapping),
+                len(env.loader.overridden),
+                ", ".join(
+                    f"{count} in {source}" for source, count in env.loader.inventory()
                 ),
-                PackageLoader("nhsuk_frontend_jinja", package_path="templates/macros"),
-                PackageLoader("nhsuk_frontend_jinja"),
-            ]
-        )
+            )
+        else:
+            env.loader = ChoiceLoader(loaders)
 
     env.globals.update(
         {"static": static, "url": reverse, "STATIC_URL": settings.STATIC_URL}
@@ -48,3 +168,34 @@ def environment(**options):
     env.filters["as_hint"] = as_hint
 
     return env
+
+
+def jinja2_environments():
+    return [engine.env for engine in engines.all() if isinstance(engine, Jinja2)]
+
+
+def compile_templates(env) -> list[str]:
+    """
+    Load every template in the environment, so that it's compiled and
+    stored in the bytecode cache. Returns the names of the templates.
+    """
+    names = env.list_templates(
+        filter_func=lambda name: name.endswith(TEMPLATE_EXTENSIONS)
+    )
+    for name in names:
+        env.get_template(name)
+    return names
+
+
+def warm_up_templates():
+    """
+    Compile all the templates before the first request, so that it doesn't
+    have to wait for them.
+    """
+    for env in jinja2_environments():
+        try:
+            names = compile_templates(env)
+        except TemplateError:
+            logger.exception("Failed to compile templates")
+        else:
+            logger.info("Compiled %d templates", len(names))
@@ -1,6 +1,27 @@
-from azure.identity import DefaultAzureCredential
+import psycopg
 from django.db.backends.postgresql import base
 
+from .tokens import token_cache
+
+
+def is_azure_host(host) -> bool:
+    return (host or "").endswith(".database.azure.com")
+
+
+class AzureTokenConnection(psycopg.Connection):
+    """
+    A connection that uses the current Azure token as its password.
+
+    The connection pool opens new physical connections long after the pool
+    was configured, so the password can't be part of the pool's fixed
+    connection parameters.
+    """
+
+    @classmethod
+    def connect(cls, conninfo="", **kwargs):
+        kwargs["password"] = token_cache.get_token()
+        return super().connect(conninfo, **kwargs)
+
 
 class DatabaseWrapper(base.DatabaseWrapper):
     """
@@ -15,26 +36,40 @@ class DatabaseWrapper(base.DatabaseWrapper):
 
     Unless you disable persistent connections, each thread will maintain its own
     connection.
-    Since Django 5.1 it is possible to configure a connection pool
-    instead of using persistent connections, but that would require us to
-    fix the credentials.
-    See https://docs.djangoproject.com/en/5.2/ref/databases/#persistent-connections
+    Alternatively, set OPTIONS["pool"] to use a psycopg connection pool shared by
+    all threads in the process. Pooled connections are opened with
+    AzureTokenConnection, so each one gets a token that is valid at the time
+    it is opened.
+    See https://docs.djangoproject.com/en/5.2/ref/databases/#connection-pool
     for more details of how this works.
     """
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.azure_credential = DefaultAzureCredential()
+    def __init__(self, settings_dict, *args, **kwargs):
+        super().__init__(settings_dict, *args, **kwargs)
+
+        if is_azure_host(self.settings_dict["HOST"]):
+            # Fetch a token ahead of the first connection
+            token_cache.start()
+
+        options = self.settings_dict["OPTIONS"]
+        pool_options = options.get("pool")
+        if pool_options and is_azure_host(self.settings_dict["HOST"]):
+            if pool_options is True:
+                pool_options = {}
+            self.settings_dict["OPTIONS"] = {
+                **options,
+                "pool": {**pool_options, "connection_class": AzureTokenConnection},
+            }
 
     def _get_azure_connection_password(self) -> str:
-        # This makes use of in-memory token caching
-        # https://github.com/Azure/azure-sdk-for-python/blob/main/sdk/identity/azure-identity/TOKEN_CACHING.md#in-memory-token-caching
-        return self.azure_credential.get_token(
-            "https://ossrdbms-aad.database.windows.net/.default"
-        ).token
+        return token_cache.get_token()
 
     def get_connection_params(self) -> dict:
         params = super().get_connection_params()
-        if params.get("host", "").endswith(".database.azure.com"):
-            params["password"] = self._get_azure_connection_password()
+        if is_azure_host(params.get("host")):
+            if self.settings_dict["OPTIONS"].get("pool"):
+                # AzureTokenConnection sets the password for each connection
+                params.pop("password", None)
+            else:
+                params["password"] = self._get_azure_connection_password()
         return params
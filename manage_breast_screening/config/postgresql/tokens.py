@@ -0,0 +1,206 @@
+"""
+Access tokens for Azure passwordless login to the database.
+"""
+
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from azure.core.credentials import AccessToken
+
+AZURE_DATABASE_SCOPE = "https://ossrdbms-aad.database.windows.net/.default"
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TokenCacheMetrics:
+    refreshes: int = 0
+    failures: int = 0
+    last_refresh_seconds: float | None = None
+    total_refresh_seconds: float = 0.0
+    expires_on: int | None = None
+
+
+class AzureTokenCache:
+    """
+    Cache an Azure AD access token for the database.
+
+    A background thread fetches a new token `refresh_margin` seconds before
+    the current one expires, so connecting only has to wait for the
+    credential when there is no valid token at all, e.g. on the very first
+    connection, or if refreshing has been failing.
+
+    The margin is capped at half the token's lifetime, and the thread waits
+    at least `min_refresh_interval` between refreshes, so short-lived tokens
+    can't make it call the credential in a tight loop. After a failure it
+    waits `retry_interval`, doubling with each failure in a row up to
+    `max_retry_interval`.
+
+    A token is only checked when a connection is established, so connections
+    opened with a token remain usable after it expires.
+    """
+
+    def __init__(
+        self,
+        credential=None,
+        scope=AZURE_DATABASE_SCOPE,
+        refresh_margin=5 * 60,
+        min_refresh_interval=30,
+        retry_interval=30,
+        max_retry_interval=5 * 60,
+    ):
+        self.scope = scope
+        self.refresh_margin = refresh_margin
+        self.min_refresh_interval = min_refresh_interval
+        self.retry_interval = retry_interval
+        self.max_retry_interval = max_retry_interval
+        self.metrics = TokenCacheMetrics()
+        self._credential = credential
+        self._token = None
+        self._refresh_at = 0.0
+        self._failures_in_a_row = 0
+        self._lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._thread = None
+
+    @property
+    def credential(self):
+        if self._credential is None:
+            # azure.identity is slow to import, and only needed for Azure
+            # hosts, so don't import it until it's used
+            from azure.identity import DefaultAzureCredential
+
+            self._credential = DefaultAzureCredential()
+        return self._credential
+
+    def get_token(self) -> str:
+        self.start()
+
+        token = self._token
+        if self._is_expired(token):
+            with self._lock:
+                # Another thread may have refreshed it while we were waiting
+                token = self._token
+                if self._is_expired(token):
+                    token = self._refresh()
+
+        return token.token
+
+    def start(self):
+        """
+        Start refreshing the token in the background, if not already started
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._stopping.clear()
+                self._thread = threading.Thread(
+                    target=self._run, name="azure-token-refresh", daemon=True
+                )
+                self._thread.start()
+
+    def stop(self, timeout=None):
+        self._stopping.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def seconds_until_refresh(self) -> float:
+        if self._token is None:
+            return 0
+        return max(0, self._refresh_at - time.time())
+
+    def seconds_until_retry(self) -> float:
+        """
+        How long to wait after the latest of a run of failed refreshes
+        """
+        backoff = self.retry_interval * 2 ** max(0, self._failures_in_a_row - 1)
+        return min(backoff, self.max_retry_interval)
+
+    def _run(self):
+        wait = self.seconds_until_refresh()
+        while not self._stopping.wait(wait):
+            try:
+                with self._lock:
+                    # Skip it if another thread has just refreshed the token
+                    if self.seconds_until_refresh() == 0:
+                        self._refresh()
+            except Exception:
+                # Keep the current token until it expires, and try again
+                wait = self.seconds_until_retry()
+            else:
+                wait = max(self.seconds_until_refresh(), self.min_refresh_interval)
+
+    def _refresh(self) -> "AccessToken":
+        started = time.perf_counter()
+        try:
+            token = self.credential.get_token(self.scope)
+        except Exception:
+            self.metrics.failures += 1
+            self._failures_in_a_row += 1
+            logger.exception("Failed to refresh the database access token")
+            raise
+
+        duration = time.perf_counter() - started
+        self.metrics.refreshes += 1
+        self.metrics.last_refresh_seconds = duration
+        self.metrics.total_refresh_seconds += duration
+        self.metrics.expires_on = token.expires_on
+        logger.info(
+            "Refreshed the database access token in %.3fs",
+            duration,
+            extra={"refresh_seconds": duration, "expires_on": token.expires_on},
+        )
+
+        lifetime = token.expires_on - time.time()
+        self._refresh_at = token.expires_on - min(self.refresh_margin, lifetime / 2)
+        self._failures_in_a_row = 0
+        self._token = token
+        return token
+
+    def _after_fork(self):
+        # Threads don't survive a fork, e.g. when gunicorn starts a worker
+        self._lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._thread = None
+
+    @staticmethod
+    def _is_expired(token) -> bool:
+        return token is None or token.expires_on <= time.time()
+
+
+class StubCredential:
+    """
+    Stands in for DefaultAzureCredential, issuing made up tokens, so that
+    token caching can be exercised without Azure.
+    """
+
+    def __init__(self, lifetime=60 * 60, delay=0, error=None):
+        self.lifetime = lifetime
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+
+    def get_token(self, *scopes, **kwargs) -> "AccessToken":
+        from azure.core.credentials import AccessToken
+
+        self.calls += 1
+        if self.delay:
+            time.sleep(self.delay)
+        if self.error:
+            raise self.error
+
+        return AccessToken(f"stub-token-{self.calls}", int(time.time() + self.lifetime))
+
+
+# One cache, and one credential, for the whole process
+token_cache = AzureTokenCache()
+
+os.register_at_fork(after_in_child=token_cache._after_fork)
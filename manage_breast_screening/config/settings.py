@@ -14,14 +14,11 @@ import sys
 from os import environ
 from pathlib import Path
 
+from django.core.exceptions import ImproperlyConfigured
 from dotenv import load_dotenv
 from jinja2 import ChainableUndefined
 
-
-def boolean_env(key, default=None):
-    value = environ.get(key)
-    return default if value is None else value in ("True", "true", "1")
-
+from .env import boolean_env
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -57,6 +54,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     "manage_breast_screening.core",
     "manage_breast_screening.clinics",
     "manage_breast_screening.participants",
@@ -65,17 +63,25 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
-    "whitenoise.middleware.WhiteNoiseMiddleware",
+    "manage_breast_screening.core.middleware.StaticFilesMiddleware",
+    "manage_breast_screening.core.middleware.QueryStatsMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "manage_breast_screening.core.middleware.ClockMiddleware",
+    "manage_breast_screening.core.middleware.TimingMiddleware",
 ]
 
 ROOT_URLCONF = "manage_breast_screening.core.urls"
 
+# Route requests to the async versions of views that have them. The ASGI
+# application turns this on; under WSGI, async views would each cost a
+# thread hop and an event loop.
+ASYNC_VIEWS = boolean_env("ASYNC_VIEWS", default=False)
+
 TEMPLATES = [
     {
         "BACKEND": "django.template.backends.jinja2.Jinja2",
@@ -101,6 +107,14 @@ TEMPLATES = [
     },
 ]
 
+# Look up templates once and never reload them. Turn this off to see changes
+# to templates without restarting.
+JINJA2_PRODUCTION_MODE = boolean_env("JINJA2_PRODUCTION_MODE", default=not DEBUG)
+
+# Where to keep compiled Jinja2 templates. If this isn't set, every process
+# compiles templates itself.
+JINJA2_BYTECODE_CACHE_DIR = environ.get("JINJA2_BYTECODE_CACHE_DIR")
+
 WSGI_APPLICATION = "manage_breast_screening.config.wsgi.application"
 
 
@@ -119,12 +133,48 @@ DATABASES = {
     }
 }
 
+# Share a pool of connections between the threads in each process, instead of
+# each thread opening its own.
+# https://docs.djangoproject.com/en/5.2/ref/databases/#connection-pool
+if boolean_env("DATABASE_POOL", default=False):
+    DATABASES["default"]["OPTIONS"]["pool"] = {
+        "min_size": int(environ.get("DATABASE_POOL_MIN_SIZE", "2")),
+        "max_size": int(environ.get("DATABASE_POOL_MAX_SIZE", "10")),
+        "timeout": float(environ.get("DATABASE_POOL_TIMEOUT", "10")),
+    }
+
 STORAGES = {
     "staticfiles": {
         "BACKEND": "whitenoise.storage.CompressedManifestStaticFilesStorage",
     },
 }
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+#
+# Cached clinic lists are invalidated by bumping counters kept in the cache
+# itself, so the cache must be shared by every process serving requests.
+# Nothing is cached unless CACHE_BACKEND and CACHE_LOCATION are set, e.g. to
+# django.core.cache.backends.redis.RedisCache and redis://host:6379
+# (this requires the redis client library to be installed).
+
+CACHE_BACKEND = environ.get(
+    "CACHE_BACKEND", "django.core.cache.backends.dummy.DummyCache"
+)
+
+if not DEBUG and CACHE_BACKEND == "django.core.cache.backends.locmem.LocMemCache":
+    raise ImproperlyConfigured(
+        "LocMemCache isn't shared between processes, so other workers would "
+        "serve stale clinic lists. Use a shared CACHE_BACKEND."
+    )
+
+CACHES = {
+    "default": {
+        "BACKEND": CACHE_BACKEND,
+        "LOCATION": environ.get("CACHE_LOCATION", ""),
+    }
+}
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
@@ -149,7 +199,7 @@ AUTH_PASSWORD_VALIDATORS = [
 
 LANGUAGE_CODE = "en-us"
 
-TIME_ZONE = "UTC"
+TIME_ZONE = "Europe/London"
 
 USE_I18N = True
 
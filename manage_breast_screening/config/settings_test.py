@@ -10,6 +10,12 @@ STORAGES = {
     },
 }
 
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.dummy.DummyCache",
+    },
+}
+
 MIDDLEWARE.remove(
-    "whitenoise.middleware.WhiteNoiseMiddleware",
+    "manage_breast_screening.core.middleware.StaticFilesMiddleware",
 )
@@ -0,0 +1,36 @@
+import runpy
+from pathlib import Path
+
+CONFIG_PATH = Path(__file__).parent.parent / "gunicorn.conf.py"
+
+
+def test_settings_come_from_the_environment(monkeypatch):
+    monkeypatch.setenv("GUNICORN_WORKERS", "3")
+    monkeypatch.setenv("GUNICORN_THREADS", "8")
+    monkeypatch.setenv("GUNICORN_PRELOAD_APP", "false")
+
+    config = runpy.run_path(str(CONFIG_PATH))
+
+    assert config["workers"] == 3
+    assert config["threads"] == 8
+    assert config["worker_class"] == "gthread"
+    assert config["preload_app"] is False
+
+
+def test_single_threaded_workers_are_sync(monkeypatch):
+    monkeypatch.setenv("GUNICORN_THREADS", "1")
+
+    config = runpy.run_path(str(CONFIG_PATH))
+
+    assert config["worker_class"] == "sync"
+    assert config["wsgi_app"] == "manage_breast_screening.config.wsgi:application"
+    assert config["preload_app"] is True
+
+
+def test_uvicorn_workers_serve_the_asgi_application(monkeypatch):
+    monkeypatch.setenv("GUNICORN_WORKER_CLASS", "uvicorn")
+
+    config = runpy.run_path(str(CONFIG_PATH))
+
+    assert config["worker_class"] == "uvicorn_worker.UvicornWorker"
+    assert config["wsgi_app"] == "manage_breast_screening.config.asgi:application"
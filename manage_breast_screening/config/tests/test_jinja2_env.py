@@ -0,0 +1,60 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from jinja2 import DictLoader, Environment, FileSystemLoader, TemplateNotFound
+
+from ..jinja2_env import ResolvedLoader, compile_templates, environment
+
+
+def test_compiled_templates_are_kept_in_the_bytecode_cache(tmp_path, settings):
+    templates = tmp_path / "templates"
+    templates.mkdir()
+    (templates / "page.jinja").write_text("{{ 'hello' | no_wrap }}")
+    (templates / "README.md").write_text("not a template")
+    settings.JINJA2_BYTECODE_CACHE_DIR = str(tmp_path / "cache")
+
+    env = environment(loader=FileSystemLoader(templates))
+    names = compile_templates(env)
+
+    assert "page.jinja" in names
+    assert "README.md" not in names
+    assert len(list((tmp_path / "cache").iterdir())) == len(names)
+
+
+def test_compile_templates_command():
+    stdout = StringIO()
+
+    call_command("compile_templates", stdout=stdout, stderr=StringIO())
+
+    assert stdout.getvalue().startswith("Compiled ")
+
+
+class TestResolvedLoader:
+    @pytest.fixture
+    def loader(self):
+        return ResolvedLoader(
+            [
+                DictLoader({"page.jinja": "app page"}),
+                DictLoader({"page.jinja": "package page", "tag.jinja": "tag"}),
+            ]
+        )
+
+    def test_first_loader_wins(self, loader):
+        env = Environment(loader=loader)
+
+        assert env.get_template("page.jinja").render() == "app page"
+        assert env.get_template("tag.jinja").render() == "tag"
+        assert loader.overridden == {"page.jinja"}
+
+    def test_templates_are_never_reloaded(self, loader):
+        _, _, uptodate = loader.get_source(Environment(), "page.jinja")
+
+        assert uptodate()
+
+    def test_unknown_template(self, loader):
+        with pytest.raises(TemplateNotFound):
+            loader.get_source(Environment(), "missing.jinja")
+
+    def test_inventory(self, loader):
+        assert loader.inventory() == [("DictLoader", 1), ("DictLoader", 1)]
@@ -0,0 +1,59 @@
+from copy import deepcopy
+from unittest.mock import patch
+
+import pytest
+from django.db import connections
+
+from ..postgresql.base import AzureTokenConnection, DatabaseWrapper
+from ..postgresql.tokens import AzureTokenCache, StubCredential
+
+AZURE_HOST = "example.postgres.database.azure.com"
+
+
+@pytest.fixture(autouse=True)
+def token_cache():
+    cache = AzureTokenCache(credential=StubCredential())
+    with patch("manage_breast_screening.config.postgresql.base.token_cache", cache):
+        yield cache
+    cache.stop()
+
+
+def database_wrapper(host, **options):
+    settings_dict = deepcopy(connections["default"].settings_dict)
+    settings_dict["HOST"] = host
+    settings_dict["OPTIONS"] = options
+    return DatabaseWrapper(settings_dict, alias="pool_test")
+
+
+class TestAzureTokenConnection:
+    def test_connects_with_the_current_token(self):
+        with patch("psycopg.Connection.connect") as connect:
+            AzureTokenConnection.connect("", host=AZURE_HOST)
+
+        connect.assert_called_once_with("", host=AZURE_HOST, password="stub-token-1")
+
+
+class TestDatabaseWrapper:
+    def test_pool_opens_connections_with_a_fresh_token(self):
+        wrapper = database_wrapper(AZURE_HOST, pool={"max_size": 4})
+        try:
+            assert wrapper.pool.connection_class is AzureTokenConnection
+            assert wrapper.pool.max_size == 4
+            assert "password" not in wrapper.pool.kwargs
+        finally:
+            wrapper.close_pool()
+
+    def test_pool_is_unchanged_for_other_hosts(self):
+        wrapper = database_wrapper("localhost", pool=True)
+        try:
+            assert wrapper.pool.connection_class is not AzureTokenConnection
+        finally:
+            wrapper.close_pool()
+
+    @pytest.mark.parametrize("host", [AZURE_HOST, "localhost"])
+    def test_password_without_pool(self, host):
+        wrapper = database_wrapper(host)
+
+        params = wrapper.get_connection_params()
+
+        assert (params.get("password") == "stub-token-1") == (host == AZURE_HOST)
@@ -0,0 +1,101 @@
+import time
+
+import pytest
+from azure.core.exceptions import ClientAuthenticationError
+
+from ..postgresql.tokens import AzureTokenCache, StubCredential
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("timed out")
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def credential():
+    return StubCredential()
+
+
+@pytest.fixture
+def cache(credential):
+    cache = AzureTokenCache(credential=credential, refresh_margin=300)
+    yield cache
+    cache.stop()
+
+
+class TestAzureTokenCache:
+    def test_fetches_one_token_for_all_callers(self, cache, credential):
+        assert cache.get_token() == "stub-token-1"
+        assert cache.get_token() == "stub-token-1"
+
+        wait_for(lambda: cache.seconds_until_refresh() > 0)
+        assert credential.calls == 1
+        assert cache.metrics.refreshes == 1
+
+    def test_refreshes_in_the_background_before_expiry(self, cache, credential):
+        credential.lifetime = 2
+        cache.min_refresh_interval = 0
+
+        cache.start()
+
+        wait_for(lambda: credential.calls >= 2)
+        assert cache.get_token().startswith("stub-token-")
+        assert cache.metrics.last_refresh_seconds is not None
+
+    def test_refreshes_short_lived_tokens_halfway_through(self, cache, credential):
+        # Shorter than the refresh margin, so due for refresh as soon as it's
+        # issued if the margin wasn't capped
+        credential.lifetime = 200
+
+        cache.get_token()
+
+        assert 90 < cache.seconds_until_refresh() <= 100
+
+    def test_waits_between_refreshes(self, cache, credential):
+        credential.lifetime = 0
+        cache.min_refresh_interval = 0.2
+
+        cache.start()
+        time.sleep(0.5)
+
+        assert 2 <= credential.calls <= 4
+
+    def test_keeps_the_current_token_if_refreshing_fails(self, cache, credential):
+        credential.lifetime = 4
+        cache.min_refresh_interval = 0
+        cache.retry_interval = 0.01
+        assert cache.get_token() == "stub-token-1"
+
+        credential.error = ClientAuthenticationError("IMDS unavailable")
+
+        wait_for(lambda: cache.metrics.failures >= 2)
+        assert cache.get_token() == "stub-token-1"
+
+    def test_backs_off_after_failures(self, cache, credential):
+        credential.error = ClientAuthenticationError("IMDS unavailable")
+        cache.retry_interval = 10
+        cache.max_retry_interval = 60
+
+        delays = []
+        for _ in range(5):
+            with pytest.raises(ClientAuthenticationError):
+                cache._refresh()
+            delays.append(cache.seconds_until_retry())
+
+        assert delays == [10, 20, 40, 60, 60]
+
+        credential.error = None
+        cache._refresh()
+        assert cache.seconds_until_retry() == 10
+
+    def test_waits_for_a_token_if_there_is_no_valid_one(self, cache, credential):
+        credential.error = ClientAuthenticationError("IMDS unavailable")
+
+        with pytest.raises(ClientAuthenticationError):
+            cache.get_token()
+
+        credential.error = None
+        assert cache.get_token().startswith("stub-token-")
@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand, CommandError
+from jinja2 import TemplateError
+
+from manage_breast_screening.config.jinja2_env import (
+    compile_templates,
+    jinja2_environments,
+)
+
+
+class Command(BaseCommand):
+    help = "Compile all Jinja2 templates into the bytecode cache (JINJA2_BYTECODE_CACHE_DIR)"
+
+    def handle(self, *args, **options):
+        for env in jinja2_environments():
+            if env.bytecode_cache is None:
+                self.stderr.write(
+                    "JINJA2_BYTECODE_CACHE_DIR is not set, so the compiled templates will not be kept"
+                )
+
+            try:
+                names = compile_templates(env)
+            except TemplateError as e:
+                raise CommandError(f"Failed to compile templates: {e}") from e
+
+            self.stdout.write(f"Compiled {len(names)} templates")
@@ -0,0 +1,94 @@
+import re
+import subprocess
+import sys
+from collections import Counter
+from dataclasses import dataclass
+from operator import attrgetter
+from time import perf_counter
+
+from django.core.management.base import BaseCommand, CommandError
+
+# e.g. "import time:       463 |     184016 |       django.core.handlers.base"
+IMPORT_TIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$")
+
+
+@dataclass
+class ImportTime:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(output: str) -> list[ImportTime]:
+    """
+    Parse the output of `python -X importtime`
+
+    >>> parse_importtime("import time:       463 |     184016 |   django.core.handlers.base")
+    [ImportTime(module='django.core.handlers.base', self_us=463, cumulative_us=184016, depth=1)]
+    """
+    times = []
+    for line in output.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            times.append(
+                ImportTime(module, int(self_us), int(cumulative_us), len(indent) // 2)
+            )
+    return times
+
+
+class Command(BaseCommand):
+    help = (
+        "Start a new Python process, import a module (by default the WSGI "
+        "application), and report how long the imports took, by module."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "module", nargs="?", default="manage_breast_screening.config.wsgi"
+        )
+        parser.add_argument(
+            "--limit", type=int, default=25, help="Number of modules to list"
+        )
+        parser.add_argument(
+            "--sort",
+            choices=["cumulative", "self"],
+            default="cumulative",
+            help="Sort by time including (cumulative) or excluding (self) submodules",
+        )
+
+    def handle(self, *args, module, limit, sort, **options):
+        started = perf_counter()
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True,
+            text=True,
+        )
+        elapsed = perf_counter() - started
+
+        if result.returncode != 0:
+            raise CommandError(f"Failed to import {module}:\n{result.stderr[-2000:]}")
+
+        times = parse_importtime(result.stderr)
+        total_us = sum(time.self_us for time in times)
+
+        self.stdout.write(
+            f"Imported {len(times)} modules in {total_us / 1000:.0f}ms "
+            f"(the process took {elapsed * 1000:.0f}ms in total)\n"
+        )
+
+        self.stdout.write(f"{'cumulative':>12} {'self':>10}  module")
+        by_time = sorted(times, key=attrgetter(f"{sort}_us"), reverse=True)
+        for time in by_time[:limit]:
+            self.stdout.write(
+                f"{time.cumulative_us / 1000:>10.1f}ms {time.self_us / 1000:>8.1f}ms  {time.module}"
+            )
+
+        by_package = Counter()
+        for time in times:
+            by_package[time.module.split(".")[0]] += time.self_us
+
+        self.stdout.write(f"\n{'total':>12}  package")
+        for package, self_us in by_package.most_common(limit):
+            self.stdout.write(f"{self_us / 1000:>10.1f}ms  {package}")
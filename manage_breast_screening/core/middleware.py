@@ -0,0 +1,174 @@
+import logging
+from contextlib import ExitStack, contextmanager, nullcontext
+from time import perf_counter
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db import connections
+from whitenoise.middleware import WhiteNoiseMiddleware
+
+from .utils import clock, timing
+from .utils.query_stats import QueryStats
+from .utils.server_timing import add_server_timing
+
+logger = logging.getLogger(__name__)
+
+
+class WrappingMiddleware:
+    """
+    Base class for middleware that runs the rest of the request inside the
+    context manager returned by `wrap`, then hands the response to `finish`.
+
+    This works for both sync and async requests, so it doesn't force async
+    views to run in a thread.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        with self.wrap(request) as context:
+            response = self.get_response(request)
+        return self.finish(request, response, context)
+
+    async def __acall__(self, request):
+        with self.wrap(request) as context:
+            response = await self.get_response(request)
+        return self.finish(request, response, context)
+
+    def wrap(self, request):
+        return nullcontext()
+
+    def finish(self, request, response, context):
+        return response
+
+
+class StaticFilesMiddleware(WhiteNoiseMiddleware):
+    """
+    WhiteNoise only supports sync middleware, which would make every view
+    below it run in a thread under ASGI. This passes async requests for
+    anything other than static files straight on.
+    """
+
+    async_capable = True
+
+    def __init__(self, get_response=None, settings=settings):
+        super().__init__(get_response, settings)
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return super().__call__(request)
+
+    async def __acall__(self, request):
+        if self.autorefresh:
+            static_file = await sync_to_async(self.find_file)(request.path_info)
+        else:
+            static_file = self.files.get(request.path_info)
+
+        if static_file is not None:
+            return await sync_to_async(self.serve)(static_file, request)
+        return await self.get_response(request)
+
+
+class ClockMiddleware(WrappingMiddleware):
+    """
+    Fix the current time for the duration of each request
+    """
+
+    def wrap(self, request):
+        return clock.frozen()
+
+
+class QueryStatsMiddleware(WrappingMiddleware):
+    """
+    Count the SQL queries run for each request, and how long they took.
+    Report them in a log line and in the Server-Timing header.
+    """
+
+    @contextmanager
+    def wrap(self, request):
+        stats = QueryStats()
+
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(stats))
+            yield stats
+
+    async def __acall__(self, request):
+        # Database connections belong to a thread, and the async ORM runs
+        # queries in the request's thread sensitive executor, so that's where
+        # the wrappers have to go
+        wrapper = self.wrap(request)
+        stats = await sync_to_async(wrapper.__enter__)()
+        try:
+            response = await self.get_response(request)
+        finally:
+            await sync_to_async(wrapper.__exit__)(None, None, None)
+        return self.finish(request, response, stats)
+
+    def finish(self, request, response, stats):
+        add_server_timing(response, "db", stats.duration, f"{stats.count} queries")
+        logger.info(
+            "%s %s ran %d queries in %.1fms (%d duplicates, slowest %.1fms)",
+            request.method,
+            request.path,
+            stats.count,
+            stats.duration * 1000,
+            stats.duplicate_count,
+            stats.slowest_duration * 1000,
+            extra={
+                "method": request.method,
+                "path": request.path,
+                "status_code": response.status_code,
+                **stats.as_dict(),
+            },
+        )
+
+        return response
+
+
+class TimingMiddleware(WrappingMiddleware):
+    """
+    Time the view, and the phases recorded with `timing.phase`, for each
+    request. Report them in a log line and in the Server-Timing header.
+
+    This should be the last middleware, so that the view timing covers just
+    the view and rendering its response.
+    """
+
+    @contextmanager
+    def wrap(self, request):
+        started = perf_counter()
+        with timing.recording() as timings:
+            yield timings
+        timings.add("view", perf_counter() - started)
+
+    def finish(self, request, response, timings):
+        for name, duration in timings.durations.items():
+            add_server_timing(response, name, duration)
+
+        logger.info(
+            "%s %s timings: %s",
+            request.method,
+            request.path,
+            " ".join(f"{name}={ms}ms" for name, ms in timings.as_dict().items()),
+            extra={
+                "method": request.method,
+                "path": request.path,
+                "status_code": response.status_code,
+                "timings_ms": timings.as_dict(),
+            },
+        )
+
+        return response
@@ -0,0 +1,19 @@
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+
+
+def test_importtime():
+    stdout = StringIO()
+
+    call_command("importtime", "json", "--limit", "1000", stdout=stdout)
+
+    output = stdout.getvalue()
+    assert output.startswith("Imported ")
+    assert " json\n" in output
+
+
+def test_importtime_for_a_missing_module():
+    with pytest.raises(CommandError):
+        call_command("importtime", "not_a_module", stdout=StringIO())
@@ -0,0 +1,123 @@
+from datetime import datetime
+from datetime import timezone as tz
+
+import pytest
+import time_machine
+from asgiref.sync import async_to_sync, iscoroutinefunction, sync_to_async
+from django.db import connection
+from django.http import HttpResponse
+
+from ..middleware import (
+    ClockMiddleware,
+    QueryStatsMiddleware,
+    StaticFilesMiddleware,
+    TimingMiddleware,
+)
+from ..utils import clock, timing
+
+
+def test_clock_is_fixed_for_the_request():
+    times = []
+
+    with time_machine.travel(datetime(2025, 1, 1, 9, tzinfo=tz.utc)) as traveller:
+
+        def get_response(request):
+            times.append(clock.now())
+            traveller.shift(60)
+            times.append(clock.now())
+
+        ClockMiddleware(get_response)(None)
+
+    assert times[0] == times[1]
+
+
+@pytest.mark.django_db
+class TestQueryStatsMiddleware:
+    def get_response(self, request):
+        with connection.cursor() as cursor:
+            for id in range(3):
+                cursor.execute("SELECT %s", [id])
+            cursor.execute("SELECT 1 WHERE 1 IN (%s, %s)", [1, 2])
+
+        return HttpResponse("ok")
+
+    def test_adds_a_server_timing_header(self, rf):
+        response = QueryStatsMiddleware(self.get_response)(rf.get("/"))
+
+        assert response.headers["Server-Timing"].startswith("db;dur=")
+        assert response.headers["Server-Timing"].endswith(';desc="4 queries"')
+
+    def test_counts_queries_for_async_requests(self, rf):
+        middleware = QueryStatsMiddleware(sync_to_async(self.get_response))
+
+        response = async_to_sync(middleware)(rf.get("/"))
+
+        assert response.headers["Server-Timing"].endswith(';desc="4 queries"')
+
+    def test_logs_query_stats(self, rf, caplog):
+        with caplog.at_level("INFO", logger="manage_breast_screening.core.middleware"):
+            QueryStatsMiddleware(self.get_response)(rf.get("/clinics/"))
+
+        [record] = caplog.records
+        assert record.getMessage().startswith("GET /clinics/ ran 4 queries")
+        assert record.query_count == 4
+        assert record.duplicate_query_count == 2
+        assert record.most_repeated_query == "SELECT %s"
+        assert record.most_repeated_query_count == 3
+        assert record.slowest_query is not None
+
+
+class TestTimingMiddleware:
+    def test_adds_server_timing_for_each_phase(self, rf):
+        def view(request):
+            with timing.phase("presenter"):
+                pass
+            return HttpResponse("ok")
+
+        response = TimingMiddleware(view)(rf.get("/"))
+
+        metrics = [
+            metric.split(";")[0]
+            for metric in response.headers["Server-Timing"].split(", ")
+        ]
+        assert metrics == ["presenter", "view"]
+
+    def test_logs_timings(self, rf, caplog):
+        def view(request):
+            with timing.phase("template"):
+                pass
+            return HttpResponse("ok")
+
+        with caplog.at_level("INFO", logger="manage_breast_screening.core.middleware"):
+            TimingMiddleware(view)(rf.get("/clinics/"))
+
+        [record] = caplog.records
+        assert record.getMessage().startswith("GET /clinics/ timings: template=")
+        assert set(record.timings_ms) == {"template", "view"}
+
+    def test_async_requests_stay_async(self, rf):
+        async def view(request):
+            with timing.phase("query"):
+                pass
+            return HttpResponse("ok")
+
+        middleware = TimingMiddleware(view)
+        response = async_to_sync(middleware)(rf.get("/"))
+
+        assert iscoroutinefunction(middleware)
+        assert response.headers["Server-Timing"].startswith("query;dur=")
+
+
+class TestStaticFilesMiddleware:
+    def test_async_requests_are_passed_on(self, rf, settings, tmp_path):
+        settings.STATIC_ROOT = tmp_path
+        settings.WHITENOISE_AUTOREFRESH = False
+
+        async def view(request):
+            return HttpResponse("ok")
+
+        middleware = StaticFilesMiddleware(view)
+        response = async_to_sync(middleware)(rf.get("/clinics/"))
+
+        assert iscoroutinefunction(middleware)
+        assert response.content == b"ok"
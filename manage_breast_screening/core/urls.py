@@ -31,5 +31,12 @@ urlpatterns = [
             namespace="mammograms",
         ),
     ),
+    path(
+        "participants/",
+        include(
+            "manage_breast_screening.participants.urls",
+            namespace="participants",
+        ),
+    ),
     path("", RedirectView.as_view(pattern_name="clinics:index")),
 ]
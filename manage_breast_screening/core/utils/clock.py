@@ -0,0 +1,55 @@
+"""
+The current date and time, in the local timezone (settings.TIME_ZONE).
+
+Use these instead of `date.today()` or `datetime.now()`, which would give
+the server's date rather than the date in the UK.
+
+Within a request, ClockMiddleware fixes the time when the request starts,
+so that everything on the page agrees on what "today" is.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import date, datetime
+
+from django.utils import timezone
+
+_frozen_now: ContextVar[datetime | None] = ContextVar("frozen_now", default=None)
+
+
+def now() -> datetime:
+    """
+    The current time, as an aware datetime in the local timezone
+    """
+    frozen = _frozen_now.get()
+    if frozen is not None:
+        return frozen
+
+    return timezone.localtime()
+
+
+def today() -> date:
+    """
+    The current date in the local timezone
+    """
+    return now().date()
+
+
+@contextmanager
+def frozen(at: datetime | None = None):
+    """
+    Fix the current time for the duration of the block.
+
+    By default the time is fixed at the point the block is entered. Pass `at`
+    to override the time, e.g. in tests.
+    """
+    if at is None:
+        at = timezone.now()
+    elif timezone.is_naive(at):
+        at = timezone.make_aware(at)
+
+    token = _frozen_now.set(timezone.localtime(at))
+    try:
+        yield
+    finally:
+        _frozen_now.reset(token)
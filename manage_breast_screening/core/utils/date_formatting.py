@@ -7,6 +7,9 @@ https://service-manual.nhs.uk/content/numbers-measurements-dates-time
 from datetime import date, datetime
 
 from dateutil.relativedelta import relativedelta
+from django.utils import timezone
+
+from . import clock
 
 
 def format_date(value):
@@ -17,7 +20,7 @@ def format_date(value):
     >>> format_date(date(2025, 1, 1))
     '1 January 2025'
     """
-    return value.strftime("%-d %B %Y")
+    return _localise(value).strftime("%-d %B %Y")
 
 
 def format_relative_date(value: datetime | date):
@@ -25,9 +28,9 @@ def format_relative_date(value: datetime | date):
     Format a date relative to today as a number of days.
     """
     if isinstance(value, datetime):
-        value = value.date()
+        value = _localise(value).date()
 
-    today = date.today()
+    today = clock.today()
     days = (value - today).days
 
     amount = _format_date_difference(value, today)
@@ -88,6 +91,7 @@ def format_time(value):
     >>> format_time(time(0))
     'midnight'
     """
+    value = _localise(value)
     if value.minute == 0:
         if value.hour == 0:
             return "midnight"
@@ -98,6 +102,17 @@ def format_time(value):
     return value.strftime("%-I:%M%p").lower()
 
 
+def _localise(value):
+    """
+    Convert aware datetimes to the local timezone, so that they are displayed
+    in UK time rather than UTC.
+    """
+    if isinstance(value, datetime) and timezone.is_aware(value):
+        return timezone.localtime(value)
+
+    return value
+
+
 def format_time_range(value):
     """
     Format a dictionary containing "start_time" and "end_time"
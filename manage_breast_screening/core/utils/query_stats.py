@@ -0,0 +1,79 @@
+"""
+Statistics about the SQL queries run while handling a request.
+"""
+
+import re
+from collections import Counter
+from time import perf_counter
+
+# Collapse IN lists, so that queries which only differ in the number of
+# values have the same fingerprint
+_PLACEHOLDER_LIST = re.compile(r"\(\s*%s(?:\s*,\s*%s)+\s*\)")
+
+
+def fingerprint(sql: str) -> str:
+    """
+    Normalise a statement so that repeats of the same query can be counted
+
+    >>> fingerprint('SELECT * FROM "a" WHERE "a"."id" IN (%s, %s, %s)')
+    'SELECT * FROM "a" WHERE "a"."id" IN (...)'
+    """
+    return _PLACEHOLDER_LIST.sub("(...)", sql)
+
+
+class QueryStats:
+    """
+    An execute wrapper that records the number and duration of the queries
+    that pass through it.
+    See https://docs.djangoproject.com/en/5.2/topics/db/instrumentation/
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.slowest_duration = 0.0
+        self.slowest_sql = None
+        self._fingerprints = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        started = perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.record(sql, perf_counter() - started)
+
+    def record(self, sql, duration):
+        self.count += 1
+        self.duration += duration
+        self._fingerprints[fingerprint(sql)] += 1
+        if duration > self.slowest_duration:
+            self.slowest_duration = duration
+            self.slowest_sql = sql
+
+    @property
+    def duplicates(self) -> dict[str, int]:
+        """
+        Statements that ran more than once, with the number of times they ran.
+        Lots of these usually means a query is being run in a loop (N+1).
+        """
+        return {sql: n for sql, n in self._fingerprints.most_common() if n > 1}
+
+    @property
+    def duplicate_count(self) -> int:
+        """
+        The number of queries that repeated an earlier one
+        """
+        return sum(n - 1 for n in self.duplicates.values())
+
+    def as_dict(self) -> dict:
+        duplicates = self.duplicates
+        most_repeated = next(iter(duplicates.items()), (None, 0))
+        return {
+            "query_count": self.count,
+            "query_ms": round(self.duration * 1000, 1),
+            "duplicate_query_count": self.duplicate_count,
+            "most_repeated_query": most_repeated[0],
+            "most_repeated_query_count": most_repeated[1],
+            "slowest_query": self.slowest_sql,
+            "slowest_query_ms": round(self.slowest_duration * 1000, 1),
+        }
@@ -0,0 +1,26 @@
+"""
+Server-Timing response headers, which show up in the browser's dev tools.
+https://developer.mozilla.org/en-US/docs/Web/HTTP/Reference/Headers/Server-Timing
+"""
+
+
+def format_metric(name: str, duration: float, description: str | None = None) -> str:
+    """
+    Format a single metric. The duration is in seconds.
+
+    >>> format_metric("db", 0.01234, "3 queries")
+    'db;dur=12.3;desc="3 queries"'
+    """
+    metric = f"{name};dur={duration * 1000:.1f}"
+    if description:
+        metric += f';desc="{description}"'
+    return metric
+
+
+def add_server_timing(response, name, duration, description=None):
+    """
+    Add a metric to the response, keeping any that are already there
+    """
+    metric = format_metric(name, duration, description)
+    existing = response.headers.get("Server-Timing")
+    response.headers["Server-Timing"] = f"{existing}, {metric}" if existing else metric
@@ -0,0 +1,32 @@
+from datetime import date, datetime
+from datetime import timezone as tz
+from zoneinfo import ZoneInfo
+
+import time_machine
+
+from .. import clock
+
+
+@time_machine.travel(datetime(2025, 6, 1, 23, 30, tzinfo=tz.utc))
+def test_today_is_the_uk_date():
+    assert clock.today() == date(2025, 6, 2)
+
+
+@time_machine.travel(datetime(2025, 6, 1, 12, tzinfo=tz.utc))
+def test_now_is_in_the_local_timezone():
+    assert clock.now() == datetime(2025, 6, 1, 13, tzinfo=ZoneInfo("Europe/London"))
+    assert clock.now().tzinfo == ZoneInfo("Europe/London")
+
+
+def test_frozen_fixes_the_time():
+    with time_machine.travel(datetime(2025, 1, 1, 9, tzinfo=tz.utc)) as traveller:
+        with clock.frozen():
+            traveller.shift(24 * 60 * 60)
+            assert clock.today() == date(2025, 1, 1)
+
+        assert clock.today() == date(2025, 1, 2)
+
+
+def test_frozen_at_overrides_the_time():
+    with clock.frozen(datetime(2020, 2, 29, 12, tzinfo=tz.utc)):
+        assert clock.today() == date(2020, 2, 29)
@@ -0,0 +1,31 @@
+from ..query_stats import QueryStats
+
+
+def test_query_stats():
+    stats = QueryStats()
+
+    stats.record("SELECT * FROM a WHERE id = %s", 0.002)
+    stats.record("SELECT * FROM b WHERE id IN (%s, %s)", 0.005)
+    stats.record("SELECT * FROM a WHERE id = %s", 0.001)
+    stats.record("SELECT * FROM b WHERE id IN (%s, %s, %s)", 0.001)
+    stats.record("SELECT * FROM a WHERE id = %s", 0.001)
+
+    assert stats.count == 5
+    assert round(stats.duration, 3) == 0.010
+    assert stats.duplicates == {
+        "SELECT * FROM a WHERE id = %s": 3,
+        "SELECT * FROM b WHERE id IN (...)": 2,
+    }
+    assert stats.duplicate_count == 3
+    assert stats.slowest_sql == "SELECT * FROM b WHERE id IN (%s, %s)"
+    assert stats.as_dict()["slowest_query_ms"] == 5.0
+
+
+def test_wraps_execute():
+    stats = QueryStats()
+
+    def execute(sql, params, many, context):
+        return "result"
+
+    assert stats(execute, "SELECT 1", None, False, {}) == "result"
+    assert stats.count == 1
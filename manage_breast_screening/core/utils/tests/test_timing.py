@@ -0,0 +1,25 @@
+from .. import timing
+
+
+def test_phases_are_not_recorded_outside_a_request():
+    with timing.phase("presenter"):
+        pass
+
+    assert timing.current() is None
+
+
+def test_phases_add_up():
+    @timing.phase("presenter")
+    def build():
+        pass
+
+    with timing.recording() as timings:
+        build()
+        with timing.phase("presenter"):
+            pass
+        with timing.phase("template"):
+            pass
+
+    assert set(timings.durations) == {"presenter", "template"}
+    assert timings.durations["presenter"] > 0
+    assert timing.current() is None
@@ -0,0 +1,84 @@
+"""
+Time the phases of handling a request, e.g. building presenters and
+rendering templates.
+
+TimingMiddleware starts recording at the start of each request. Outside of
+a request, phases aren't recorded.
+
+    with timing.phase("presenter"):
+        presenter = ClinicsPresenter(...)
+
+or
+
+    @timing.phase("presenter")
+    def build_presenter(...):
+        ...
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+
+
+class Timings:
+    """
+    The total time spent in each phase, in seconds. A phase that is entered
+    more than once, e.g. rendering several templates, is added up.
+    """
+
+    def __init__(self):
+        self.durations: dict[str, float] = {}
+
+    def add(self, name: str, duration: float):
+        self.durations[name] = self.durations.get(name, 0.0) + duration
+
+    def as_dict(self) -> dict[str, float]:
+        """
+        Durations in milliseconds
+
+        >>> timings = Timings()
+        >>> timings.add("template", 0.0012)
+        >>> timings.add("template", 0.0003)
+        >>> timings.as_dict()
+        {'template': 1.5}
+        """
+        return {
+            name: round(duration * 1000, 1) for name, duration in self.durations.items()
+        }
+
+
+_current: ContextVar[Timings | None] = ContextVar("timings", default=None)
+
+
+def current() -> Timings | None:
+    return _current.get()
+
+
+@contextmanager
+def recording():
+    """
+    Record phase timings until the block exits
+    """
+    timings = Timings()
+    token = _current.set(timings)
+    try:
+        yield timings
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def phase(name: str):
+    """
+    Add the time spent in the block (or decorated function) to the named phase
+    """
+    timings = _current.get()
+    if timings is None:
+        yield
+        return
+
+    started = perf_counter()
+    try:
+        yield
+    finally:
+        timings.add(name, perf_counter() - started)
@@ -43,7 +43,7 @@ def present_secondary_nav(id):
 class AppointmentPresenter:
     def __init__(self, appointment):
         self._appointment = appointment
-        self._last_known_screening = appointment.screening_episode.previous()
+        self._last_known_screening_date = self._previous_screening_date(appointment)
 
         self.allStatuses = Status
         self.id = appointment.id
@@ -52,6 +52,14 @@ class AppointmentPresenter:
             appointment.screening_episode.participant
         )
 
+    @staticmethod
+    def _previous_screening_date(appointment):
+        # Use the annotation from with_previous_screening_date if it's there
+        if hasattr(appointment, "previous_screening_at"):
+            return appointment.previous_screening_at
+
+        return appointment.screening_episode.previous_screening_date()
+
     @property
     def status(self):
         colour = status_colour(self._appointment.status)
@@ -67,16 +75,14 @@ class AppointmentPresenter:
     def last_known_screening(self):
         return (
             {
-                "date": format_date(self._last_known_screening.created_at),
-                "relative_date": format_relative_date(
-                    self._last_known_screening.created_at
-                ),
+                "date": format_date(self._last_known_screening_date),
+                "relative_date": format_relative_date(self._last_known_screening_date),
                 # TODO: the current model doesn't allow for knowing the type and location of a historical screening
                 # if it is not tied to one of our clinic slots.
                 "location": None,
                 "type": None,
             }
-            if self._last_known_screening
+            if self._last_known_screening_date
             else {}
         )
 
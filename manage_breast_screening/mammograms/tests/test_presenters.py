@@ -6,11 +6,7 @@ import pytest
 import time_machine
 
 from manage_breast_screening.clinics.models import ClinicSlot
-from manage_breast_screening.participants.models import (
-    Appointment,
-    Participant,
-    ScreeningEpisode,
-)
+from manage_breast_screening.participants.models import Appointment, Participant
 
 from ..presenters import AppointmentPresenter, ClinicSlotPresenter, ParticipantPresenter
 
@@ -71,9 +67,9 @@ class TestAppointmentPresenter:
 
     @time_machine.travel(datetime(2025, 1, 1, tzinfo=tz.utc))
     def test_last_known_screening(self, mock_appointment):
-        mock_screening = MagicMock(spec=ScreeningEpisode)
-        mock_screening.created_at = datetime(2015, 1, 1)
-        mock_appointment.screening_episode.previous.return_value = mock_screening
+        mock_appointment.screening_episode.previous_screening_date.return_value = (
+            datetime(2015, 1, 1)
+        )
 
         result = AppointmentPresenter(mock_appointment)
 
@@ -1,8 +1,16 @@
 import pytest
+from asgiref.sync import async_to_sync
+from django.http import Http404
 from django.urls import reverse
 from pytest_django.asserts import assertContains, assertRedirects
 
-from manage_breast_screening.participants.tests.factories import AppointmentFactory
+from manage_breast_screening.participants.tests.factories import (
+    AppointmentFactory,
+    ParticipantAddressFactory,
+    ScreeningEpisodeFactory,
+)
+
+from .. import views
 
 
 @pytest.fixture
@@ -12,6 +20,20 @@ def appointment():
 
 @pytest.mark.django_db
 class TestStartScreening:
+    def test_renders_in_a_constant_number_of_queries(
+        self, client, appointment, django_assert_num_queries
+    ):
+        participant = appointment.screening_episode.participant
+        ParticipantAddressFactory.create(participant=participant)
+        ScreeningEpisodeFactory.create_batch(3, participant=participant)
+
+        with django_assert_num_queries(1):
+            response = client.get(
+                reverse("mammograms:start_screening", kwargs={"id": appointment.pk})
+            )
+
+        assertContains(response, participant.full_name)
+
     def test_appointment_continued(self, client, appointment):
         response = client.post(
             reverse("mammograms:start_screening", kwargs={"id": appointment.pk}),
@@ -46,6 +68,42 @@ class TestStartScreening:
         assertContains(response, "There is a problem")
 
 
+@pytest.mark.django_db
+class TestAsyncStartScreening:
+    @pytest.fixture
+    def view(self):
+        return async_to_sync(views.AsyncStartScreening.as_view())
+
+    def test_renders(self, view, async_rf, appointment, django_assert_num_queries):
+        request = async_rf.get(
+            reverse("mammograms:start_screening", kwargs={"id": appointment.pk})
+        )
+
+        with django_assert_num_queries(1):
+            response = view(request, id=appointment.pk)
+
+        assertContains(response, appointment.screening_episode.participant.full_name)
+
+    def test_unknown_appointment_is_not_found(self, view, async_rf):
+        id = "ce662c8b-92dc-4c82-9d5d-1ddcb201e2b6"
+        request = async_rf.get(reverse("mammograms:start_screening", kwargs={"id": id}))
+
+        with pytest.raises(Http404):
+            view(request, id=id)
+
+    def test_appointment_continued(self, view, async_rf, appointment):
+        request = async_rf.post(
+            reverse("mammograms:start_screening", kwargs={"id": appointment.pk}),
+            {"decision": "continue"},
+        )
+
+        response = view(request, id=appointment.pk)
+
+        assert response.url == reverse(
+            "mammograms:ask_for_medical_information", kwargs={"id": appointment.pk}
+        )
+
+
 @pytest.mark.django_db
 class TestAskForMedicalInformation:
     def test_continue_to_record(self, client, appointment):
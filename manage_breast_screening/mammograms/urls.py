@@ -1,9 +1,14 @@
+from django.conf import settings
 from django.urls import path
 
 from . import views
 
 app_name = "mammograms"
 
+StartScreening = (
+    views.AsyncStartScreening if settings.ASYNC_VIEWS else views.StartScreening
+)
+
 urlpatterns = [
     path(
         "<uuid:id>/check-in/",
@@ -12,7 +17,7 @@ urlpatterns = [
     ),
     path(
         "<uuid:id>/start-screening/",
-        views.StartScreening.as_view(),
+        StartScreening.as_view(),
         name="start_screening",
     ),
     path(
@@ -1,11 +1,13 @@
 import logging
 
-from django.shortcuts import get_object_or_404, redirect, render
+from asgiref.sync import sync_to_async
+from django.shortcuts import aget_object_or_404, get_object_or_404, redirect, render
 from django.urls import reverse
 from django.views.decorators.http import require_http_methods
 from django.views.generic import FormView
 
-from manage_breast_screening.participants.models import Appointment, Participant
+from manage_breast_screening.core.utils import timing
+from manage_breast_screening.participants.models import Appointment
 
 from .forms import (
     AppointmentCannotGoAheadForm,
@@ -45,14 +47,36 @@ class BaseAppointmentForm(FormView):
         return self.kwargs["id"]
 
     def get_appointment(self):
-        return get_object_or_404(
-            Appointment.objects.prefetch_related(
-                "clinic_slot",
-                "screening_episode__participant",
-                "screening_episode__participant__address",
-            ),
-            pk=self.appointment_id,
-        )
+        """
+        Fetch the appointment along with its clinic, episode, participant,
+        address and previous screening date in one query. The result is reused
+        for the rest of the request.
+        """
+        if not hasattr(self, "_appointment"):
+            with timing.phase("query"):
+                self._appointment = get_object_or_404(
+                    self._appointment_queryset(), pk=self.appointment_id
+                )
+
+        return self._appointment
+
+    async def aget_appointment(self):
+        """
+        Async version of `get_appointment`
+        """
+        if not hasattr(self, "_appointment"):
+            with timing.phase("query"):
+                self._appointment = await aget_object_or_404(
+                    self._appointment_queryset(), pk=self.appointment_id
+                )
+
+        return self._appointment
+
+    def _appointment_queryset(self):
+        return Appointment.objects.select_related(
+            "clinic_slot__clinic",
+            "screening_episode__participant__address",
+        ).with_previous_screening_date()
 
 
 class StartScreening(BaseAppointmentForm):
@@ -63,7 +87,8 @@ class StartScreening(BaseAppointmentForm):
         context = super().get_context_data(**kwargs)
 
         appointment = self.get_appointment()
-        presenter = AppointmentPresenter(appointment)
+        with timing.phase("presenter"):
+            presenter = AppointmentPresenter(appointment)
 
         context.update(
             {
@@ -98,6 +123,25 @@ class StartScreening(BaseAppointmentForm):
             )
 
 
+class AsyncStartScreening(StartScreening):
+    """
+    StartScreening for use when serving ASGI. The appointment is fetched
+    without blocking the event loop, so rendering the page doesn't need the
+    database. Django requires a view's handlers to be all sync or all async,
+    so the form handling runs in a thread, as it would for a sync view.
+    """
+
+    async def get(self, request, *args, **kwargs):
+        await self.aget_appointment()
+        return super().get(request, *args, **kwargs)
+
+    async def post(self, request, *args, **kwargs):
+        return await sync_to_async(super().post)(request, *args, **kwargs)
+
+    async def put(self, *args, **kwargs):
+        return await self.post(*args, **kwargs)
+
+
 class AskForMedicalInformation(BaseAppointmentForm):
     template_name = "ask_for_medical_information.jinja"
     form_class = AskForMedicalInformationForm
@@ -105,7 +149,7 @@ class AskForMedicalInformation(BaseAppointmentForm):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         id = self.kwargs["id"]
-        participant = Participant.objects.get(screeningepisode__appointment__id=id)
+        participant = self.get_appointment().screening_episode.participant
 
         context.update(
             {
@@ -142,10 +186,7 @@ class RecordMedicalInformation(BaseAppointmentForm):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        id = self.kwargs["id"]
-        participant = get_object_or_404(
-            Participant, screeningepisode__appointment__id=id
-        )
+        participant = self.get_appointment().screening_episode.participant
         context.update(
             {
                 "title": "Record medical information",
@@ -1,4 +1,5 @@
 from django.contrib import admin
+from django.contrib.admin.views.main import ORDER_VAR
 
 from .models import Appointment, Participant, ParticipantAddress, ScreeningEpisode
 
@@ -9,6 +10,23 @@ class AddressInline(admin.TabularInline):
 
 class ParticipantAdmin(admin.ModelAdmin):
     inlines = [AddressInline]
+    list_display = ["full_name", "nhs_number", "date_of_birth"]
+    search_fields = ["first_name", "last_name", "nhs_number", "address__postcode"]
+    search_help_text = "Search by name, NHS number or postcode"
+
+    def get_search_results(self, request, queryset, search_term):
+        # Use the trigram indexes rather than the default ILIKE on every
+        # field. The results are ordered best match first, unless sorted by
+        # a column, in which case the changelist has already ordered
+        # `queryset` by it.
+        if not search_term:
+            return queryset, False
+
+        results = queryset.search(search_term)
+        if ORDER_VAR in request.GET:
+            results = results.order_by(*queryset.query.order_by)
+
+        return results, False
 
 
 class AppointmentAdmin(admin.ModelAdmin):
@@ -17,12 +35,21 @@ class AppointmentAdmin(admin.ModelAdmin):
         "clinic_slot__starts_at",
         "clinic_slot__duration_in_minutes",
         "status",
+        "previous_screening",
     ]
+    list_select_related = ["clinic_slot", "screening_episode__participant"]
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).with_previous_screening_date()
 
     @admin.display()
     def name(self, obj):
         return obj.screening_episode.participant.full_name
 
+    @admin.display(ordering="previous_screening_at")
+    def previous_screening(self, obj):
+        return obj.previous_screening_at
+
 
 admin.site.register(Participant, ParticipantAdmin)
 admin.site.register(Appointment, AppointmentAdmin)
@@ -0,0 +1,334 @@
+"""
+Import screening cohorts: participants invited in bulk by upstream systems,
+in CSV or JSON lines files.
+
+Rows are validated and normalised as they're read, and streamed into a
+temporary staging table with COPY. Once every row is staged, they're merged
+into the participant and address tables with a couple of upserts:
+participants already known by their NHS number are updated, and the rest
+are inserted.
+"""
+
+import csv
+import json
+from dataclasses import dataclass, field
+from datetime import date
+from functools import partial
+from time import perf_counter
+from typing import IO, Iterable, Iterator
+
+from django.core.exceptions import ValidationError
+from django.core.validators import validate_email
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.utils import timezone
+
+from .models import Participant, ParticipantAddress
+from .validators import normalise_nhs_number, normalise_postcode
+
+ADDRESS_LINE_FIELDS = [f"address_line_{n}" for n in range(1, 6)]
+
+FIELDS = [
+    "nhs_number",
+    "first_name",
+    "last_name",
+    "date_of_birth",
+    "gender",
+    "phone",
+    "email",
+    "ethnic_group",
+    "risk_level",
+    *ADDRESS_LINE_FIELDS,
+    "postcode",
+]
+
+ETHNIC_GROUPS_BY_NAME = {
+    value.casefold(): value for value, _ in Participant.ETHNIC_GROUP_CHOICES
+}
+
+DEFAULT_RISK_LEVEL = "Routine"
+
+STAGING_TABLE = "cohort_import_staging"
+
+
+@dataclass(frozen=True)
+class CohortRow:
+    nhs_number: str
+    first_name: str
+    last_name: str
+    date_of_birth: date
+    gender: str
+    phone: str
+    email: str
+    ethnic_group: str | None
+    risk_level: str
+    address_lines: list[str]
+    postcode: str | None
+
+    @classmethod
+    def from_record(cls, record, today: date | None = None) -> "CohortRow":
+        """
+        Validate and normalise a row from a cohort file. Raises a
+        ValidationError with every problem with the row.
+        """
+        today = today or timezone.localdate()
+        if not isinstance(record, dict):
+            raise ValidationError("Row is not an object")
+
+        values = {
+            key: str(value).strip()
+            for key, value in record.items()
+            if key in FIELDS and value is not None
+        }
+        errors = {}
+
+        def clean(name, normalise=None, required=False):
+            value = values.get(name, "")
+            if not value:
+                if required:
+                    errors[name] = ["This field is required"]
+                return None
+            try:
+                return normalise(value) if normalise else value
+            except ValidationError as e:
+                errors[name] = e.messages
+
+        row = {
+            "nhs_number": clean("nhs_number", normalise_nhs_number, required=True),
+            "first_name": clean("first_name", required=True),
+            "last_name": clean("last_name", required=True),
+            "date_of_birth": clean(
+                "date_of_birth",
+                partial(parse_date_of_birth, today=today),
+                required=True,
+            ),
+            "gender": clean("gender") or "",
+            "phone": clean("phone") or "",
+            "email": clean("email", normalise_email) or "",
+            "ethnic_group": clean("ethnic_group", normalise_ethnic_group),
+            "risk_level": clean("risk_level") or DEFAULT_RISK_LEVEL,
+            "address_lines": [
+                values[name] for name in ADDRESS_LINE_FIELDS if values.get(name)
+            ],
+            "postcode": clean("postcode", normalise_postcode),
+        }
+
+        if errors:
+            raise ValidationError(errors)
+
+        return cls(**row)
+
+    def as_copy_row(self) -> list:
+        return [
+            self.nhs_number,
+            self.first_name,
+            self.last_name,
+            self.date_of_birth,
+            self.gender,
+            self.phone,
+            self.email,
+            self.ethnic_group,
+            self.risk_level,
+            self.address_lines,
+            self.postcode,
+        ]
+
+
+def parse_date_of_birth(value: str, today: date) -> date:
+    """
+    >>> parse_date_of_birth("1959-07-22", today=date(2025, 1, 1))
+    datetime.date(1959, 7, 22)
+    """
+    try:
+        date_of_birth = date.fromisoformat(value)
+    except ValueError:
+        raise ValidationError("Enter a date in the format YYYY-MM-DD") from None
+
+    if date_of_birth > today:
+        raise ValidationError("Date of birth must be in the past")
+    return date_of_birth
+
+
+def normalise_email(value: str) -> str:
+    validate_email(value)
+    return value.lower()
+
+
+def normalise_ethnic_group(value: str) -> str:
+    """
+    Match an ethnic group to one of Participant.ETHNIC_GROUP_CHOICES,
+    ignoring case
+
+    >>> normalise_ethnic_group("irish")
+    'Irish'
+    """
+    try:
+        return ETHNIC_GROUPS_BY_NAME[value.casefold()]
+    except KeyError:
+        raise ValidationError(f"Unknown ethnic group: {value}") from None
+
+
+def read_records(file: IO[str], format: str) -> Iterator[tuple[int, object]]:
+    """
+    Read the rows of a cohort file, yielding each one with its line number
+    """
+    match format:
+        case "csv":
+            reader = csv.DictReader(file)
+            for record in reader:
+                yield reader.line_num, record
+        case "jsonl":
+            for line_number, line in enumerate(file, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    yield line_number, json.loads(line)
+                except json.JSONDecodeError:
+                    yield line_number, None
+        case _:
+            raise ValueError(f"Unknown cohort file format: {format}")
+
+
+@dataclass
+class RejectedRow:
+    line: int
+    errors: list[str]
+
+
+@dataclass
+class ImportResult:
+    read: int = 0
+    inserted: int = 0
+    updated: int = 0
+    rejected: list[RejectedRow] = field(default_factory=list)
+    seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.read / self.seconds if self.seconds else 0.0
+
+
+class CohortImporter:
+    """
+    Load a cohort into the participant tables in one transaction. Rejected
+    rows are reported, and don't stop the rest of the cohort being imported.
+    """
+
+    def __init__(self, using=DEFAULT_DB_ALIAS):
+        self.using = using
+
+    def run(self, records: Iterable[tuple[int, object]]) -> ImportResult:
+        started = perf_counter()
+        result = ImportResult()
+        connection = connections[self.using]
+
+        with transaction.atomic(using=self.using), connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                CREATE TEMPORARY TABLE {STAGING_TABLE} (
+                    nhs_number text NOT NULL,
+                    first_name text NOT NULL,
+                    last_name text NOT NULL,
+                    date_of_birth date NOT NULL,
+                    gender text NOT NULL,
+                    phone text NOT NULL,
+                    email text NOT NULL,
+                    ethnic_group text,
+                    risk_level text NOT NULL,
+                    address_lines text[] NOT NULL,
+                    postcode text
+                )
+                """
+            )
+            self.stage(cursor, records, result)
+            cursor.execute(f"ANALYZE {STAGING_TABLE}")
+            self.merge(cursor, result)
+            cursor.execute(f"DROP TABLE {STAGING_TABLE}")
+
+        result.seconds = perf_counter() - started
+        return result
+
+    def stage(self, cursor, records, result):
+        today = timezone.localdate()
+        staged = set()
+
+        with cursor.copy(f"COPY {STAGING_TABLE} FROM STDIN") as copy:
+            for line, record in records:
+                result.read += 1
+                try:
+                    row = CohortRow.from_record(record, today)
+                except ValidationError as e:
+                    result.rejected.append(RejectedRow(line, format_errors(e)))
+                    continue
+
+                if row.nhs_number in staged:
+                    result.rejected.append(
+                        RejectedRow(line, ["nhs_number: Duplicate NHS number"])
+                    )
+                    continue
+
+                staged.add(row.nhs_number)
+                copy.write_row(row.as_copy_row())
+
+    def merge(self, cursor, result):
+        participants = Participant._meta.db_table
+        addresses = ParticipantAddress._meta.db_table
+        now = timezone.now()
+
+        # Upsert on the unique NHS number, so concurrent imports of the same
+        # participants wait for each other's rows rather than the whole table.
+        # xmax is only zero for rows that were inserted, not updated.
+        cursor.execute(
+            f"""
+            WITH upserted AS (
+                INSERT INTO {participants} AS p (
+                    id, created_at, updated_at, nhs_number, first_name,
+                    last_name, date_of_birth, gender, phone, email, ethnic_group,
+                    risk_level, extra_needs
+                )
+                SELECT
+                    gen_random_uuid(), %s, %s, s.nhs_number, s.first_name,
+                    s.last_name, s.date_of_birth, s.gender, s.phone, s.email,
+                    s.ethnic_group, s.risk_level, '[]'::jsonb
+                FROM {STAGING_TABLE} AS s
+                ON CONFLICT (nhs_number) DO UPDATE
+                SET first_name = excluded.first_name,
+                    last_name = excluded.last_name,
+                    date_of_birth = excluded.date_of_birth,
+                    gender = excluded.gender,
+                    phone = excluded.phone,
+                    email = excluded.email,
+                    ethnic_group = excluded.ethnic_group,
+                    risk_level = excluded.risk_level,
+                    updated_at = excluded.updated_at
+                RETURNING p.xmax = 0 AS inserted
+            )
+            SELECT
+                count(*) FILTER (WHERE inserted),
+                count(*) FILTER (WHERE NOT inserted)
+            FROM upserted
+            """,
+            [now, now],
+        )
+        result.inserted, result.updated = cursor.fetchone()
+
+        cursor.execute(
+            f"""
+            INSERT INTO {addresses} (id, participant_id, lines, postcode)
+            SELECT gen_random_uuid(), p.id, s.address_lines, s.postcode
+            FROM {STAGING_TABLE} AS s
+            JOIN {participants} AS p ON p.nhs_number = s.nhs_number
+            WHERE s.postcode IS NOT NULL OR cardinality(s.address_lines) > 0
+            ON CONFLICT (participant_id) DO UPDATE
+            SET lines = excluded.lines, postcode = excluded.postcode
+            """
+        )
+
+
+def format_errors(error: ValidationError) -> list[str]:
+    if hasattr(error, "error_dict"):
+        return [
+            f"{name}: {message}"
+            for name, messages in error.message_dict.items()
+            for message in messages
+        ]
+    return error.messages
@@ -0,0 +1,60 @@
+import csv
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from manage_breast_screening.participants.cohort_import import (
+    FIELDS,
+    CohortImporter,
+    read_records,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Import a cohort of participants from a CSV or JSON lines file, "
+        "updating any that already exist (matched on NHS number). "
+        f"Columns: {', '.join(FIELDS)}"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", type=Path)
+        parser.add_argument(
+            "--format",
+            choices=["csv", "jsonl"],
+            help="File format. By default, this comes from the file extension.",
+        )
+        parser.add_argument(
+            "--rejects",
+            type=Path,
+            help="Write the rejected rows, and why, to this CSV file",
+        )
+
+    def handle(self, *args, path, format, rejects, **options):
+        format = format or path.suffix.lstrip(".").lower()
+        if format not in ("csv", "jsonl"):
+            raise CommandError(f"Can't tell the format of {path}, use --format")
+
+        try:
+            with path.open(newline="", encoding="utf-8-sig") as file:
+                result = CohortImporter().run(read_records(file, format))
+        except OSError as e:
+            raise CommandError(f"Failed to read {path}: {e}") from e
+
+        self.stdout.write(
+            f"Read {result.read:,} rows in {result.seconds:.1f}s "
+            f"({result.rows_per_second:,.0f} rows/s): {result.inserted:,} "
+            f"inserted, {result.updated:,} updated, {len(result.rejected):,} rejected"
+        )
+
+        if rejects:
+            with rejects.open("w", newline="") as file:
+                writer = csv.writer(file)
+                writer.writerow(["line", "errors"])
+                for row in result.rejected:
+                    writer.writerow([row.line, "; ".join(row.errors)])
+        else:
+            for row in result.rejected[:10]:
+                self.stderr.write(f"Line {row.line}: {'; '.join(row.errors)}")
+            if len(result.rejected) > 10:
+                self.stderr.write("Use --rejects to see all of the rejected rows")
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-18 15:58
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Build the indexes without locking the tables against writes
+    atomic = False
+
+    dependencies = [
+        ('clinics', '0013_add_clinic_indexes'),
+        ('participants', '0011_alter_appointment_clinic_slot_and_more'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='appointment',
+            index=models.Index(fields=['clinic_slot', 'status'], name='appointment_slot_status_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='screeningepisode',
+            index=models.Index(fields=['participant', '-created_at'], name='episode_participant_idx'),
+        ),
+    ]
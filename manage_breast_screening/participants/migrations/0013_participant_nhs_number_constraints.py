@@ -0,0 +1,111 @@
+# Generated by Django 5.2.18 on 2026-10-18 16:45
+
+import manage_breast_screening.participants.validators
+from django.contrib.postgres.operations import AddConstraintNotValid, ValidateConstraint
+from django.db import migrations, models
+from django.db.models import Count
+
+# How many of each problem to list when the existing numbers can't be
+# constrained
+EXAMPLES = 10
+
+
+def check_nhs_numbers(apps, schema_editor):
+    """
+    Refuse to build the constraints if existing rows would break them, rather
+    than leave the unique index INVALID part way through a concurrent build.
+    Duplicate and malformed NHS numbers need fixing by hand: which of two
+    participants is the right one isn't something a migration can decide.
+    """
+    Participant = apps.get_model('participants', 'Participant')
+    participants = Participant.objects.using(schema_editor.connection.alias)
+
+    duplicates = (
+        participants.values('nhs_number')
+        .annotate(count=Count('pk'))
+        .filter(count__gt=1)
+        .order_by('nhs_number')
+    )
+    malformed = participants.exclude(nhs_number__regex=r'^[0-9]{10}$').order_by('pk')
+
+    problems = []
+    if duplicate_count := duplicates.count():
+        problems.append(
+            f'NHS numbers shared by more than one participant ({duplicate_count}): '
+            + ', '.join(
+                f"{row['nhs_number']} ({row['count']} participants)"
+                for row in duplicates[:EXAMPLES]
+            )
+        )
+    if malformed_count := malformed.count():
+        problems.append(
+            f'Participants whose NHS number is not 10 digits ({malformed_count}): '
+            + ', '.join(
+                f'{participant.pk} ({participant.nhs_number!r})'
+                for participant in malformed[:EXAMPLES]
+            )
+        )
+
+    if problems:
+        raise RuntimeError(
+            'Fix these participants, then run the migration again.\n'
+            + '\n'.join(problems)
+        )
+
+
+class Migration(migrations.Migration):
+    # Build the unique index and check the existing rows without locking the
+    # table against writes
+    atomic = False
+
+    dependencies = [
+        ('participants', '0012_add_appointment_and_episode_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='participant',
+            name='nhs_number',
+            field=models.TextField(validators=[manage_breast_screening.participants.validators.validate_nhs_number]),
+        ),
+        migrations.RunSQL(
+            sql=r"""
+            UPDATE participants_participant
+            SET nhs_number = regexp_replace(nhs_number, '[\s-]', '', 'g')
+            WHERE nhs_number ~ '[\s-]'
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.RunPython(check_nhs_numbers, migrations.RunPython.noop),
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                # A build that failed part way leaves an INVALID index behind
+                migrations.RunSQL(
+                    sql='DROP INDEX CONCURRENTLY IF EXISTS participant_nhs_number_unique',
+                    reverse_sql=migrations.RunSQL.noop,
+                ),
+                migrations.RunSQL(
+                    sql='CREATE UNIQUE INDEX CONCURRENTLY participant_nhs_number_unique ON participants_participant (nhs_number)',
+                    reverse_sql='DROP INDEX CONCURRENTLY IF EXISTS participant_nhs_number_unique',
+                ),
+                migrations.RunSQL(
+                    sql='ALTER TABLE participants_participant ADD CONSTRAINT participant_nhs_number_unique UNIQUE USING INDEX participant_nhs_number_unique',
+                    reverse_sql='ALTER TABLE participants_participant DROP CONSTRAINT participant_nhs_number_unique',
+                ),
+            ],
+            state_operations=[
+                migrations.AddConstraint(
+                    model_name='participant',
+                    constraint=models.UniqueConstraint(fields=('nhs_number',), name='participant_nhs_number_unique'),
+                ),
+            ],
+        ),
+        AddConstraintNotValid(
+            model_name='participant',
+            constraint=models.CheckConstraint(condition=models.Q(('nhs_number__regex', '^[0-9]{10}$')), name='participant_nhs_number_digits'),
+        ),
+        ValidateConstraint(
+            model_name='participant',
+            name='participant_nhs_number_digits',
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-18 16:56
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.contrib.postgres.operations import AddIndexConcurrently, TrigramExtension
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Build the indexes without locking the tables against writes
+    atomic = False
+
+    dependencies = [
+        ('participants', '0013_participant_nhs_number_constraints'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        AddIndexConcurrently(
+            model_name='participant',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Concat('first_name', models.Value(' '), 'last_name', output_field=models.TextField()), name='gin_trgm_ops'), name='participant_name_trgm_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='participant',
+            index=models.Index(fields=['date_of_birth'], name='participant_dob_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='participantaddress',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['postcode'], name='address_postcode_trgm_idx', opclasses=['gin_trgm_ops']),
+        ),
+    ]
@@ -1,10 +1,23 @@
 import uuid
-from datetime import date
+from datetime import date, datetime, time, timedelta
 
 from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import TrigramSimilarity, TrigramWordSimilarity
+from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models import OuterRef, Q, Subquery, TextField, Value
+from django.db.models.functions import Concat, JSONObject
+from django.utils.timezone import get_current_timezone
 
 from ..core.models import BaseModel
+from ..core.utils import clock
+from .validators import (
+    NON_DIGITS,
+    normalise_nhs_number,
+    normalise_postcode,
+    validate_nhs_number,
+)
 
 # List of ethnic groups from
 # https://design-system.service.gov.uk/patterns/equality-information/
@@ -38,6 +51,98 @@ ETHNIC_GROUPS = {
 }
 
 
+def search_name():
+    """
+    A participant's first and last names, as indexed for searching by name
+    """
+    return Concat("first_name", Value(" "), "last_name", output_field=TextField())
+
+
+class ParticipantQuerySet(models.QuerySet):
+    def search(self, text: str = "", date_of_birth: date | None = None):
+        """
+        Find participants by name, postcode or NHS number, and optionally
+        date of birth. Each one is annotated with a `search_rank`, and the
+        best matches come first.
+
+        Text containing a digit is looked up as an NHS number if it is one,
+        the start of an NHS number if it is all digits, and otherwise as a
+        postcode or the start of one. Anything else is
+        matched against participants' names, allowing for typos and partial
+        words.
+        """
+        queryset = self
+        if date_of_birth is not None:
+            queryset = queryset.filter(date_of_birth=date_of_birth)
+
+        text = " ".join(text.split())
+        if not text:
+            queryset = queryset.annotate(search_rank=Value(1.0))
+        elif any(character.isdigit() for character in text):
+            queryset = queryset._search_numbers(text)
+        else:
+            # The names are matched with `search_name %> text`, which uses
+            # participant_name_trgm_idx
+            queryset = queryset.annotate(
+                search_name=search_name(),
+                search_rank=TrigramWordSimilarity(text, "search_name"),
+            ).filter(search_name__trigram_word_similar=text)
+
+        return queryset.order_by("-search_rank", "last_name", "first_name", "pk")
+
+    def _search_numbers(self, text):
+        try:
+            return self.filter(nhs_number=normalise_nhs_number(text)).annotate(
+                search_rank=Value(1.0)
+            )
+        except ValidationError:
+            pass
+
+        digits = NON_DIGITS.sub("", text)
+        if digits.isdigit():
+            # NHS numbers are all 10 digits, so the ones starting with `digits`
+            # are a range of the unique index, which a LIKE can't use
+            return self.filter(
+                nhs_number__gte=digits.ljust(10, "0"),
+                nhs_number__lte=digits.ljust(10, "9"),
+            ).annotate(search_rank=Value(1.0))
+
+        try:
+            postcodes = Q(address__postcode=normalise_postcode(text))
+        except ValidationError:
+            postcodes = Q(address__postcode__startswith=text.upper())
+
+        return self.filter(postcodes).annotate(
+            search_rank=TrigramSimilarity("address__postcode", text.upper())
+        )
+
+    def with_appointment_on(self, day: date):
+        """
+        Annotate each participant with `appointment`, a dict of the id, status
+        and start time of their first appointment on `day` that hasn't been
+        cancelled, or None. This is fetched in the same query.
+        """
+        tz = get_current_timezone()
+        starts = datetime.combine(day, time(), tzinfo=tz)
+        ends = datetime.combine(day + timedelta(days=1), time(), tzinfo=tz)
+
+        appointments = (
+            Appointment.objects.filter(
+                screening_episode__participant_id=OuterRef("pk"),
+                clinic_slot__starts_at__gte=starts,
+                clinic_slot__starts_at__lt=ends,
+            )
+            .exclude(status=Appointment.Status.CANCELLED)
+            .order_by("clinic_slot__starts_at")
+            .values(
+                json=JSONObject(
+                    id="pk", status="status", starts_at="clinic_slot__starts_at"
+                )
+            )[:1]
+        )
+        return self.annotate(appointment=Subquery(appointments))
+
+
 class Participant(BaseModel):
     PREFER_NOT_TO_SAY = "Prefer not to say"
     ETHNIC_GROUP_CHOICES = [
@@ -47,7 +152,7 @@ class Participant(BaseModel):
     first_name = models.TextField()
     last_name = models.TextField()
     gender = models.TextField()
-    nhs_number = models.TextField()
+    nhs_number = models.TextField(validators=[validate_nhs_number])
     phone = models.TextField()
     email = models.EmailField()
     date_of_birth = models.DateField()
@@ -55,12 +160,35 @@ class Participant(BaseModel):
     risk_level = models.TextField()
     extra_needs = models.JSONField(null=False, default=list, blank=True)
 
+    objects = ParticipantQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            GinIndex(
+                OpClass(search_name(), name="gin_trgm_ops"),
+                name="participant_name_trgm_idx",
+            ),
+            models.Index(fields=["date_of_birth"], name="participant_dob_idx"),
+        ]
+        constraints = [
+            # Also serves lookups by NHS number
+            models.UniqueConstraint(
+                fields=["nhs_number"], name="participant_nhs_number_unique"
+            ),
+            # Normalised to digits only, without spaces. The check digit is
+            # validated in Python, by validate_nhs_number.
+            models.CheckConstraint(
+                condition=Q(nhs_number__regex=r"^[0-9]{10}$"),
+                name="participant_nhs_number_digits",
+            ),
+        ]
+
     @property
     def full_name(self):
         return " ".join([name for name in [self.first_name, self.last_name] if name])
 
     def age(self):
-        today = date.today()
+        today = clock.today()
         if (today.month, today.day) >= (
             self.date_of_birth.month,
             self.date_of_birth.day,
@@ -86,32 +214,130 @@ class ParticipantAddress(models.Model):
     lines = ArrayField(models.CharField(), size=5, blank=True)
     postcode = models.CharField(blank=True, null=True)
 
+    class Meta:
+        indexes = [
+            # Searches by postcode, or the start of one
+            GinIndex(
+                fields=["postcode"],
+                opclasses=["gin_trgm_ops"],
+                name="address_postcode_trgm_idx",
+            ),
+        ]
+
+
+def previous_screening_date_subquery(episode_path=""):
+    """
+    A subquery for the creation date of the participant's most recent
+    screening episode other than the one found at `episode_path` from the
+    outer query.
+    """
+    prefix = f"{episode_path}__" if episode_path else ""
+
+    return Subquery(
+        ScreeningEpisode.objects.filter(
+            participant_id=OuterRef(f"{prefix}participant_id")
+        )
+        .exclude(pk=OuterRef(f"{prefix}pk"))
+        .order_by("-created_at")
+        .values("created_at")[:1]
+    )
+
+
+class ScreeningEpisodeQuerySet(models.QuerySet):
+    def with_previous_screening_date(self):
+        """
+        Annotate each episode with `previous_screening_at`, the equivalent of
+        ScreeningEpisode.previous_screening_date(), in the same query.
+        """
+        return self.annotate(previous_screening_at=previous_screening_date_subquery())
+
 
 class ScreeningEpisode(BaseModel):
     participant = models.ForeignKey(Participant, on_delete=models.CASCADE)
 
-    def screening_history(self):
+    objects = ScreeningEpisodeQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["participant", "-created_at"],
+                name="episode_participant_idx",
+            ),
+        ]
+
+    def _other_episodes(self):
         """
-        Return all previous screening episodes, excluding this one, prefetching
-        their appointment details as well.
+        The participant's other screening episodes, most recent first
         """
         return (
-            ScreeningEpisode.objects.prefetch_related(
-                "appointment_set__clinic_slot__clinic__setting__provider"
-            )
-            .filter(participant__pk=self.participant.pk)
+            ScreeningEpisode.objects.filter(participant_id=self.participant_id)
             .exclude(pk=self.pk)
             .order_by("-created_at")
         )
 
+    def screening_history(self):
+        """
+        Return all previous screening episodes, excluding this one, prefetching
+        their appointment details as well.
+
+        This is for displaying the full history. To look up the last screening,
+        use `previous`, `previous_screening_date` or `previous_summary` instead.
+        """
+        return self._other_episodes().prefetch_related(
+            "appointment_set__clinic_slot__clinic__setting__provider"
+        )
+
     def previous(self) -> "ScreeningEpisode | None":
         """
         Return the last known screening episode
         """
-        try:
-            return self.screening_history()[0]
-        except IndexError:
-            return None
+        return self._other_episodes().first()
+
+    def previous_screening_date(self) -> datetime | None:
+        """
+        When the last known screening episode was created, fetched without
+        loading the episode or its appointments.
+        """
+        return self._other_episodes().values_list("created_at", flat=True).first()
+
+    def previous_summary(self) -> dict | None:
+        """
+        The date of the last known screening episode, plus the location and
+        type of the clinic of its latest appointment that wasn't cancelled, if
+        any, in a single query.
+        """
+        appointment = (
+            Appointment.objects.filter(screening_episode=OuterRef("pk"))
+            .exclude(status=Appointment.Status.CANCELLED)
+            .order_by("-clinic_slot__starts_at")
+        )
+
+        return (
+            self._other_episodes()
+            .values(
+                "created_at",
+                location=Subquery(
+                    appointment.values("clinic_slot__clinic__setting__name")[:1]
+                ),
+                clinic_type=Subquery(
+                    appointment.values("clinic_slot__clinic__type")[:1]
+                ),
+            )
+            .first()
+        )
+
+
+class AppointmentQuerySet(models.QuerySet):
+    def with_previous_screening_date(self):
+        """
+        Annotate each appointment with `previous_screening_at`, the creation
+        date of the participant's most recent other screening episode: the
+        equivalent of ScreeningEpisode.previous_screening_date() for the
+        appointment's episode.
+        """
+        return self.annotate(
+            previous_screening_at=previous_screening_date_subquery("screening_episode")
+        )
 
 
 class Appointment(BaseModel):
@@ -144,3 +370,12 @@ class Appointment(BaseModel):
     )
     reinvite = models.BooleanField(default=False)
     stopped_reasons = models.JSONField(null=True, blank=True)
+
+    objects = AppointmentQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["clinic_slot", "status"], name="appointment_slot_status_idx"
+            ),
+        ]
@@ -1,12 +1,25 @@
 from datetime import date
+from itertools import count
 
-from factory.declarations import SubFactory
+from factory.declarations import Iterator, SubFactory
 from factory.django import DjangoModelFactory
 from factory.fuzzy import FuzzyChoice
 
 from manage_breast_screening.clinics.tests.factories import ClinicSlotFactory
 
 from .. import models
+from ..validators import nhs_number_check_digit
+
+
+def nhs_numbers():
+    """
+    Valid NHS numbers in the 999 range, which is never issued to real people
+    """
+    for n in count():
+        digits = f"999{n:06d}"
+        check_digit = nhs_number_check_digit(digits)
+        if check_digit is not None:
+            yield f"{digits}{check_digit}"
 
 
 class ParticipantFactory(DjangoModelFactory):
@@ -16,7 +29,7 @@ class ParticipantFactory(DjangoModelFactory):
     first_name = "Janet"
     last_name = "Williams"
     gender = "Female"
-    nhs_number = "07700900829"
+    nhs_number = Iterator(nhs_numbers())
     phone = "07700900829"
     email = "janet.williams@example.com"
     date_of_birth = date(1959, 7, 22)
@@ -0,0 +1,34 @@
+import pytest
+from django.urls import reverse
+
+from .factories import ParticipantFactory
+
+
+@pytest.mark.django_db
+class TestParticipantAdmin:
+    @pytest.fixture
+    def participants(self):
+        return [
+            ParticipantFactory.create(first_name="Jane", last_name="Wilson"),
+            ParticipantFactory.create(first_name="Janet", last_name="Williams"),
+        ]
+
+    def results(self, admin_client, **params):
+        response = admin_client.get(
+            reverse("admin:participants_participant_changelist"), params
+        )
+        assert response.status_code == 200
+
+        return list(response.context["cl"].result_list)
+
+    def test_search_results_are_best_match_first(self, admin_client, participants):
+        jane, janet = participants
+
+        assert self.results(admin_client, q="williams") == [janet]
+        assert self.results(admin_client, q="jane wil") == [jane, janet]
+
+    def test_search_results_can_be_sorted_by_a_column(self, admin_client, participants):
+        jane, janet = participants
+
+        # Column 2 is the NHS number
+        assert self.results(admin_client, q="jane wil", o="-2") == [janet, jane]
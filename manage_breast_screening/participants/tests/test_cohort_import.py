@@ -0,0 +1,118 @@
+import json
+from datetime import date
+from io import StringIO
+
+import pytest
+from django.core.exceptions import ValidationError
+from django.core.management import call_command
+
+from ..cohort_import import CohortImporter, CohortRow, read_records
+from ..models import Participant
+from .factories import ParticipantAddressFactory, ParticipantFactory
+
+ROW = {
+    "nhs_number": "999 079 8516",
+    "first_name": "Janet",
+    "last_name": "Williams",
+    "date_of_birth": "1959-07-22",
+    "email": "Janet.Williams@example.com",
+    "ethnic_group": "irish",
+    "address_line_1": "123 Generic Street",
+    "address_line_2": "Townsville",
+    "postcode": "bn122hl",
+}
+
+
+def csv_file(*rows):
+    header = ",".join(ROW)
+    lines = [",".join(row.get(key, "") for key in ROW) for row in rows]
+    return StringIO("\n".join([header, *lines]) + "\n")
+
+
+class TestCohortRow:
+    def test_normalises_values(self):
+        row = CohortRow.from_record(ROW)
+
+        assert row.nhs_number == "9990798516"
+        assert row.date_of_birth == date(1959, 7, 22)
+        assert row.email == "janet.williams@example.com"
+        assert row.ethnic_group == "Irish"
+        assert row.risk_level == "Routine"
+        assert row.address_lines == ["123 Generic Street", "Townsville"]
+        assert row.postcode == "BN12 2HL"
+
+    def test_reports_every_invalid_field(self):
+        record = {
+            **ROW,
+            "nhs_number": "9990798517",
+            "last_name": "",
+            "date_of_birth": "22/07/1959",
+            "ethnic_group": "Martian",
+            "postcode": "not a postcode",
+        }
+
+        with pytest.raises(ValidationError) as e:
+            CohortRow.from_record(record)
+
+        assert set(e.value.message_dict) == {
+            "nhs_number",
+            "last_name",
+            "date_of_birth",
+            "ethnic_group",
+            "postcode",
+        }
+
+
+def test_read_records_from_json_lines():
+    file = StringIO(json.dumps(ROW) + "\n\nnot json\n")
+
+    assert list(read_records(file, "jsonl")) == [(1, ROW), (3, None)]
+
+
+@pytest.mark.django_db
+class TestCohortImporter:
+    def test_inserts_new_participants(self):
+        result = CohortImporter().run(read_records(csv_file(ROW), "csv"))
+
+        assert (result.read, result.inserted, result.updated) == (1, 1, 0)
+        participant = Participant.objects.get(nhs_number="9990798516")
+        assert participant.full_name == "Janet Williams"
+        assert participant.extra_needs == []
+        assert participant.address.postcode == "BN12 2HL"
+
+    def test_updates_existing_participants(self):
+        participant = ParticipantFactory.create(
+            nhs_number="9990798516", first_name="Jan", extra_needs=["Wheelchair user"]
+        )
+        ParticipantAddressFactory.create(participant=participant, postcode="SW1A 1AA")
+
+        result = CohortImporter().run(read_records(csv_file(ROW), "csv"))
+
+        assert (result.inserted, result.updated) == (0, 1)
+        participant.refresh_from_db()
+        assert participant.first_name == "Janet"
+        assert participant.extra_needs == ["Wheelchair user"]
+        assert participant.address.postcode == "BN12 2HL"
+
+    def test_rejects_invalid_and_duplicate_rows(self):
+        file = csv_file(ROW, {**ROW, "nhs_number": "123"}, ROW)
+
+        result = CohortImporter().run(read_records(file, "csv"))
+
+        assert result.inserted == 1
+        assert [(row.line, row.errors) for row in result.rejected] == [
+            (3, ["nhs_number: NHS number must be 10 digits"]),
+            (4, ["nhs_number: Duplicate NHS number"]),
+        ]
+
+
+@pytest.mark.django_db
+def test_import_cohort_command(tmp_path):
+    path = tmp_path / "cohort.csv"
+    path.write_text(csv_file(ROW, {**ROW, "first_name": ""}).getvalue())
+    stdout, stderr = StringIO(), StringIO()
+
+    call_command("import_cohort", path, stdout=stdout, stderr=stderr)
+
+    assert "1 inserted, 0 updated, 1 rejected" in stdout.getvalue()
+    assert "Line 3: first_name: This field is required" in stderr.getvalue()
@@ -1,6 +1,19 @@
+from datetime import date, datetime, timedelta, timezone
+from os.path import commonprefix
+
 import pytest
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError
+
+from manage_breast_screening.clinics.tests.factories import ClinicSlotFactory
 
-from .factories import ParticipantFactory, ScreeningEpisodeFactory
+from ..models import Appointment, Participant, ScreeningEpisode
+from .factories import (
+    AppointmentFactory,
+    ParticipantAddressFactory,
+    ParticipantFactory,
+    ScreeningEpisodeFactory,
+)
 
 
 class TestParticipant:
@@ -18,6 +31,142 @@ class TestParticipant:
             == category
         )
 
+    def test_nhs_number_is_validated(self):
+        participant = ParticipantFactory.build(nhs_number="999 079 8516")
+
+        with pytest.raises(ValidationError) as e:
+            participant.clean_fields()
+
+        assert e.value.message_dict["nhs_number"] == [
+            "Enter the NHS number as 10 digits without spaces"
+        ]
+
+
+@pytest.mark.django_db
+class TestParticipantNHSNumber:
+    def test_must_be_unique(self):
+        participant = ParticipantFactory.create()
+
+        with pytest.raises(IntegrityError):
+            ParticipantFactory.create(nhs_number=participant.nhs_number)
+
+    def test_must_be_normalised(self):
+        with pytest.raises(IntegrityError):
+            ParticipantFactory.create(nhs_number="999 079 8516")
+
+
+@pytest.mark.django_db
+class TestParticipantWithAppointmentOn:
+    DAY = date(2025, 1, 1)
+
+    def slot(self, hour, day=DAY):
+        return ClinicSlotFactory.create(
+            starts_at=datetime.combine(day, datetime.min.time(), timezone.utc)
+            + timedelta(hours=hour)
+        )
+
+    def test_first_appointment_on_the_day(self, django_assert_num_queries):
+        episode = ScreeningEpisodeFactory.create()
+        AppointmentFactory.create(
+            screening_episode=episode,
+            clinic_slot=self.slot(9),
+            status=Appointment.Status.CANCELLED,
+        )
+        appointment = AppointmentFactory.create(
+            screening_episode=episode, clinic_slot=self.slot(11)
+        )
+        AppointmentFactory.create(screening_episode=episode, clinic_slot=self.slot(14))
+        AppointmentFactory.create(
+            screening_episode=episode,
+            clinic_slot=self.slot(9, self.DAY + timedelta(days=1)),
+        )
+
+        with django_assert_num_queries(1):
+            participant = Participant.objects.with_appointment_on(self.DAY).get()
+
+        assert participant.appointment["id"] == str(appointment.pk)
+        assert participant.appointment["status"] == Appointment.Status.CONFIRMED
+
+    def test_no_appointment_on_the_day(self):
+        AppointmentFactory.create(
+            clinic_slot=self.slot(9, self.DAY - timedelta(days=1))
+        )
+
+        assert (
+            Participant.objects.with_appointment_on(self.DAY).get().appointment is None
+        )
+
+
+@pytest.mark.django_db
+class TestParticipantSearch:
+    @pytest.fixture
+    def participants(self):
+        return {
+            "janet": ParticipantAddressFactory.create(
+                participant__first_name="Janet",
+                participant__last_name="Williams",
+                participant__date_of_birth=date(1959, 7, 22),
+                postcode="BN1 1AA",
+            ).participant,
+            "jane": ParticipantAddressFactory.create(
+                participant__first_name="Jane",
+                participant__last_name="Wilson",
+                participant__date_of_birth=date(1962, 3, 1),
+                postcode="BN12 4HL",
+            ).participant,
+            "dianna": ParticipantAddressFactory.create(
+                participant__first_name="Dianna",
+                participant__last_name="McIntosh",
+                participant__date_of_birth=date(1959, 7, 22),
+                postcode="RH10 1AA",
+            ).participant,
+        }
+
+    def search(self, *args, **kwargs):
+        return list(Participant.objects.search(*args, **kwargs))
+
+    def test_by_name_best_match_first(self, participants):
+        assert self.search("williams") == [participants["janet"]]
+        assert self.search("jane wil") == [participants["jane"], participants["janet"]]
+
+    def test_by_name_allows_for_typos(self, participants):
+        assert self.search("Janet Wiliams") == [participants["janet"]]
+
+    def test_by_postcode(self, participants):
+        assert self.search("bn11aa") == [participants["janet"]]
+        assert self.search("BN1") == [participants["janet"], participants["jane"]]
+
+    def test_by_nhs_number(self, participants):
+        participant = participants["dianna"]
+
+        assert self.search(participant.nhs_number) == [participant]
+
+    def test_by_the_start_of_an_nhs_number(self, participants):
+        participant = participants["dianna"]
+        mistyped = participant.nhs_number[:9] + str(
+            (int(participant.nhs_number[9]) + 1) % 10
+        )
+
+        # The leading digits every participant's NHS number shares, spaced
+        # out the way people type them
+        prefix = commonprefix([p.nhs_number for p in participants.values()])
+        spaced = f"{prefix[:3]} {prefix[3:]}".strip()
+
+        assert self.search(participant.nhs_number[:9]) == [participant]
+        assert self.search(spaced) == [
+            participants["dianna"],
+            participants["janet"],
+            participants["jane"],
+        ]
+        assert self.search(mistyped) == []
+
+    def test_by_date_of_birth(self, participants):
+        assert self.search(date_of_birth=date(1959, 7, 22)) == [
+            participants["dianna"],
+            participants["janet"],
+        ]
+        assert self.search("mcintosh", date_of_birth=date(1962, 3, 1)) == []
+
 
 @pytest.mark.django_db
 class TestScreeningEvent:
@@ -29,3 +178,107 @@ class TestScreeningEvent:
         episode = ScreeningEpisodeFactory.create()
         next_episode = ScreeningEpisodeFactory.create(participant=episode.participant)
         assert next_episode.previous() == episode
+
+    def test_previous_screening_episode_is_a_single_query(
+        self, django_assert_num_queries
+    ):
+        episode = ScreeningEpisodeFactory.create()
+        AppointmentFactory.create_batch(2, screening_episode=episode)
+        next_episode = ScreeningEpisodeFactory.create(participant=episode.participant)
+
+        with django_assert_num_queries(1):
+            assert next_episode.previous() == episode
+
+    def test_no_previous_summary(self):
+        episode = ScreeningEpisodeFactory.create()
+        assert episode.previous_summary() is None
+
+    def test_previous_summary(self):
+        appointment = AppointmentFactory.create()
+        episode = appointment.screening_episode
+        next_episode = ScreeningEpisodeFactory.create(participant=episode.participant)
+        clinic = appointment.clinic_slot.clinic
+
+        assert next_episode.previous_summary() == {
+            "created_at": episode.created_at,
+            "location": clinic.setting.name,
+            "clinic_type": clinic.type,
+        }
+
+    def test_previous_summary_uses_the_latest_appointment_that_went_ahead(self):
+        episode = ScreeningEpisodeFactory.create()
+        starts_at = datetime(2025, 1, 1, 9, tzinfo=timezone.utc)
+        earlier, later, cancelled = [
+            AppointmentFactory.create(
+                screening_episode=episode,
+                clinic_slot=ClinicSlotFactory.create(
+                    starts_at=starts_at + timedelta(days=days)
+                ),
+                status=status,
+            )
+            for days, status in [
+                (0, Appointment.Status.DID_NOT_ATTEND),
+                (7, Appointment.Status.SCREENED),
+                (14, Appointment.Status.CANCELLED),
+            ]
+        ]
+        next_episode = ScreeningEpisodeFactory.create(participant=episode.participant)
+
+        assert next_episode.previous_summary()["location"] == (
+            later.clinic_slot.clinic.setting.name
+        )
+
+    def test_previous_summary_without_an_appointment(self):
+        episode = ScreeningEpisodeFactory.create()
+        next_episode = ScreeningEpisodeFactory.create(participant=episode.participant)
+
+        assert next_episode.previous_summary() == {
+            "created_at": episode.created_at,
+            "location": None,
+            "clinic_type": None,
+        }
+
+    def test_no_previous_screening_date(self):
+        episode = ScreeningEpisodeFactory.create()
+        assert episode.previous_screening_date() is None
+
+    def test_previous_screening_date(self):
+        episode = ScreeningEpisodeFactory.create()
+        next_episode = ScreeningEpisodeFactory.create(participant=episode.participant)
+        assert next_episode.previous_screening_date() == episode.created_at
+
+
+@pytest.mark.django_db
+class TestPreviousScreeningDateAnnotation:
+    @pytest.fixture
+    def episodes(self):
+        first = ScreeningEpisodeFactory.create()
+        second = ScreeningEpisodeFactory.create(participant=first.participant)
+        other_participant = ScreeningEpisodeFactory.create(
+            participant=ParticipantFactory.create()
+        )
+        return first, second, other_participant
+
+    def test_episodes(self, episodes, django_assert_num_queries):
+        first, second, other_participant = episodes
+
+        with django_assert_num_queries(1):
+            annotated = (
+                ScreeningEpisode.objects.with_previous_screening_date().in_bulk()
+            )
+
+        assert annotated[second.pk].previous_screening_at == first.created_at
+        assert annotated[other_participant.pk].previous_screening_at is None
+
+    def test_appointments(self, episodes, django_assert_num_queries):
+        first, second, other_participant = episodes
+        appointments = [
+            AppointmentFactory.create(screening_episode=episode)
+            for episode in [second, other_participant]
+        ]
+
+        with django_assert_num_queries(1):
+            annotated = Appointment.objects.with_previous_screening_date().in_bulk()
+
+        assert annotated[appointments[0].pk].previous_screening_at == first.created_at
+        assert annotated[appointments[1].pk].previous_screening_at is None
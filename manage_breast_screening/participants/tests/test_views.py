@@ -0,0 +1,111 @@
+from datetime import date, datetime, timezone
+
+import pytest
+from django.urls import reverse
+
+from manage_breast_screening.clinics.tests.factories import ClinicSlotFactory
+
+from .factories import (
+    AppointmentFactory,
+    ParticipantAddressFactory,
+    ParticipantFactory,
+)
+
+
+@pytest.mark.django_db
+class TestLookup:
+    @pytest.fixture(autouse=True)
+    def before_clinic(self, time_machine):
+        time_machine.move_to(datetime(2025, 1, 1, 8, tzinfo=timezone.utc))
+
+    def lookup(self, client, nhs_number):
+        return client.get(reverse("participants:lookup"), {"nhs_number": nhs_number})
+
+    def test_finds_the_participant_and_todays_appointment(
+        self, client, django_assert_num_queries
+    ):
+        appointment = AppointmentFactory.create(
+            clinic_slot=ClinicSlotFactory.create(
+                starts_at=datetime(2025, 1, 1, 10, tzinfo=timezone.utc)
+            ),
+            screening_episode__participant__nhs_number="9990798516",
+        )
+
+        with django_assert_num_queries(1):
+            response = self.lookup(client, "999 079 8516")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["participant"]["nhs_number"] == "9990798516"
+        assert data["appointment"]["id"] == str(appointment.pk)
+        assert data["appointment"]["url"] == reverse(
+            "mammograms:start_screening", kwargs={"id": appointment.pk}
+        )
+
+    def test_participant_without_an_appointment_today(self, client):
+        participant = ParticipantFactory.create()
+
+        response = self.lookup(client, participant.nhs_number)
+
+        assert response.status_code == 200
+        assert response.json()["appointment"] is None
+
+    def test_invalid_nhs_number(self, client):
+        response = self.lookup(client, "9990798517")
+
+        assert response.status_code == 400
+        assert response.json() == {"errors": ["Enter a valid NHS number"]}
+
+    def test_unknown_nhs_number(self, client):
+        response = self.lookup(client, "9990798516")
+
+        assert response.status_code == 404
+
+
+@pytest.mark.django_db
+class TestSearch:
+    def search(self, client, **params):
+        return client.get(reverse("participants:search"), params)
+
+    def test_returns_the_best_matches(self, client, django_assert_num_queries):
+        address = ParticipantAddressFactory.create(
+            participant__first_name="Janet",
+            participant__last_name="Williams",
+            postcode="BN1 1AA",
+        )
+        ParticipantFactory.create(first_name="Dianna", last_name="McIntosh")
+
+        with django_assert_num_queries(1):
+            response = self.search(client, q="janet")
+
+        assert response.json() == {
+            "results": [
+                {
+                    "id": str(address.participant.pk),
+                    "nhs_number": address.participant.nhs_number,
+                    "full_name": "Janet Williams",
+                    "date_of_birth": "1959-07-22",
+                    "postcode": "BN1 1AA",
+                }
+            ]
+        }
+
+    def test_filters_by_date_of_birth(self, client):
+        participant = ParticipantFactory.create(date_of_birth=date(1960, 1, 2))
+        ParticipantFactory.create(date_of_birth=date(1960, 1, 3))
+
+        response = self.search(client, date_of_birth="1960-01-02")
+
+        assert [result["id"] for result in response.json()["results"]] == [
+            str(participant.pk)
+        ]
+
+    def test_needs_more_than_one_character(self, client):
+        ParticipantFactory.create(first_name="Janet")
+
+        assert self.search(client, q="j").json() == {"results": []}
+
+    def test_invalid_date_of_birth(self, client):
+        response = self.search(client, q="janet", date_of_birth="22/07/1959")
+
+        assert response.status_code == 400
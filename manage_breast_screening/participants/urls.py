@@ -0,0 +1,10 @@
+from django.urls import path
+
+from . import views
+
+app_name = "participants"
+
+urlpatterns = [
+    path("lookup/", views.lookup, name="lookup"),
+    path("search/", views.search, name="search"),
+]
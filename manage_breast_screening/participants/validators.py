@@ -0,0 +1,76 @@
+import re
+
+from django.core.exceptions import ValidationError
+
+NON_DIGITS = re.compile(r"[\s-]")
+POSTCODE = re.compile(r"^([A-Z]{1,2}[0-9][A-Z0-9]?) ?([0-9][A-Z]{2})$")
+
+
+def nhs_number_check_digit(digits: str) -> int | None:
+    """
+    The check digit for the first nine digits of an NHS number (modulus 11),
+    or None if no NHS number starts with those digits.
+
+    >>> nhs_number_check_digit("999079851")
+    6
+    >>> nhs_number_check_digit("999000000") is None
+    True
+    """
+    total = sum(int(digit) * (10 - i) for i, digit in enumerate(digits))
+    check_digit = 11 - total % 11
+    if check_digit == 11:
+        return 0
+    if check_digit == 10:
+        return None
+    return check_digit
+
+
+def normalise_nhs_number(value: str) -> str:
+    """
+    Strip the spaces and dashes from an NHS number, and check it's valid
+
+    >>> normalise_nhs_number("999 079 8516")
+    '9990798516'
+    >>> normalise_nhs_number("9990798517")
+    Traceback (most recent call last):
+    ...
+    django.core.exceptions.ValidationError: ['Enter a valid NHS number']
+    """
+    digits = NON_DIGITS.sub("", value or "")
+    if not (len(digits) == 10 and digits.isdigit()):
+        raise ValidationError("NHS number must be 10 digits", code="invalid")
+
+    if nhs_number_check_digit(digits[:9]) != int(digits[9]):
+        raise ValidationError("Enter a valid NHS number", code="invalid")
+
+    return digits
+
+
+def validate_nhs_number(value: str):
+    """
+    Check an NHS number is valid and already normalised
+
+    >>> validate_nhs_number("9990798516")
+    >>> validate_nhs_number("999 079 8516")
+    Traceback (most recent call last):
+    ...
+    django.core.exceptions.ValidationError: ['Enter the NHS number as 10 digits without spaces']
+    """
+    if normalise_nhs_number(value) != value:
+        raise ValidationError(
+            "Enter the NHS number as 10 digits without spaces", code="invalid"
+        )
+
+
+def normalise_postcode(value: str) -> str:
+    """
+    Format a UK postcode in capitals, with a space before the inward code
+
+    >>> normalise_postcode(" bn122hl")
+    'BN12 2HL'
+    """
+    match = POSTCODE.match(re.sub(r"\s+", " ", (value or "").strip().upper()))
+    if not match:
+        raise ValidationError("Enter a valid postcode", code="invalid")
+
+    return " ".join(match.groups())
@@ -0,0 +1,114 @@
+from datetime import date
+
+from django.core.exceptions import ValidationError
+from django.http import JsonResponse
+from django.urls import reverse
+from django.views.decorators.http import require_GET
+
+from ..core.utils import clock, timing
+from .models import Participant
+from .validators import normalise_nhs_number
+
+SEARCH_RESULTS_LIMIT = 10
+
+# Shorter text matches too much to be useful
+SEARCH_MIN_LENGTH = 2
+
+
+@require_GET
+def lookup(request):
+    """
+    Find a participant by NHS number, typed in or scanned from a barcode,
+    along with their appointment today if they have one.
+    """
+    try:
+        nhs_number = normalise_nhs_number(request.GET.get("nhs_number", ""))
+    except ValidationError as e:
+        return JsonResponse({"errors": e.messages}, status=400)
+
+    with timing.phase("query"):
+        participant = (
+            Participant.objects.filter(nhs_number=nhs_number)
+            .with_appointment_on(clock.today())
+            .only("nhs_number", "first_name", "last_name", "date_of_birth")
+            .first()
+        )
+
+    if participant is None:
+        return JsonResponse(
+            {"errors": ["No participant with that NHS number"]}, status=404
+        )
+
+    appointment = participant.appointment
+    if appointment:
+        appointment["url"] = reverse(
+            "mammograms:start_screening", kwargs={"id": appointment["id"]}
+        )
+
+    return JsonResponse(
+        {
+            "participant": {
+                "id": participant.pk,
+                "nhs_number": participant.nhs_number,
+                "full_name": participant.full_name,
+                "date_of_birth": participant.date_of_birth,
+            },
+            "appointment": appointment,
+        }
+    )
+
+
+@require_GET
+def search(request):
+    """
+    Typeahead search for participants by name, postcode or NHS number, and
+    optionally date of birth, best matches first
+    """
+    text = request.GET.get("q", "").strip()
+    try:
+        date_of_birth = date.fromisoformat(request.GET["date_of_birth"])
+    except KeyError:
+        date_of_birth = None
+    except ValueError:
+        return JsonResponse(
+            {"errors": ["Enter a date of birth in the format YYYY-MM-DD"]},
+            status=400,
+        )
+
+    if len(text) < SEARCH_MIN_LENGTH and date_of_birth is None:
+        return JsonResponse({"results": []})
+
+    with timing.phase("query"):
+        participants = list(
+            Participant.objects.search(text, date_of_birth)
+            .select_related("address")
+            .only(
+                "nhs_number",
+                "first_name",
+                "last_name",
+                "date_of_birth",
+                "address__postcode",
+            )[:SEARCH_RESULTS_LIMIT]
+        )
+
+    return JsonResponse(
+        {
+            "results": [
+                {
+                    "id": participant.pk,
+                    "nhs_number": participant.nhs_number,
+                    "full_name": participant.full_name,
+                    "date_of_birth": participant.date_of_birth,
+                    "postcode": postcode(participant),
+                }
+                for participant in participants
+            ]
+        }
+    )
+
+
+def postcode(participant):
+    try:
+        return participant.address.postcode
+    except Participant.address.RelatedObjectDoesNotExist:
+        return None